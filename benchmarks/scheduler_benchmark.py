@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Zamanlayici Performans Olcumu
+CPUScheduler algoritmalarini farkli boyut ve dagilimlarda olcer
+
+Her (algoritma, boyut, varis dagilimi, islem suresi dagilimi) durumu icin
+duvar saati suresi, tracemalloc tepe bellegi ve saniyede uretilen dilim
+sayisi kaydedilir. Sonuclar JSON olarak yazilir ve istenirse kayitli bir
+taban cizgisiyle karsilastirilir. Ornek:
+
+    python benchmarks/scheduler_benchmark.py -o sonuc.json --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# Python modul arama yoluna proje dizinini ekle
+project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_dir not in sys.path:
+    sys.path.insert(0, project_dir)
+
+import numpy as np
+
+from cpu_scheduler.comparison import comparison_suite
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.workloads import Workload, generate_workload
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000, 1000000)
+DEFAULT_ARRIVALS = ('poisson', 'bursty')
+DEFAULT_BURSTS = ('exponential', 'pareto', 'bimodal')
+
+# Ortalama varislar arasi sure; tum islem suresi dagilimlarinda CPU yuku 1'e yakin
+MEAN_INTERARRIVAL = 10.0
+
+
+def benchmark_case(arrays, algorithm, params, repeat=3):
+    """
+    Bir algoritmayi ayni is yukunde olcer
+
+    Her calistirma yeni bir Workload ile yapilir; siralama hazirligi da
+    olcume dahildir. Sure, tekrarlarin en kisasidir. Tepe bellek, sureyi
+    bozmamak icin ayri bir calistirmada tracemalloc ile olculur.
+
+    Parametreler:
+    arrays (dict): Workload.as_arrays() dizileri
+    algorithm (str): Algoritma adi
+    params (dict): Algoritma parametreleri
+    repeat (int): Sure olcumu tekrar sayisi
+
+    Donus:
+    dict: wall_time (s), peak_memory (bayt), slices ve slices_per_sec
+    """
+    def fresh_scheduler():
+        return CPUScheduler.from_workload(Workload.from_arrays(arrays))
+
+    wall_time = float('inf')
+    for _ in range(repeat):
+        scheduler = fresh_scheduler()
+        start = time.perf_counter()
+        scheduler.schedule(algorithm, **params)
+        wall_time = min(wall_time, time.perf_counter() - start)
+    slices = len(scheduler.gantt_chart)
+
+    scheduler = fresh_scheduler()
+    tracemalloc.start()
+    try:
+        scheduler.schedule(algorithm, **params)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'wall_time': wall_time,
+        'peak_memory': peak_memory,
+        'slices': slices,
+        'slices_per_sec': slices / wall_time if wall_time > 0 else 0.0,
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, arrivals=DEFAULT_ARRIVALS, bursts=DEFAULT_BURSTS,
+                   algorithms=None, repeat=3, seed=0, progress=None):
+    """
+    Tum durumlari olcer
+
+    Parametreler:
+    sizes (iterable): Proses sayilari
+    arrivals (iterable): Varis dagilimlari
+    bursts (iterable): Islem suresi dagilimlari
+    algorithms (iterable): comparison_suite() etiketleri (None: hepsi)
+    repeat (int): Sure olcumu tekrar sayisi
+    seed (int): Is yuku tohumu
+    progress (callable): Her durumdan sonra sonuc sozluguyle cagrilir
+
+    Donus:
+    dict: 'meta' (ortam bilgisi) ve 'results' (durum listesi)
+    """
+    suite = [case for case in comparison_suite()
+             if algorithms is None or case[0] in algorithms]
+    results = []
+    for size in sizes:
+        for arrival in arrivals:
+            for burst in bursts:
+                arrays = generate_workload(size, arrival, burst, seed=seed, arrival_params={
+                    'mean_interarrival': MEAN_INTERARRIVAL}).as_arrays()
+                for label, algorithm, params in suite:
+                    result = {'algorithm': label, 'size': size, 'arrival': arrival, 'burst': burst}
+                    result.update(benchmark_case(arrays, algorithm, params, repeat))
+                    results.append(result)
+                    if progress is not None:
+                        progress(result)
+
+    meta = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'repeat': repeat,
+        'seed': seed,
+    }
+    return {'meta': meta, 'results': results}
+
+
+def _case_key(result):
+    return result['algorithm'], result['size'], result['arrival'], result['burst']
+
+
+def compare_with_baseline(results, baseline, tolerance=0.25, min_time=0.005):
+    """
+    Sonuclari taban cizgisiyle karsilastirir
+
+    Taban cizgisinde min_time'dan kisa suren durumlar olcum gurultusu
+    nedeniyle gerilemeden sayilmaz.
+
+    Parametreler:
+    results (dict): run_benchmarks() ciktisi
+    baseline (dict): Ayni bicimde kayitli sonuclar
+    tolerance (float): Izin verilen goreli yavaslama (0.25: %25)
+    min_time (float): Dikkate alinacak en kisa taban cizgisi suresi (s)
+
+    Donus:
+    list: Her ortak durum icin sonuc sozlugu ile 'baseline_time', 'ratio'
+        ve 'regression' alanlari
+    """
+    reference = {_case_key(result): result for result in baseline['results']}
+    comparisons = []
+    for result in results['results']:
+        base = reference.get(_case_key(result))
+        if base is None:
+            continue
+        ratio = result['wall_time'] / base['wall_time'] if base['wall_time'] > 0 else 1.0
+        comparisons.append(dict(result, baseline_time=base['wall_time'], ratio=ratio,
+                                regression=base['wall_time'] >= min_time and ratio > 1 + tolerance))
+    return comparisons
+
+
+def format_result(result):
+    """Bir durumu tek satirlik tablo satiri olarak bicimlendirir"""
+    line = "{algorithm:<10} {size:>8} {arrival:<8} {burst:<11} {wall_time:>9.4f}s {mb:>8.1f}MB {slices_per_sec:>12.0f}/s".format(
+        mb=result['peak_memory'] / 2 ** 20, **result)
+    if 'ratio' in result:
+        line += "  x{:.2f}{}".format(result['ratio'], "  GERILEME" if result['regression'] else "")
+    return line
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="CPUScheduler performans olcumu")
+    parser.add_argument('-o', '--output', help="Sonuclarin yazilacagi JSON dosyasi")
+    parser.add_argument('--baseline', help="Karsilastirilacak taban cizgisi JSON dosyasi")
+    parser.add_argument('--sizes', type=lambda text: [int(float(size)) for size in text.split(',')],
+                        default=list(DEFAULT_SIZES), help="Virgulle ayrilmis proses sayilari (1e2,1e4 ...)")
+    parser.add_argument('--arrivals', type=lambda text: text.split(','),
+                        default=list(DEFAULT_ARRIVALS), help="Varis dagilimlari")
+    parser.add_argument('--bursts', type=lambda text: text.split(','),
+                        default=list(DEFAULT_BURSTS), help="Islem suresi dagilimlari")
+    parser.add_argument('-a', '--algorithm', action='append', dest='algorithms',
+                        help="Olculecek algoritma etiketi (tekrarlanabilir)")
+    parser.add_argument('-r', '--repeat', type=int, default=3, help="Sure olcumu tekrar sayisi")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Gerileme sayilacak goreli yavaslama (varsayilan 0.25)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Olcumleri calistirir; taban cizgisine gore gerileme varsa 1 ile cikar"""
+    args = parse_args(argv)
+    results = run_benchmarks(args.sizes, args.arrivals, args.bursts, args.algorithms,
+                             args.repeat, progress=lambda result: print(format_result(result)))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding='utf-8') as handle:
+        baseline = json.load(handle)
+    comparisons = compare_with_baseline(results, baseline, args.tolerance)
+    regressions = [result for result in comparisons if result['regression']]
+    print("\nTaban cizgisi: {} ({} ortak durum)".format(args.baseline, len(comparisons)))
+    for result in comparisons:
+        print(format_result(result))
+    if regressions:
+        print("\n{} durumda gerileme".format(len(regressions)), file=sys.stderr)
+        return 1
+    print("\nGerileme yok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,487 @@
+# -*- coding: utf-8 -*-
+"""
+Komut Satiri Toplu Calistirici
+Senaryo dosyalarini GUI olmadan (PyQt5 ve matplotlib yuklemeden) calistirir
+
+CPU zamanlama, Banker's algoritmasi ve deadlock algilama senaryolari JSON
+dosyalarindan okunur; metrikler ve Gantt verileri JSON, CSV veya NPZ olarak
+yazilir. Ornek:
+
+    python cli.py senaryolar/*.json -o sonuclar -f csv --jobs 4
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Python modul arama yoluna mevcut dizini ekle
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
+
+import numpy as np
+
+from cpu_scheduler.comparison import comparison_suite
+from cpu_scheduler.metrics import SchedulingMetrics
+from cpu_scheduler.realtime import REALTIME_ALGORITHMS, PeriodicTask, RealTimeScheduler
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.smp import SMP_POLICIES, SMPScheduler
+from cpu_scheduler.traces import load_trace
+from cpu_scheduler.workloads import Workload, generate_workload
+
+OUTPUT_FORMATS = ('json', 'csv', 'npz')
+
+
+def load_scenarios(path):
+    """
+    Senaryo dosyasini okur
+
+    Dosya tek bir senaryo, senaryo listesi veya {"scenarios": [...]}
+    icerebilir. Adi verilmemis senaryolar dosya adindan adlandirilir; goreli
+    iz yollari dosyanin dizinine gore cozulur.
+
+    Parametreler:
+    path (str): JSON senaryo dosyasi
+
+    Donus:
+    list: Senaryo sozlukleri
+    """
+    with open(path, encoding='utf-8') as handle:
+        data = json.load(handle)
+    if isinstance(data, dict):
+        data = data.get('scenarios', [data])
+
+    base_name = os.path.splitext(os.path.basename(path))[0]
+    base_dir = os.path.dirname(os.path.abspath(path))
+    scenarios = []
+    for i, scenario in enumerate(data):
+        scenario = dict(scenario)
+        scenario.setdefault('name', base_name if len(data) == 1 else "{}_{}".format(base_name, i + 1))
+        scenario.setdefault('type', 'cpu')
+        if 'trace' in scenario:
+            scenario['trace'] = os.path.join(base_dir, scenario['trace'])
+        scenarios.append(scenario)
+    return scenarios
+
+
+def _scenario_workload(scenario):
+    """CPU senaryosunun is yukunu ('processes', 'trace' veya 'generate') olusturur"""
+    if 'processes' in scenario:
+        rows = scenario['processes']
+        if any(row['arrival_time'] < 0 or row['burst_time'] <= 0 for row in rows):
+            raise ValueError("Varis zamanlari negatif olamaz, islem sureleri pozitif olmali")
+        return Workload([row.get('pid', i + 1) for i, row in enumerate(rows)],
+                        [row['arrival_time'] for row in rows],
+                        [row['burst_time'] for row in rows],
+                        [row.get('priority', 0) for row in rows])
+    if 'trace' in scenario:
+        scheduler = CPUScheduler(columnar=True)
+        load_trace(scheduler, scenario['trace'])
+        return scheduler.workload
+    if 'generate' in scenario:
+        return generate_workload(**scenario['generate'])
+    raise ValueError("CPU senaryosunda 'processes', 'trace' veya 'generate' olmali")
+
+
+def _scenario_time_quantum(scenario, default=None):
+    """Senaryonun zaman dilimini dondurur; 1'den kucukse ValueError"""
+    time_quantum = scenario.get('time_quantum', default)
+    if time_quantum is not None and time_quantum < 1:
+        raise ValueError("Zaman dilimi en az 1 olmali: {}".format(time_quantum))
+    return time_quantum
+
+
+def run_cpu_scenario(scenario):
+    """
+    CPU zamanlama senaryosunu secilen algoritmalarla calistirir
+
+    Senaryo anahtarlari: 'processes' (satir listesi), 'trace' (CSV/JSONL
+    dosyasi) veya 'generate' (generate_workload() parametreleri);
+    'algorithms' (comparison_suite() etiketleri, varsayilan hepsi),
+    'time_quantum' ve baglam degistirme / onbellek isinma sureleri
+    'context_switch' ve 'cache_warmup' (varsayilan 0).
+
+    Donus:
+    dict: 'summary' (algoritma basina metrikler) ve 'tables' (Gantt dilimleri)
+    """
+    workload = _scenario_workload(scenario)
+    suite = comparison_suite(_scenario_time_quantum(scenario, 4), scenario.get('context_switch', 0),
+                             scenario.get('cache_warmup', 0))
+    selected = scenario.get('algorithms') or [label for label, _, _ in suite]
+    labels = {label.lower(): (label, algorithm, params) for label, algorithm, params in suite}
+    unknown = [name for name in selected if name.lower() not in labels]
+    if unknown:
+        raise ValueError("Bilinmeyen algoritma(lar): {}".format(", ".join(unknown)))
+
+    summary = {'process_count': len(workload), 'algorithms': {}}
+    gantt = {'algorithm': [], 'pid': [], 'start': [], 'end': []}
+    for name in selected:
+        label, algorithm, params = labels[name.lower()]
+        scheduler = CPUScheduler.from_workload(workload)
+        scheduler.schedule(algorithm, **params)
+        summary['algorithms'][label] = SchedulingMetrics(scheduler).calculate_all_metrics()
+        if scenario.get('gantt', True):
+            pids, starts, ends = scheduler.gantt_chart.as_arrays()
+            gantt['algorithm'].append(np.full(len(pids), label))
+            gantt['pid'].append(pids)
+            gantt['start'].append(starts)
+            gantt['end'].append(ends)
+
+    tables = {}
+    if gantt['pid']:
+        tables['gantt'] = {column: np.concatenate(parts) for column, parts in gantt.items()}
+    return {'summary': summary, 'tables': tables}
+
+
+def run_smp_scenario(scenario):
+    """
+    CPU is yukunu cok cekirdekli (SMP) modda secilen politikalarla calistirir
+
+    Senaryo anahtarlari: is yuku icin 'processes', 'trace' veya 'generate';
+    'cores' (varsayilan 4), 'policies' (SMP_POLICIES, varsayilan hepsi),
+    'time_quantum' (verilmezse cekirdek basina FCFS), 'context_switch' ve
+    'cache_warmup' (varsayilan 0) ve istege bagli 'affinity' ({pid: cekirdek
+    bit maskesi}).
+
+    Donus:
+    dict: 'summary' (politika basina metrikler, cekirdek kullanimi ve gocler)
+        ve 'tables' (cekirdek sutunlu Gantt dilimleri)
+    """
+    workload = _scenario_workload(scenario)
+    cores = scenario.get('cores', 4)
+    policies = scenario.get('policies') or list(SMP_POLICIES)
+    unknown = [policy for policy in policies if policy not in SMP_POLICIES]
+    if unknown:
+        raise ValueError("Bilinmeyen SMP politikasi/politikalari: {}".format(", ".join(unknown)))
+
+    summary = {'process_count': len(workload), 'cores': cores, 'policies': {}}
+    gantt = {'policy': [], 'core': [], 'pid': [], 'start': [], 'end': []}
+    for policy in policies:
+        scheduler = CPUScheduler.from_workload(workload)
+        for pid, mask in scenario.get('affinity', {}).items():
+            scheduler.set_affinity(int(pid), mask)
+        smp = SMPScheduler(scheduler, cores, policy)
+        charts = smp.schedule(_scenario_time_quantum(scenario), scenario.get('context_switch', 0),
+                              scenario.get('cache_warmup', 0))
+        summary['policies'][policy] = smp.calculate_metrics()
+        if scenario.get('gantt', True):
+            for core, chart in enumerate(charts):
+                pids, starts, ends = chart.as_arrays()
+                gantt['policy'].append(np.full(len(pids), policy))
+                gantt['core'].append(np.full(len(pids), core))
+                gantt['pid'].append(pids)
+                gantt['start'].append(starts)
+                gantt['end'].append(ends)
+
+    tables = {}
+    if gantt['pid']:
+        tables['gantt'] = {column: np.concatenate(parts) for column, parts in gantt.items()}
+    return {'summary': summary, 'tables': tables}
+
+
+def run_realtime_scenario(scenario):
+    """
+    Periyodik/sporadik gorev kumesini EDF ve/veya RMS ile zamanlar
+
+    Senaryo anahtarlari: 'tasks' ([{"id", "period", "wcet", "deadline",
+    "offset", "sporadic", "max_delay"}]; son dordu istege bagli),
+    'algorithms' (REALTIME_ALGORITHMS, varsayilan hepsi), 'horizon' ve 'seed'.
+
+    Donus:
+    dict: 'summary' (algoritma basina son tarih metrikleri ve
+        zamanlanabilirlik testi) ve 'tables' (Gantt dilimleri)
+    """
+    tasks = [PeriodicTask(row.get('id', i + 1), row['period'], row['wcet'], row.get('deadline'),
+                          row.get('offset', 0), row.get('sporadic', False), row.get('max_delay', 0))
+             for i, row in enumerate(scenario['tasks'])]
+    algorithms = scenario.get('algorithms') or list(REALTIME_ALGORITHMS)
+    unknown = [name for name in algorithms if name not in REALTIME_ALGORITHMS]
+    if unknown:
+        raise ValueError("Bilinmeyen algoritma(lar): {}".format(", ".join(unknown)))
+
+    summary = {'task_count': len(tasks), 'algorithms': {}}
+    gantt = {'algorithm': [], 'task': [], 'start': [], 'end': []}
+    for algorithm in algorithms:
+        scheduler = RealTimeScheduler(tasks)
+        scheduler.schedule(algorithm, scenario.get('horizon'), scenario.get('seed'))
+        summary['algorithms'][algorithm] = scheduler.calculate_metrics()
+        if scenario.get('gantt', True):
+            task_ids, starts, ends = scheduler.gantt_chart.as_arrays()
+            gantt['algorithm'].append(np.full(len(task_ids), algorithm))
+            gantt['task'].append(task_ids)
+            gantt['start'].append(starts)
+            gantt['end'].append(ends)
+
+    tables = {}
+    if gantt['task']:
+        tables['gantt'] = {column: np.concatenate(parts) for column, parts in gantt.items()}
+    return {'summary': summary, 'tables': tables}
+
+
+def run_bankers_scenario(scenario):
+    """
+    Banker's algoritmasi senaryosunu calistirir
+
+    Senaryo anahtarlari: 'processes', 'resources', 'available', 'max_claim'
+    (matris), istege bagli 'allocation' (matris) ve sirayla degerlendirilecek
+    'requests' ([{"process": indeks, "request": [...]}]).
+
+    Donus:
+    dict: 'summary' (guvenlik durumu, talep sonuclari ve son matrisler)
+    """
+    from deadlock_manager.bankers import BankersAlgorithm
+
+    bankers = BankersAlgorithm()
+    bankers.setup(scenario['processes'], scenario['resources'], scenario['available'])
+    for i, claims in enumerate(scenario['max_claim']):
+        bankers.set_max_claim(i, claims)
+    for i, allocation in enumerate(scenario.get('allocation', [])):
+        if not bankers.allocate_resources(i, allocation):
+            raise ValueError("Baslangic tahsisi yapilamadi: proses dizini {}".format(i))
+
+    is_safe, safe_sequence = bankers.is_safe_state()
+    requests = []
+    for request in scenario.get('requests', []):
+        granted, message = bankers.request_resources(request['process'], request['request'])
+        requests.append({'process': request['process'], 'request': request['request'],
+                         'granted': granted, 'message': message})
+    final_safe, final_sequence = bankers.is_safe_state()
+
+    summary = {
+        'initial_safe': is_safe,
+        'initial_safe_sequence': safe_sequence,
+        'requests': requests,
+        'safe': final_safe,
+        'safe_sequence': final_sequence,
+        'available': bankers.available.tolist(),
+        'allocation': bankers.allocation.tolist(),
+        'need': bankers.need.tolist(),
+    }
+    return {'summary': summary, 'tables': {}}
+
+
+def run_deadlock_scenario(scenario):
+    """
+    Kaynak tahsis grafi senaryosunda deadlock arar
+
+    Senaryo anahtarlari: 'processes' (ID listesi), 'resources'
+    ([{"id": ..., "instances": ...}] veya ID listesi), 'allocations' ve
+    'requests' ([proses, kaynak, adet] uclulerinin listesi).
+
+    Donus:
+    dict: 'summary' (deadlock var mi, dongu ve basarisiz tahsisler)
+    """
+    from deadlock_manager.detector import DeadlockDetector
+
+    detector = DeadlockDetector()
+    for resource in scenario.get('resources', []):
+        if isinstance(resource, dict):
+            detector.add_resource(resource['id'], resource.get('instances', 1))
+        else:
+            detector.add_resource(resource)
+    for process in scenario.get('processes', []):
+        detector.add_process(process)
+
+    failed = []
+    for allocation in scenario.get('allocations', []):
+        if not detector.allocate_resource(*allocation):
+            failed.append(allocation)
+    for request in scenario.get('requests', []):
+        detector.request_resource(*request)
+
+    cycle = detector.detect_deadlock()
+    summary = {'deadlock': bool(cycle), 'cycle': cycle, 'failed_allocations': failed}
+    return {'summary': summary, 'tables': {}}
+
+
+SCENARIO_RUNNERS = {
+    'cpu': run_cpu_scenario,
+    'smp': run_smp_scenario,
+    'realtime': run_realtime_scenario,
+    'bankers': run_bankers_scenario,
+    'deadlock': run_deadlock_scenario,
+}
+
+
+def run_scenario(scenario):
+    """
+    Senaryoyu turune gore calistirir
+
+    Donus:
+    dict: 'name', 'type', 'summary' ve 'tables'
+    """
+    runner = SCENARIO_RUNNERS.get(scenario.get('type', 'cpu'))
+    if runner is None:
+        raise ValueError("Bilinmeyen senaryo turu: {}".format(scenario.get('type')))
+    result = runner(scenario)
+    result.update(name=scenario['name'], type=scenario.get('type', 'cpu'))
+    return result
+
+
+def _json_default(value):
+    """numpy skalerlerini ve dizilerini JSON'a cevirir"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError("JSON'a cevrilemeyen deger: {!r}".format(value))
+
+
+def _flatten(summary, prefix=''):
+    """Ic ice ozet sozlugunu (anahtar, deger) satirlarina acar"""
+    for key, value in summary.items():
+        name = prefix + str(key)
+        if isinstance(value, dict):
+            yield from _flatten(value, name + '.')
+        else:
+            yield name, value if not isinstance(value, (list, tuple)) else json.dumps(value, ensure_ascii=False, default=_json_default)
+
+
+def write_result(result, output_dir, output_format):
+    """
+    Senaryo sonucunu istenen bicimde yazar
+
+    json: <ad>.json (ozet ve tablolar). csv: <ad>_summary.csv (anahtar,
+    deger) ve her tablo icin <ad>_<tablo>.csv. npz: <ad>.npz (tablo
+    sutunlari '<tablo>.<sutun>' adiyla, ozet 'summary' icinde JSON olarak).
+
+    Donus:
+    list: Yazilan dosya yollari
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, result['name'])
+    header = {'name': result['name'], 'type': result['type']}
+
+    if output_format == 'json':
+        path = base + '.json'
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(dict(header, summary=result['summary'], tables=result['tables']),
+                      handle, ensure_ascii=False, indent=2, default=_json_default)
+        return [path]
+
+    if output_format == 'csv':
+        paths = [base + '_summary.csv']
+        with open(paths[0], 'w', encoding='utf-8', newline='') as handle:
+            writer = csv.writer(handle)
+            writer.writerow(('key', 'value'))
+            writer.writerows(_flatten(dict(header, **result['summary'])))
+        for table_name, columns in result['tables'].items():
+            paths.append('{}_{}.csv'.format(base, table_name))
+            with open(paths[-1], 'w', encoding='utf-8', newline='') as handle:
+                writer = csv.writer(handle)
+                writer.writerow(columns.keys())
+                writer.writerows(zip(*(column.tolist() for column in columns.values())))
+        return paths
+
+    if output_format == 'npz':
+        path = base + '.npz'
+        arrays = {'{}.{}'.format(table_name, column): values
+                  for table_name, columns in result['tables'].items()
+                  for column, values in columns.items()}
+        arrays['summary'] = np.array(json.dumps(dict(header, **result['summary']),
+                                                default=_json_default))
+        np.savez_compressed(path, **arrays)
+        return [path]
+
+    raise ValueError("Bilinmeyen cikti bicimi: {}".format(output_format))
+
+
+def process_scenario(scenario, output_dir, output_format):
+    """Senaryoyu calistirip sonucunu yazar (isci proseslerde de kullanilir)"""
+    return write_result(run_scenario(scenario), output_dir, output_format)
+
+
+def _positive_int(text):
+    """argparse tipi: 1 veya daha buyuk tamsayi"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("en az 1 olmali: {}".format(text))
+    return value
+
+
+def _non_negative_int(text):
+    """argparse tipi: 0 veya daha buyuk tamsayi"""
+    value = int(text)
+    if value < 0:
+        raise argparse.ArgumentTypeError("negatif olamaz: {}".format(text))
+    return value
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="CPU zamanlama, Banker's ve deadlock senaryolarini GUI olmadan calistirir")
+    parser.add_argument('scenarios', nargs='+', help="JSON senaryo dosyalari")
+    parser.add_argument('-o', '--output-dir', default='results', help="Cikti dizini")
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default='json',
+                        help="Cikti bicimi")
+    parser.add_argument('-j', '--jobs', type=_non_negative_int, default=1,
+                        help="Senaryolari calistiracak proses sayisi (0: cekirdek sayisi)")
+    parser.add_argument('-a', '--algorithm', action='append', dest='algorithms',
+                        help="CPU senaryolarinda calistirilacak algoritma (tekrarlanabilir; "
+                             "{})".format(", ".join(label for label, _, _ in comparison_suite())))
+    parser.add_argument('-q', '--time-quantum', type=_positive_int,
+                        help="Round Robin zaman dilimi (senaryodakini gecersiz kilar)")
+    parser.add_argument('--context-switch', type=int,
+                        help="Baglam degistirme suresi (senaryodakini gecersiz kilar)")
+    parser.add_argument('--cache-warmup', type=int,
+                        help="Kesilen proses devam ederken onbellek isinma suresi "
+                             "(senaryodakini gecersiz kilar)")
+    parser.add_argument('--no-gantt', action='store_true', help="Gantt dilimlerini yazma")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Komut satiri giris noktasi; hata olursa 1 ile cikar"""
+    args = parse_args(argv)
+
+    scenarios = []
+    for path in args.scenarios:
+        scenarios.extend(load_scenarios(path))
+    for scenario in scenarios:
+        if scenario['type'] not in ('cpu', 'smp'):
+            continue
+        if args.algorithms and scenario['type'] == 'cpu':
+            scenario['algorithms'] = args.algorithms
+        if args.time_quantum is not None:
+            scenario['time_quantum'] = args.time_quantum
+        if args.context_switch is not None:
+            scenario['context_switch'] = args.context_switch
+        if args.cache_warmup is not None:
+            scenario['cache_warmup'] = args.cache_warmup
+        if args.no_gantt:
+            scenario['gantt'] = False
+
+    names = [scenario['name'] for scenario in scenarios]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        print("Hata: ayni adli senaryolar: {}".format(", ".join(duplicates)), file=sys.stderr)
+        return 1
+
+    failures = 0
+    if args.jobs == 1 or len(scenarios) == 1:
+        for scenario in scenarios:
+            try:
+                paths = process_scenario(scenario, args.output_dir, args.format)
+                print("{}: {}".format(scenario['name'], ", ".join(paths)))
+            except Exception as e:
+                failures += 1
+                print("{}: HATA: {}".format(scenario['name'], e), file=sys.stderr)
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs or None) as executor:
+            futures = {executor.submit(process_scenario, scenario, args.output_dir, args.format):
+                       scenario['name'] for scenario in scenarios}
+            for future in as_completed(futures):
+                try:
+                    print("{}: {}".format(futures[future], ", ".join(future.result())))
+                except Exception as e:
+                    failures += 1
+                    print("{}: HATA: {}".format(futures[future], e), file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
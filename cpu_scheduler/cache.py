@@ -0,0 +1,217 @@
+"""
+Zamanlama Sonuç Önbelleği
+Bu modül, aynı iş yükü ve parametrelerle tekrarlanan zamanlamaların sonuçlarını önbelleğe alır.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from cpu_scheduler.metrics import SchedulingMetrics
+
+# Disk önbelleği dizininin uygulamaya özgü alt klasörü
+CACHE_DIR_NAME = "os-simulator"
+
+# Girdi biçimi (ör. metrik anahtarları) değiştiğinde artırılır; eski girdiler kullanılmaz
+CACHE_FORMAT = 3
+
+
+def default_cache_dir():
+    """
+    Platforma uygun kullanıcı önbellek dizinini döndürür
+
+    Dönüş:
+    str: Windows'ta %LOCALAPPDATA%, macOS'ta ~/Library/Caches, diğerlerinde
+        $XDG_CACHE_HOME veya ~/.cache altındaki uygulama dizini
+    """
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.expanduser('~')
+    elif sys.platform == 'darwin':
+        base = os.path.expanduser('~/Library/Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(base, CACHE_DIR_NAME, 'schedules')
+
+
+def cache_key(workload, algorithm, params):
+    """
+    İş yükü özeti, algoritma ve parametrelerden önbellek anahtarı üretir
+
+    Parametreler:
+    workload (Workload): İş yükü
+    algorithm (str): Algoritma adı
+    params (dict): Algoritma parametreleri (time_quantum, preemptive ...)
+
+    Dönüş:
+    str: Onaltılık SHA-256 anahtarı
+    """
+    description = json.dumps([CACHE_FORMAT, workload.fingerprint, algorithm, params], sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+def _entry_nbytes(entry):
+    """Bir önbellek girdisinin yaklaşık bellek boyutu"""
+    return sum(value.nbytes for value in entry.values() if isinstance(value, np.ndarray))
+
+
+def schedule_entry(scheduler, algorithm, params):
+    """
+    Zamanlayıcıda algoritmayı çalıştırır ve önbelleğe alınabilir sonucu döndürür
+
+    Dönüş:
+    dict: CPUScheduler.snapshot() dizileri ve 'metrics' sözlüğü
+    """
+    scheduler.schedule(algorithm, **params)
+    entry = scheduler.snapshot()
+    entry['metrics'] = SchedulingMetrics(scheduler).calculate_all_metrics()
+    return entry
+
+
+class ScheduleCache:
+    """
+    İçerik adresli zamanlama sonuç önbelleği
+
+    Bellekte boyutu sınırlı bir LRU katmanı ve isteğe bağlı olarak kullanıcı
+    önbellek dizininde .npz dosyalarından oluşan bir disk katmanı tutar.
+    Girdiler CPUScheduler.snapshot() çıktısı ile metrik sözlüğüdür.
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, disk_dir=None):
+        """
+        Parametreler:
+        max_bytes (int): Bellek katmanının üst sınırı (bayt)
+        disk_dir (str): Disk katmanı dizini (None: disk katmanı kapalı,
+            True: default_cache_dir())
+        """
+        self.max_bytes = max_bytes
+        self.disk_dir = default_cache_dir() if disk_dir is True else disk_dir
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # GUI'de karşılaştırma iş parçacığı ile ana iş parçacığı paylaşır
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries or (self.disk_dir is not None
+                                         and os.path.exists(self._disk_path(key)))
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key + '.npz')
+
+    def get(self, key):
+        """
+        Anahtara karşılık gelen girdiyi döndürür
+
+        Dönüş:
+        dict veya None: Önbellekte yoksa None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+            entry = self._load_from_disk(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key, entry):
+        """
+        Girdiyi bellek katmanına (ve açıksa disk katmanına) ekler
+
+        Parametreler:
+        key (str): cache_key() ile üretilmiş anahtar
+        entry (dict): snapshot() dizileri ve 'metrics' sözlüğü
+        """
+        with self._lock:
+            self._remember(key, entry)
+            if self.disk_dir is not None:
+                self._save_to_disk(key, entry)
+
+    def clear(self):
+        """Bellek katmanını boşaltır (disk katmanına dokunmaz)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remember(self, key, entry):
+        """Girdiyi LRU katmanına ekler ve sınır aşılırsa en eski girdileri atar"""
+        if key in self._entries:
+            self._bytes -= _entry_nbytes(self._entries.pop(key))
+        size = _entry_nbytes(entry)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= _entry_nbytes(evicted)
+
+    def _load_from_disk(self, key):
+        """Disk katmanından girdi okur; bozuk dosyalar yok sayılır"""
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                entry = {name: data[name] for name in data.files}
+        except (OSError, ValueError):
+            return None
+        entry['current_time'] = int(entry['current_time'])
+        entry['metrics'] = json.loads(str(entry['metrics']))
+        return entry
+
+    def _save_to_disk(self, key, entry):
+        """Girdiyi geçici dosya üzerinden atomik olarak diske yazar"""
+        os.makedirs(self.disk_dir, exist_ok=True)
+        arrays = {name: value for name, value in entry.items() if name != 'metrics'}
+        arrays['metrics'] = np.array(json.dumps(entry.get('metrics', {})))
+        fd, temp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                np.savez(handle, **arrays)
+            os.replace(temp_path, self._disk_path(key))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def schedule(self, scheduler, algorithm, **params):
+        """
+        Algoritmayı önbellek üzerinden çalıştırır
+
+        İsabet durumunda saklanan sonuç zamanlayıcıya geri yüklenir, aksi
+        halde algoritma çalıştırılıp sonucu önbelleğe eklenir.
+
+        Parametreler:
+        scheduler (CPUScheduler): Zamanlayıcı
+        algorithm (str): Algoritma adı
+        **params: Algoritma parametreleri
+
+        Dönüş:
+        GanttChart: Gantt şeması
+        """
+        key = cache_key(scheduler.workload, algorithm, params)
+        entry = self.get(key)
+        if entry is not None:
+            scheduler.restore(entry)
+            return scheduler.gantt_chart
+
+        self.put(key, schedule_entry(scheduler, algorithm, params))
+        return scheduler.gantt_chart
@@ -0,0 +1,174 @@
+"""
+Algoritma Karşılaştırması
+Bu modül, zamanlama algoritmalarını bir proses havuzunda paralel olarak karşılaştırır.
+"""
+
+import pickle
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from cpu_scheduler.cache import cache_key, schedule_entry
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.workloads import Workload
+
+# İşçi prosese bir kez aktarılan iş yükü (bkz. _init_worker)
+_worker_workload = None
+
+
+def comparison_suite(time_quantum=4, context_switch=0, cache_warmup=0):
+    """
+    Karşılaştırmada çalıştırılan algoritmaların listesini döndürür
+
+    Parametreler:
+    time_quantum (int): Round Robin, Lottery ve Stride zaman dilimi (MLFQ'da en üst seviyenin hakkı)
+    context_switch (int): Tüm algoritmalara uygulanan bağlam değiştirme süresi
+    cache_warmup (int): Tüm algoritmalara uygulanan önbellek ısınma süresi
+
+    Dönüş:
+    list: (etiket, algoritma, parametreler) üçlüleri
+    """
+    suite = [
+        ("FCFS", 'fcfs', {}),
+        ("SJF", 'sjf', {'preemptive': False}),
+        ("SRTF", 'sjf', {'preemptive': True}),
+        ("RR", 'round_robin', {'time_quantum': time_quantum}),
+        ("Priority", 'priority', {'preemptive': False}),
+        ("Priority-P", 'priority', {'preemptive': True}),
+        ("MLFQ", 'mlfq', {'time_quantum': time_quantum}),
+        ("CFS", 'cfs', {}),
+        ("Lottery", 'lottery', {'time_quantum': time_quantum, 'seed': 0}),
+        ("Stride", 'stride', {'time_quantum': time_quantum}),
+    ]
+    # Sıfır ek yük parametre olarak eklenmez; önbellek anahtarları değişmez
+    overhead = {name: value for name, value in (('context_switch', context_switch),
+                                                ('cache_warmup', cache_warmup)) if value}
+    return [(label, algorithm, dict(params, **overhead)) for label, algorithm, params in suite]
+
+
+def run_algorithm(workload, algorithm, params):
+    """
+    Bir iş yükünü tek bir algoritmayla çalıştırıp metrikleri döndürür
+
+    Parametreler:
+    workload (Workload): Paylaşılan iş yükü
+    algorithm (str): Algoritma adı
+    params (dict): Algoritma parametreleri
+
+    Dönüş:
+    dict: SchedulingMetrics.calculate_all_metrics() çıktısı
+    """
+    return schedule_entry(CPUScheduler.from_workload(workload), algorithm, params)['metrics']
+
+
+def _init_worker(payload):
+    """İşçi proses başlatıcısı: serileştirilmiş iş yükünü bir kez açar"""
+    global _worker_workload
+    _worker_workload = pickle.loads(payload)
+
+
+def worker_workload():
+    """İşçi proseste, create_workload_pool() ile yüklenmiş iş yükünü döndürür"""
+    return _worker_workload
+
+
+def create_workload_pool(workload, max_workers=None):
+    """
+    İşçileri iş yüküyle başlatılmış bir proses havuzu oluşturur
+
+    İş yükü sıralamalarıyla birlikte yalnızca bir kez serileştirilir ve her
+    işçiye başlatıcı ile bir kez aktarılır; görevler iş yüküne
+    worker_workload() ile erişir.
+
+    Parametreler:
+    workload (Workload): İş yükü
+    max_workers (int): İşçi sayısı (None: çekirdek sayısı)
+
+    Dönüş:
+    ProcessPoolExecutor: Proses havuzu
+    """
+    payload = pickle.dumps(workload.prepare(), protocol=pickle.HIGHEST_PROTOCOL)
+    return ProcessPoolExecutor(max_workers=max_workers,
+                               initializer=_init_worker, initargs=(payload,))
+
+
+def iter_pool_results(executor, pending, cancel_event=None, poll_interval=0.2):
+    """
+    Havuzdaki görevlerin sonuçlarını tamamlandıkça döndürür
+
+    Bekleme, iptal bayrağını kontrol edebilmek için poll_interval
+    aralıklarla yapılır. Döngü bittiğinde (iptal veya erken kapatma dahil)
+    havuz kapatılır ve bekleyen görevler iptal edilir.
+
+    Parametreler:
+    executor (ProcessPoolExecutor): Proses havuzu
+    pending (dict): Future -> etiket eşlemesi
+    cancel_event (threading.Event): İptal bayrağı (isteğe bağlı)
+    poll_interval (float): İptal bayrağını kontrol etme aralığı (saniye)
+
+    Dönüş:
+    generator: (etiket, sonuç) çiftleri
+    """
+    try:
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_in_worker(algorithm, params, keep_schedule):
+    """
+    İşçi proseste, başlatıcıda yüklenen iş yüküyle algoritmayı çalıştırır
+
+    keep_schedule False ise yalnızca metrikler geri gönderilir.
+    """
+    entry = schedule_entry(CPUScheduler.from_workload(_worker_workload), algorithm, params)
+    return entry if keep_schedule else {'metrics': entry['metrics']}
+
+
+def iter_comparison(workload, suite, max_workers=None, cancel_event=None, poll_interval=0.2,
+                    cache=None):
+    """
+    Algoritmaları proses havuzunda çalıştırır ve sonuçları geldikçe döndürür
+
+    İş yükünün sıralamaları bir kez hesaplanıp iş yüküyle birlikte her
+    işçiye bir kez aktarılır (bkz. create_workload_pool); böylece hiçbir
+    algoritma yeniden sıralama yapmaz. Önbellekte bulunan algoritmalar hiç
+    çalıştırılmadan hemen döndürülür. cancel_event kurulursa veya üreteç
+    erken kapatılırsa bekleyen görevler iptal edilir.
+
+    Parametreler:
+    workload (Workload veya dict): İş yükü ya da proses dizileri
+    suite (list): comparison_suite() biçiminde algoritma listesi
+    max_workers (int): İşçi sayısı (None: çekirdek sayısı)
+    cancel_event (threading.Event): İptal bayrağı (isteğe bağlı)
+    poll_interval (float): İptal bayrağını kontrol etme aralığı (saniye)
+    cache (ScheduleCache): Sonuç önbelleği (isteğe bağlı)
+
+    Dönüş:
+    generator: Tamamlanma sırasına göre (etiket, metrikler) çiftleri
+    """
+    if not isinstance(workload, Workload):
+        workload = Workload.from_arrays(workload)
+
+    # Önce önbellekteki sonuçları döndür
+    remaining = []
+    for label, algorithm, params in suite:
+        key = cache_key(workload, algorithm, params) if cache is not None else None
+        entry = cache.get(key) if cache is not None else None
+        if entry is not None:
+            yield label, entry['metrics']
+        else:
+            remaining.append((label, algorithm, params, key))
+    if not remaining:
+        return
+
+    executor = create_workload_pool(workload, max_workers)
+    pending = {executor.submit(_run_in_worker, algorithm, params, cache is not None): (label, key)
+               for label, algorithm, params, key in remaining}
+    for (label, key), entry in iter_pool_results(executor, pending, cancel_event, poll_interval):
+        if cache is not None:
+            cache.put(key, entry)
+        yield label, entry['metrics']
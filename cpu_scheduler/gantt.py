@@ -0,0 +1,274 @@
+"""
+Gantt Şeması
+Bu modül, zamanlama çıktısını sıkıştırılmış, dizi tabanlı bir Gantt şeması olarak saklar.
+"""
+
+from array import array
+
+import numpy as np
+
+# Ek yük dilimlerinin pid'leri; gerçek proses ID'leri negatif değildir
+CONTEXT_SWITCH_PID = -1
+CACHE_WARMUP_PID = -2
+# Ek yük dilimlerinin Gantt şemasındaki etiketleri
+OVERHEAD_LABELS = {CONTEXT_SWITCH_PID: 'CS', CACHE_WARMUP_PID: 'W'}
+
+
+class GanttChart:
+    """
+    (pid, başlangıç, bitiş) dilimlerini üç paralel int64 dizide tutan Gantt şeması
+
+    Aynı prosesin art arda gelen bitişik dilimleri eklenirken tek dilimde
+    birleştirilir. Liste gibi yinelenebilir, uzunluğu alınabilir ve
+    dilimlenebilir; zamanlar tamsayı birimlerdir. Bağlam değiştirme ve
+    önbellek ısınma süreleri negatif pid'li ek yük dilimleri olarak tutulur
+    (CONTEXT_SWITCH_PID, CACHE_WARMUP_PID).
+    """
+
+    def __init__(self, slices=()):
+        """
+        Parametreler:
+        slices (iterable): Başlangıç dilimleri (pid, başlangıç, bitiş)
+        """
+        self.pids = array('q')
+        self.starts = array('q')
+        self.ends = array('q')
+        for item in slices:
+            self.append(item)
+
+    @classmethod
+    def from_arrays(cls, pids, starts, ends):
+        """
+        Paralel dizilerden vektörel olarak Gantt şeması oluşturur
+
+        Parametreler:
+        pids (ndarray): Proses ID'leri
+        starts (ndarray): Dilim başlangıçları
+        ends (ndarray): Dilim bitişleri
+
+        Dönüş:
+        GanttChart: Bitişik aynı-pid dilimleri birleştirilmiş şema
+        """
+        pids = np.asarray(pids, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+
+        if len(pids) > 1:
+            # Bir önceki dilimin devamı olan dilimleri birleştir; pid'ler
+            # hiç tekrarlanmıyorsa (örneğin FCFS) zaman karşılaştırması atlanır
+            continues = pids[1:] == pids[:-1]
+            if continues.any():
+                continues &= starts[1:] == ends[:-1]
+            if continues.any():
+                first = np.concatenate(([True], ~continues))
+                last = np.concatenate((~continues, [True]))
+                pids, starts, ends = pids[first], starts[first], ends[last]
+
+        # Bitişik diziler ara bayt kopyası olmadan doğrudan aktarılır
+        chart = cls()
+        chart.pids.frombytes(np.ascontiguousarray(pids).view(np.uint8))
+        chart.starts.frombytes(np.ascontiguousarray(starts).view(np.uint8))
+        chart.ends.frombytes(np.ascontiguousarray(ends).view(np.uint8))
+        return chart
+
+    def append(self, item):
+        """
+        Şemaya bir dilim ekler; önceki dilimin devamıysa onu uzatır
+
+        Parametreler:
+        item (tuple): (pid, başlangıç, bitiş)
+        """
+        pid, start, end = item
+        if self.pids and self.pids[-1] == pid and self.ends[-1] == start:
+            self.ends[-1] = end
+            return
+        self.pids.append(pid)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __iter__(self):
+        return zip(self.pids, self.starts, self.ends)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            chart = GanttChart()
+            chart.pids = self.pids[key]
+            chart.starts = self.starts[key]
+            chart.ends = self.ends[key]
+            return chart
+        return self.pids[key], self.starts[key], self.ends[key]
+
+    def __repr__(self):
+        return f"GanttChart({len(self)} dilim)"
+
+    def as_arrays(self):
+        """
+        Dilimleri NumPy dizileri olarak döndürür
+
+        Dönüş:
+        tuple: (pids, starts, ends) int64 dizileri (kopya)
+        """
+        return (np.frombuffer(self.pids, dtype=np.int64).copy(),
+                np.frombuffer(self.starts, dtype=np.int64).copy(),
+                np.frombuffer(self.ends, dtype=np.int64).copy())
+
+    def busy_time(self):
+        """Dilimlerin (ek yük dahil) toplam süresini döndürür"""
+        if not self.pids:
+            return 0
+        starts = np.frombuffer(self.starts, dtype=np.int64)
+        ends = np.frombuffer(self.ends, dtype=np.int64)
+        return int(ends.sum() - starts.sum())
+
+    def overhead_time(self):
+        """Ek yük dilimlerinin (bağlam değiştirme ve önbellek ısınma) toplam süresini döndürür"""
+        if not self.pids:
+            return 0
+        pids = np.frombuffer(self.pids, dtype=np.int64)
+        overhead = pids < 0
+        if not overhead.any():
+            return 0
+        starts = np.frombuffer(self.starts, dtype=np.int64)[overhead]
+        ends = np.frombuffer(self.ends, dtype=np.int64)[overhead]
+        return int(ends.sum() - starts.sum())
+
+    def context_switches(self):
+        """Art arda çalışan proses dilimleri arasında prosesin değiştiği geçiş sayısı"""
+        if len(self.pids) < 2:
+            return 0
+        pids = np.frombuffer(self.pids, dtype=np.int64)
+        # Ek yük dilimleri geçişin parçasıdır, ayrı bir proses sayılmaz
+        pids = pids[pids >= 0]
+        return int(np.count_nonzero(pids[1:] != pids[:-1]))
+
+    def index(self):
+        """
+        Nokta ve aralık sorguları için şemanın o anki hâlinden bir GanttIndex oluşturur
+
+        Dizin kopya üzerinde kurulur; zamanlamadan sonra bir kez oluşturulup
+        yeniden kullanılmalıdır.
+
+        Dönüş:
+        GanttIndex: Sıralı dizi dizini
+        """
+        return GanttIndex(*self.as_arrays())
+
+
+class GanttIndex:
+    """
+    Gantt şeması üzerinde sıralı diziler ve ikili arama ile kurulan aralık dizini
+
+    Dilimler başlangıca göre sıralı ve çakışmasız olduğundan bitişler de
+    sıralıdır; zaman sorguları doğrudan np.searchsorted ile O(log n)'de
+    yanıtlanır. Pid sorguları için dilimler bir kez (pid, başlangıç)
+    sırasına dizilir. Dilim aralıkları yarı açıktır: [başlangıç, bitiş).
+    """
+
+    def __init__(self, pids, starts, ends):
+        """
+        Parametreler:
+        pids (ndarray): Proses ID'leri
+        starts (ndarray): Başlangıca göre sıralı dilim başlangıçları
+        ends (ndarray): Dilim bitişleri
+        """
+        self.pids = np.asarray(pids, dtype=np.int64)
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+
+        # Kararlı sıralama, her pid'in dilimlerini zaman sırasında bırakır
+        self.pid_order = np.argsort(self.pids, kind='stable')
+        self.sorted_pids = self.pids[self.pid_order]
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __repr__(self):
+        return f"GanttIndex({len(self)} dilim)"
+
+    def slice_at(self, t):
+        """
+        t anında çalışan dilimin indeksini döndürür
+
+        Parametreler:
+        t (int): Zaman
+
+        Dönüş:
+        int: Dilim indeksi; CPU boştaysa -1
+        """
+        index = int(np.searchsorted(self.starts, t, side='right')) - 1
+        if index >= 0 and t < self.ends[index]:
+            return index
+        return -1
+
+    def running_at(self, t):
+        """
+        t anında CPU'da çalışan prosesi döndürür
+
+        Parametreler:
+        t (int): Zaman
+
+        Dönüş:
+        int: Proses ID'si (ek yük diliminde negatif pid); CPU boştaysa None
+        """
+        index = self.slice_at(t)
+        return int(self.pids[index]) if index >= 0 else None
+
+    def window(self, t0, t1):
+        """
+        [t0, t1) aralığıyla kesişen dilimlerin indeks aralığını döndürür
+
+        Dönüş:
+        tuple: (ilk, son) yarı açık indeks aralığı
+        """
+        first = int(np.searchsorted(self.ends, t0, side='right'))
+        last = int(np.searchsorted(self.starts, t1, side='left'))
+        return first, max(first, last)
+
+    def slices_in(self, t0, t1, clip=False):
+        """
+        [t0, t1) aralığıyla kesişen dilimleri döndürür
+
+        Parametreler:
+        t0 (int): Aralık başlangıcı
+        t1 (int): Aralık bitişi
+        clip (bool): Dilimleri aralık sınırlarına kırp
+
+        Dönüş:
+        tuple: (pids, starts, ends) dizileri (clip=False iken salt görünüm)
+        """
+        first, last = self.window(t0, t1)
+        pids = self.pids[first:last]
+        starts = self.starts[first:last]
+        ends = self.ends[first:last]
+        if clip:
+            starts = np.maximum(starts, t0)
+            ends = np.minimum(ends, t1)
+        return pids, starts, ends
+
+    def processes_in(self, t0, t1):
+        """[t0, t1) aralığında CPU'da çalışmış proseslerin sıralı ID'lerini döndürür"""
+        first, last = self.window(t0, t1)
+        return np.unique(self.pids[first:last])
+
+    def busy_time_in(self, t0, t1):
+        """[t0, t1) aralığında CPU'nun meşgul olduğu toplam süreyi döndürür"""
+        _, starts, ends = self.slices_in(t0, t1, clip=True)
+        return int(ends.sum() - starts.sum())
+
+    def slices_of(self, pid):
+        """
+        Bir prosesin dilimlerini zaman sırasıyla döndürür
+
+        Parametreler:
+        pid (int): Proses ID'si
+
+        Dönüş:
+        tuple: (starts, ends) dizileri; proses hiç çalışmadıysa boş
+        """
+        first = np.searchsorted(self.sorted_pids, pid, side='left')
+        last = np.searchsorted(self.sorted_pids, pid, side='right')
+        order = self.pid_order[first:last]
+        return self.starts[order], self.ends[order]
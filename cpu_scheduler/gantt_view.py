@@ -0,0 +1,219 @@
+"""
+Gantt Şeması Çizimi
+Bu modül, Gantt şemasını tek bir PolyCollection ile, görünür yakınlaştırma
+düzeyine göre ayrıntı azaltarak çizer.
+"""
+
+import numpy as np
+
+from cpu_scheduler.gantt import CACHE_WARMUP_PID, CONTEXT_SWITCH_PID, OVERHEAD_LABELS
+
+# Etiket için bir karakterin yaklaşık piksel genişliği
+LABEL_CHAR_PIXELS = 7
+# Bir çizimde en fazla eklenecek etiket sayısı
+MAX_LABELS = 200
+# Bu genişlikten (piksel) dar dilimler kenar çizgisi olmadan çizilir
+EDGE_MIN_PIXELS = 4
+# Şerit modunda ilk görünümde gösterilen en fazla şerit sayısı
+INITIAL_LANES = 25
+# Şerit modunda bundan çok şerit görünürken dilimler şerit başına değil,
+# zaman penceresinden seçilip şeride göre süzülür
+LANE_QUERY_LIMIT = 512
+# Ek yük dilimlerinin renkleri
+OVERHEAD_COLORS = {CONTEXT_SWITCH_PID: 'dimgray', CACHE_WARMUP_PID: 'silver'}
+
+
+class GanttRenderer:
+    """
+    Gantt şeması dilimlerini tek bir PolyCollection olarak çizen ayrıntı düzeyi çizicisi
+
+    Her çizimde yalnızca görünür zaman aralığındaki dilimler GanttIndex
+    üzerinden ikili arama ile seçilir. Bir pikselden dar dilimler piksel
+    sütunlarına toplanır ve her sütun, içindeki ilk dilimin renginde tek bir
+    dikdörtgen olarak çizilir; böylece çokgen sayısı dilim sayısıyla değil
+    eksen genişliğiyle sınırlı kalır. Etiketler yalnızca dilime sığdıklarında
+    eklenir. Eksen sınırları değiştiğinde (yakınlaştırma/kaydırma) görünüm
+    kendiliğinden yenilenir.
+
+    Şerit modunda her pid kendi satırında (şerit) çizilir; yalnızca görünür
+    y aralığındaki şeritlerin dilimleri, şerit başına ikili arama ile seçilip
+    çokgene dönüştürülür. Ek yük
+    dilimleri (negatif pid) gri tonlarında çizilir ve CS/W olarak etiketlenir.
+    """
+
+    def __init__(self, ax, index, swimlanes=False, y=0, height=0.5, colors=None):
+        """
+        Parametreler:
+        ax (Axes): Çizimin yapılacağı matplotlib ekseni
+        index (GanttIndex): Çizilecek dilimlerin aralık dizini
+        swimlanes (bool): Her pid'i ayrı bir şeritte çiz (şerit i, y=i'dedir)
+        y (float): Tek satır modunda dilimlerin dikey merkezi
+        height (float): Dilim yüksekliği
+        colors (ndarray): Dilim başına RGBA renkler (None: pid başına tab10)
+        """
+        from matplotlib.collections import PolyCollection
+
+        self.ax = ax
+        self.index = index
+        self.pids = index.pids
+        self.starts = index.starts
+        self.ends = index.ends
+        self.y = y
+        self.height = height
+        self.colors = self.pid_colors(self.pids) if colors is None else colors
+        self.labels = []
+
+        # Şerit modunda dilimin satırı, pid'in benzersiz pid'ler içindeki sırasıdır
+        self.lanes = None
+        self.lane_pids = None
+        if swimlanes:
+            self.lane_pids, self.lanes = np.unique(self.pids, return_inverse=True)
+            # Şerit l'nin dilimleri index.pid_order[offsets[l]:offsets[l + 1]]
+            # aralığında zaman sırasıyla durur
+            self.lane_offsets = np.append(np.searchsorted(index.sorted_pids, self.lane_pids),
+                                          len(self.pids))
+            self.lane_starts = self.starts[index.pid_order]
+            self.lane_ends = self.ends[index.pid_order]
+
+        self.collection = PolyCollection([], closed=True, edgecolors='black')
+        ax.add_collection(self.collection)
+        ax.callbacks.connect('xlim_changed', lambda _: self.update())
+        if swimlanes:
+            ax.callbacks.connect('ylim_changed', lambda _: self.update())
+
+    @staticmethod
+    def pid_colors(pids):
+        """
+        Her pid'e benzersiz pid sırasına göre tab10 paletinden bir renk atar
+
+        Ek yük dilimleri OVERHEAD_COLORS renklerini alır ve proseslerin
+        renklerini değiştirmez.
+
+        Parametreler:
+        pids (ndarray): Proses ID'leri
+
+        Dönüş:
+        ndarray: Dilim başına RGBA renkler
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import to_rgba
+
+        colors = np.empty((len(pids), 4))
+        real = pids >= 0
+        unique_pids, index = np.unique(pids[real], return_inverse=True)
+        if len(unique_pids) <= 10:
+            colors[real] = plt.cm.tab10(np.linspace(0, 1, len(unique_pids)))[index]
+        else:
+            # Çok sayıda proseste komşu pid'ler ayırt edilebilsin diye palet döngüsel kullanılır
+            colors[real] = plt.cm.tab10(index % 10)
+        for pid, color in OVERHEAD_COLORS.items():
+            colors[pids == pid] = to_rgba(color)
+        return colors
+
+    @staticmethod
+    def slice_label(pid):
+        """Dilim etiketi: proseslerde P<pid>, ek yük dilimlerinde CS veya W"""
+        return OVERHEAD_LABELS.get(pid, f'P{pid}')
+
+    def lane_label(self, value, _position=None):
+        """Şerit modunda y ekseni değerini dilim etiketine çevirir (FuncFormatter için)"""
+        lane = int(round(value))
+        if self.lane_pids is None or lane != value or not 0 <= lane < len(self.lane_pids):
+            return ''
+        return self.slice_label(int(self.lane_pids[lane]))
+
+    def visible_rows(self, x0, x1):
+        """
+        Görünür zaman aralığı ve şeritlerdeki dilimlerin indekslerini döndürür
+
+        Şerit modunda görünür şeritlerin her birinde zaman aralığı ikili
+        arama ile bulunur; böylece maliyet görünmeyen şeritlerdeki dilim
+        sayısına bağlı değildir. Dilimler şerit, şerit içinde zaman sırasıyla
+        döner.
+
+        Dönüş:
+        ndarray veya slice: Görünür dilimlerin indeksleri
+        """
+        if self.lanes is None:
+            return slice(*self.index.window(x0, x1))
+        y0, y1 = sorted(self.ax.get_ylim())
+        margin = self.height / 2
+        first_lane = max(int(np.ceil(y0 - margin)), 0)
+        last_lane = min(int(np.floor(y1 + margin)) + 1, len(self.lane_pids))
+        if last_lane - first_lane > LANE_QUERY_LIMIT:
+            first, last = self.index.window(x0, x1)
+            lanes = self.lanes[first:last]
+            return first + np.flatnonzero((lanes >= first_lane) & (lanes < last_lane))
+
+        order = self.index.pid_order
+        parts = [np.empty(0, dtype=np.int64)]
+        for lane in range(first_lane, last_lane):
+            lo, hi = self.lane_offsets[lane], self.lane_offsets[lane + 1]
+            first = lo + np.searchsorted(self.lane_ends[lo:hi], x0, side='right')
+            last = lo + np.searchsorted(self.lane_starts[lo:hi], x1, side='left')
+            parts.append(order[first:max(first, last)])
+        return np.concatenate(parts)
+
+    def update(self):
+        """Görünür aralık ve eksen genişliğine göre çokgenleri ve etiketleri yeniden oluşturur"""
+        x0, x1 = self.ax.get_xlim()
+        width_pixels = max(self.ax.bbox.width, 1.0)
+        pixel = (x1 - x0) / width_pixels
+
+        rows = self.visible_rows(x0, x1)
+        # Kısmen görünen dilimler görünür aralığa kırpılır
+        starts = np.maximum(self.starts[rows], x0)
+        ends = np.minimum(self.ends[rows], x1)
+        colors = self.colors[rows]
+        if self.lanes is None:
+            ys = np.full(len(starts), float(self.y))
+        else:
+            ys = self.lanes[rows].astype(np.float64)
+
+        # Bir pikselden dar dilimleri (şerit, piksel sütunu) hücrelerine topla
+        wide = (ends - starts) >= pixel
+        thin = np.flatnonzero(~wide)
+        if len(thin):
+            columns = np.floor((starts[thin] - x0) / pixel)
+            if self.lanes is None:
+                leaders = np.flatnonzero(np.concatenate(([True], columns[1:] != columns[:-1])))
+            else:
+                cells = ys[thin] * (width_pixels + 1) + columns
+                _, leaders = np.unique(cells, return_index=True)
+            thin = thin[leaders]
+            thin_starts = x0 + columns[leaders] * pixel
+        else:
+            thin_starts = np.empty(0)
+        left = np.concatenate((starts[wide], thin_starts))
+        right = np.concatenate((ends[wide], thin_starts + pixel))
+        centers = np.concatenate((ys[wide], ys[thin]))
+        facecolors = np.concatenate((colors[wide], colors[thin]))
+
+        verts = np.empty((len(left), 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = left
+        verts[:, 2, 0] = verts[:, 3, 0] = right
+        verts[:, 0, 1] = verts[:, 3, 1] = centers - self.height / 2
+        verts[:, 1, 1] = verts[:, 2, 1] = centers + self.height / 2
+        self.collection.set_verts(verts)
+        self.collection.set_facecolors(facecolors)
+        self.collection.set_linewidths(np.where((right - left) >= EDGE_MIN_PIXELS * pixel, 0.8, 0.0))
+
+        wide_rows = rows.start + np.flatnonzero(wide) if isinstance(rows, slice) else rows[wide]
+        self._update_labels(wide_rows, starts[wide], ends[wide], ys[wide], pixel)
+
+    def _update_labels(self, rows, starts, ends, ys, pixel):
+        """Görünür geniş dilimlerden etiketi sığanlara slice_label() metnini ekler"""
+        for label in self.labels:
+            label.remove()
+        self.labels = []
+
+        pids = self.pids[rows]
+        label_pixels = (np.floor(np.log10(np.maximum(np.abs(pids), 1))) + 2) * LABEL_CHAR_PIXELS
+        fits = np.flatnonzero((ends - starts) / pixel >= label_pixels + LABEL_CHAR_PIXELS)
+        if len(fits) > MAX_LABELS:
+            return
+
+        for index in fits:
+            self.labels.append(self.ax.text(
+                (starts[index] + ends[index]) / 2, ys[index], self.slice_label(int(pids[index])),
+                ha='center', va='center', color='black', fontweight='bold', clip_on=True))
@@ -3,9 +3,11 @@ CPU Zamanlama Metrikleri
 Bu modül, CPU zamanlama performans metriklerini hesaplar ve görselleştirir.
 """
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.figure import Figure
+
+from cpu_scheduler.gantt_view import INITIAL_LANES, GanttRenderer
+
+# matplotlib yalnızca çizim metotlarında içe aktarılır; hesaplamalar GUI olmadan da çalışır
 
 class SchedulingMetrics:
     """Zamanlama metriklerini hesaplayan ve görselleştiren sınıf"""
@@ -16,65 +18,284 @@ class SchedulingMetrics:
         scheduler (CPUScheduler): Metriklerin hesaplanacağı zamanlayıcı
         """
         self.scheduler = scheduler
+        # Akış modunda (track) biriktirilen zaman çizelgesi toplamları
+        self.online = None
+    
+    def track(self, slices):
+        """
+        Akan dilimleri olduğu gibi geçirirken metrikleri çevrimiçi biriktirir
+        
+        CPUScheduler.iter_schedule() ile birlikte kullanılır; zaman çizelgesi
+        bellekte tutulmadığından kullanım oranı bu toplamlardan hesaplanır.
+        
+        Parametreler:
+        slices (iterable): (pid, başlangıç, bitiş) dilimleri
+        
+        Dönüş:
+        generator: Aynı dilimler
+        """
+        online = self.online = {'busy_time': 0, 'overhead_time': 0, 'slice_count': 0,
+                                'context_switches': 0}
+        last_pid = None
+        for item in slices:
+            pid, start, end = item
+            online['busy_time'] += end - start
+            online['slice_count'] += 1
+            if pid < 0:
+                # Ek yük dilimi: geçişin parçasıdır, proses değişimi sayılmaz
+                online['overhead_time'] += end - start
+                yield item
+                continue
+            if last_pid is not None and pid != last_pid:
+                online['context_switches'] += 1
+            last_pid = pid
+            yield item
     
     def calculate_all_metrics(self):
-        """Tüm metrikleri hesaplar ve bir sözlük olarak döndürür"""
-        metrics = {
-            'avg_waiting_time': self.scheduler.get_average_waiting_time(),
-            'avg_turnaround_time': self.scheduler.get_average_turnaround_time(),
-            'avg_response_time': self.scheduler.get_average_response_time(),
-            'throughput': len(self.scheduler.processes) / self.scheduler.current_time if self.scheduler.current_time > 0 else 0,
-            'cpu_utilization': self.calculate_cpu_utilization()
-        }
+        """
+        Tüm metrikleri hesaplar ve bir sözlük olarak döndürür
+        
+        Ortalamalara ek olarak bekleme ve cevap sürelerinin kuyruk değerleri
+        (p50/p90/p99/maks), yavaşlama, Jain adalet indeksi, aç kalan proses
+        sayısı ve bağlam değişimi sayısı döndürülür. Proses başına değerler
+        dizilerden vektörel olarak hesaplanır.
+        
+        Bağlam değiştirme ve önbellek ısınma dilimleri zaman çizelgesini
+        uzattığından üretilen iş (throughput) düşer. cpu_utilization ek yükü
+        de meşgul sayar; effective_utilization yalnızca proseslerin çalıştığı
+        süreyi, overhead_ratio ise ek yükün payını verir.
+        """
+        metrics = self.calculate_latency_metrics()
+        metrics['throughput'] = (self.scheduler.process_count() / self.scheduler.current_time
+                                 if self.scheduler.current_time > 0 else 0)
+        metrics['cpu_utilization'] = self.calculate_cpu_utilization()
+        metrics['overhead_ratio'] = self.calculate_overhead_ratio()
+        metrics['effective_utilization'] = metrics['cpu_utilization'] - metrics['overhead_ratio']
+        metrics['context_switches'] = self.count_context_switches()
+        return metrics
+    
+    def process_arrays(self):
+        """
+        Proses başına girdi ve sonuç dizileri
+        
+        Dönüş:
+        tuple: (varış, işlem süresi, tamamlanma, ilk CPU ataması) int64 dizileri
+        """
+        table = self.scheduler.table
+        if table is not None:
+            return table.arrival, table.burst, table.completion, table.response
+        processes = self.scheduler.processes
+        return tuple(np.fromiter((getattr(process, name) for process in processes),
+                                 dtype=np.int64, count=len(processes))
+                     for name in ('arrival_time', 'burst_time', 'completion_time', 'response_time'))
+    
+    def calculate_latency_metrics(self, starvation_threshold=None):
+        """
+        Bekleme, cevap ve yavaşlama dağılımlarını ve adalet ölçülerini hesaplar
+        
+        Yavaşlama toplam işlem süresi / işlem süresidir. Jain adalet indeksi
+        (Σx)² / (n·Σx²) formülüyle x = 1 / yavaşlama üzerinden hesaplanır;
+        1 tüm proseslerin eşit hizmet aldığını gösterir. İşlem süresi 0 olan
+        prosesler yavaşlama ve adalet ölçülerine katılmaz. Bekleme süresi
+        eşiği aşan prosesler aç kalmış sayılır.
+        
+        Parametreler:
+        starvation_threshold (float): Açlık eşiği (None: ortalama işlem
+            süresinin 10 katı)
+        
+        Dönüş:
+        dict: avg_/p50_/p90_/p99_/max_ ön ekli waiting_time ve response_time,
+            avg_turnaround_time, avg_/p99_/max_slowdown, fairness_index ve
+            starved_count
+        """
+        arrival, burst, completion, first_run = self.process_arrays()
+        count = len(arrival)
+        metrics = {'avg_waiting_time': 0, 'avg_turnaround_time': 0, 'avg_response_time': 0}
+        if count == 0 or self.scheduler.current_time == 0:
+            # Henüz zamanlanmadı
+            for name in ('waiting_time', 'response_time'):
+                metrics.update({prefix + name: 0 for prefix in ('p50_', 'p90_', 'p99_', 'max_')})
+            metrics.update(avg_slowdown=0, p99_slowdown=0, max_slowdown=0,
+                           fairness_index=0, starved_count=0)
+            return metrics
+        
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        responded = first_run != -1
+        response = np.where(responded, first_run - arrival, 0)
+        served = burst > 0
+        slowdown = turnaround[served] / burst[served]
+        
+        metrics['avg_waiting_time'] = float(waiting.mean())
+        metrics['avg_turnaround_time'] = float(turnaround.mean())
+        metrics['avg_response_time'] = float(response.sum()) / count
+        for name, values in (('waiting_time', waiting), ('response_time', response[responded])):
+            if len(values):
+                p50, p90, p99 = np.percentile(values, (50, 90, 99))
+                maximum = values.max()
+            else:
+                p50 = p90 = p99 = maximum = 0
+            metrics.update({'p50_' + name: float(p50), 'p90_' + name: float(p90),
+                            'p99_' + name: float(p99), 'max_' + name: float(maximum)})
+        
+        if len(slowdown):
+            metrics['avg_slowdown'] = float(slowdown.mean())
+            metrics['p99_slowdown'] = float(np.percentile(slowdown, 99))
+            metrics['max_slowdown'] = float(slowdown.max())
+            share = 1 / slowdown
+            metrics['fairness_index'] = float(share.sum() ** 2 / (len(share) * np.dot(share, share)))
+        else:
+            metrics.update(avg_slowdown=0, p99_slowdown=0, max_slowdown=0, fairness_index=0)
+        
+        if starvation_threshold is None:
+            starvation_threshold = 10 * burst.mean()
+        metrics['starved_count'] = int(np.count_nonzero(waiting > starvation_threshold))
         return metrics
     
+    def count_context_switches(self):
+        """Zaman çizelgesindeki (veya akış modunda biriktirilen) bağlam değişimi sayısı"""
+        gantt_chart = self.scheduler.gantt_chart
+        if len(gantt_chart) == 0 and self.online is not None:
+            return self.online['context_switches']
+        return gantt_chart.context_switches()
+    
     def calculate_cpu_utilization(self):
-        """CPU kullanım oranını hesaplar"""
-        if not self.scheduler.gantt_chart or self.scheduler.current_time == 0:
+        """CPU kullanım oranını (ek yük dilimleri dahil) hesaplar"""
+        if self.scheduler.current_time == 0:
             return 0
         
         # CPU'nun meşgul olduğu toplam süre
-        busy_time = sum(end - start for _, start, end in self.scheduler.gantt_chart)
+        gantt_chart = self.scheduler.gantt_chart
+        if len(gantt_chart) == 0 and self.online is not None:
+            # Akış modunda çalıştırıldı: zaman çizelgesi saklanmadı
+            busy_time = self.online['busy_time']
+        else:
+            busy_time = gantt_chart.busy_time()
         # CPU kullanım oranı = meşgul süre / toplam süre
         return busy_time / self.scheduler.current_time
     
-    def create_gantt_chart(self):
+    def calculate_overhead_ratio(self):
+        """Bağlam değiştirme ve önbellek ısınma sürelerinin toplam süreye oranı"""
+        if self.scheduler.current_time == 0:
+            return 0
+        gantt_chart = self.scheduler.gantt_chart
+        if len(gantt_chart) == 0 and self.online is not None:
+            overhead_time = self.online['overhead_time']
+        else:
+            overhead_time = gantt_chart.overhead_time()
+        return overhead_time / self.scheduler.current_time
+    
+    def calculate_timelines(self, window=None, bins=200):
+        """
+        Pencere başına CPU kullanım oranını ve ortalama hazır kuyruk uzunluğunu hesaplar
+        
+        Meşgul süre ve ek yük süresi, dilim uzunluklarının önek toplamlarından
+        her pencere sınırında okunur. Hazır kuyruk uzunluğunun zaman
+        integrali, sistemdeki proses sayısının integralinden (varış ve
+        tamamlanma sayılarının pencere başına bincount ile önek toplamları)
+        proseslerin çalıştığı süre çıkarılarak bulunur; ek yük sırasında
+        atanmakta olan proses kuyrukta sayılır. Maliyet O(dilim + proses + pencere) düzeyindedir; sıralama
+        yapılmaz.
+        
+        Parametreler:
+        window (int): Pencere süresi (None: zaman çizelgesini bins pencereye böler)
+        bins (int): window verilmediğinde pencere sayısı
+        
+        Dönüş:
+        dict: 'time' (pencere başlangıçları), 'window', 'utilization' (ek yük
+            dahil), 'overhead' ve 'ready_queue' (pencere ortalaması) dizileri;
+            zamanlama yapılmamışsa veya zaman çizelgesi saklanmamışsa diziler boştur
+        """
+        current_time = self.scheduler.current_time
+        gantt_chart = self.scheduler.gantt_chart
+        if current_time == 0 or len(gantt_chart) == 0:
+            empty = np.empty(0)
+            return {'time': empty, 'window': window or 0, 'utilization': empty, 'overhead': empty,
+                    'ready_queue': empty}
+        
+        if window is None:
+            window = max(1, -(-current_time // bins))
+        count = -(-current_time // window)
+        edges = np.arange(count + 1, dtype=np.int64) * window
+        widths = np.minimum(edges[1:], current_time) - edges[:-1]
+        
+        # Pencere sınırlarına kadar birikmiş meşgul süre ve ek yük süresi
+        pids = np.frombuffer(gantt_chart.pids, dtype=np.int64)
+        starts = np.frombuffer(gantt_chart.starts, dtype=np.int64)
+        ends = np.frombuffer(gantt_chart.ends, dtype=np.int64)
+        lengths = ends - starts
+        busy_before = np.concatenate(([0], np.cumsum(lengths)))
+        last = np.searchsorted(starts, edges, side='right') - 1
+        inside = np.clip(edges - starts[last], 0, lengths[last])
+        busy = np.where(last >= 0, busy_before[last] + inside, 0)
+        overhead_slices = pids < 0
+        overhead_before = np.concatenate(([0], np.cumsum(np.where(overhead_slices, lengths, 0))))
+        overhead_inside = np.where(overhead_slices[last], inside, 0)
+        overhead = np.where(last >= 0, overhead_before[last] + overhead_inside, 0)
+        
+        def area_before(times):
+            """Her sınır için Σ max(0, sınır - t): 'gerçekleşmiş olay sayısı' eğrisinin integrali"""
+            # Zaman çizelgesi 0'da başlar; negatif varışlar 0'da gerçekleşmiş sayılır
+            times = np.maximum(times, 0)
+            bucket = times // window
+            counts = np.bincount(bucket, minlength=count + 1)[:count + 1]
+            sums = np.bincount(bucket, weights=times, minlength=count + 1)[:count + 1]
+            earlier_counts = np.concatenate(([0], np.cumsum(counts[:-1])))
+            earlier_sums = np.concatenate(([0], np.cumsum(sums[:-1])))
+            return earlier_counts * edges - earlier_sums
+        
+        arrival, _, completion, _ = self.process_arrays()
+        in_system = area_before(arrival) - area_before(completion)
+        return {
+            'time': edges[:-1],
+            'window': window,
+            'utilization': np.diff(busy) / widths,
+            'overhead': np.diff(overhead) / widths,
+            'ready_queue': np.diff(in_system - busy + overhead) / widths,
+        }
+    
+    def create_gantt_chart(self, swimlanes=False):
         """
         Gantt şeması görselleştirmesi oluşturur
         
+        Dilimler tek bir PolyCollection olarak çizilir; pikselden dar dilimler
+        birleştirilir ve etiketler yalnızca sığdıklarında eklenir
+        (bkz. GanttRenderer). Yakınlaştırıldığında görünüm yenilenir.
+        
+        Parametreler:
+        swimlanes (bool): Her prosesi ayrı bir şeritte göster; ilk görünümde
+            INITIAL_LANES şerit görünür, diğerlerine kaydırılarak ulaşılır
+        
         Dönüş:
         Figure: matplotlib Figure nesnesi
         """
-        if not self.scheduler.gantt_chart:
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+        if len(self.scheduler.gantt_chart) == 0:
             fig = Figure(figsize=(10, 1))
             ax = fig.add_subplot(111)
             ax.text(0.5, 0.5, "Henüz çalıştırılmadı", ha='center', va='center')
             return fig
         
-        # Benzersiz proses ID'leri
-        unique_pids = sorted(set(pid for pid, _, _ in self.scheduler.gantt_chart))
-        
-        # Her proses için renk ata
-        colors = plt.cm.tab10(np.linspace(0, 1, len(unique_pids)))
-        color_map = {pid: colors[i] for i, pid in enumerate(unique_pids)}
-        
         # Figür oluştur
         fig = Figure(figsize=(12, 6))
         ax = fig.add_subplot(111)
-        
-        # Y ekseni etiketlerini ayarla
-        ax.set_yticks([])
         ax.set_xlabel('Zaman')
         ax.set_title('CPU Zamanlama Gantt Şeması')
         
-        # Gantt şemasını çiz
-        for pid, start, end in self.scheduler.gantt_chart:
-            ax.barh(0, end - start, left=start, height=0.5, 
-                  color=color_map[pid], edgecolor='black')
-            # Proses ID'sini çubuğun üzerine yaz
-            if end - start > 0.5:  # Sadece yeterince geniş ise metin ekle
-                ax.text((start + end) / 2, 0, f'P{pid}', 
-                      ha='center', va='center', color='black', fontweight='bold')
+        # Gantt şemasını çiz; eksen sınırlarının ayarlanması ilk çizimi tetikler
+        index = self.scheduler.gantt_chart.index()
+        renderer = GanttRenderer(ax, index, swimlanes=swimlanes)
+        if swimlanes:
+            # İlk şerit üstte; y ekseni etiketleri yalnızca görünür şeritler için üretilir
+            ax.yaxis.set_major_locator(MaxNLocator(nbins=INITIAL_LANES, integer=True))
+            ax.yaxis.set_major_formatter(FuncFormatter(renderer.lane_label))
+            ax.set_ylim(min(len(renderer.lane_pids), INITIAL_LANES) - 0.5, -0.5)
+        else:
+            ax.set_yticks([])
+            ax.set_ylim(-1, 1)
+        ax.set_xlim(index.starts[0], index.ends[-1])
         
         # X ekseni ızgaralarını ekle
         ax.grid(axis='x', linestyle='--', alpha=0.7)
@@ -91,6 +312,8 @@ class SchedulingMetrics:
         Dönüş:
         Figure: matplotlib Figure nesnesi
         """
+        from matplotlib.figure import Figure
+
         if not metrics_dict:
             fig = Figure(figsize=(10, 1))
             ax = fig.add_subplot(111)
@@ -134,4 +357,99 @@ class SchedulingMetrics:
                 ax.text(positions[j] + i * bar_width, value + 0.1, f'{value:.2f}',
                       ha='center', va='bottom', fontsize=8)
         
-        return fig
\ No newline at end of file
+        return fig
+
+    def create_quantum_sweep_chart(self, sweep):
+        """
+        Round Robin zaman dilimi taraması için metrik eğrilerini çizer
+        
+        Parametreler:
+        sweep (dict): sweep_round_robin() çıktısı
+        
+        Dönüş:
+        Figure: matplotlib Figure nesnesi
+        """
+        from matplotlib.figure import Figure
+
+        if not sweep or len(sweep['quantum']) == 0:
+            fig = Figure(figsize=(10, 1))
+            ax = fig.add_subplot(111)
+            ax.text(0.5, 0.5, "Veri yok", ha='center', va='center')
+            return fig
+        
+        quanta = sweep['quantum']
+        fig = Figure(figsize=(12, 8))
+        ax = fig.add_subplot(111)
+        
+        # Süre metrikleri sol eksende
+        ax.plot(quanta, sweep['avg_waiting_time'], label='Ortalama Bekleme Süresi')
+        ax.plot(quanta, sweep['avg_turnaround_time'], label='Ortalama Toplam İşlem Süresi')
+        ax.plot(quanta, sweep['avg_response_time'], label='Ortalama Cevap Süresi')
+        ax.set_xlabel('Zaman Dilimi')
+        ax.set_ylabel('Süre (birim zaman)')
+        ax.set_title('Round Robin Zaman Dilimi Taraması')
+        ax.grid(linestyle='--', alpha=0.7)
+        
+        # Bağlam değişimi sayısı sağ eksende
+        switches_ax = ax.twinx()
+        switches_ax.plot(quanta, sweep['context_switches'], color='gray', linestyle='--',
+                         label='Bağlam Değişimi')
+        switches_ax.set_ylabel('Bağlam değişimi sayısı')
+        
+        lines, labels = ax.get_legend_handles_labels()
+        switch_lines, switch_labels = switches_ax.get_legend_handles_labels()
+        ax.legend(lines + switch_lines, labels + switch_labels, loc='upper right')
+        
+        return fig
+    
+    def create_timeline_chart(self, timelines=None):
+        """
+        Kullanım oranı ve hazır kuyruk uzunluğunun zamana göre grafiğini çizer
+        
+        Parametreler:
+        timelines (dict): calculate_timelines() çıktısı (None: hesaplanır)
+        
+        Dönüş:
+        Figure: matplotlib Figure nesnesi
+        """
+        from matplotlib.figure import Figure
+        
+        if timelines is None:
+            timelines = self.calculate_timelines()
+        if len(timelines['time']) == 0:
+            fig = Figure(figsize=(10, 1))
+            ax = fig.add_subplot(111)
+            ax.text(0.5, 0.5, "Henüz çalıştırılmadı", ha='center', va='center')
+            return fig
+        
+        fig = Figure(figsize=(12, 6))
+        utilization_ax = fig.add_subplot(211)
+        queue_ax = fig.add_subplot(212, sharex=utilization_ax)
+        
+        # Pencere değerleri basamak olarak çizilir; son pencere de kapatılır
+        time = np.append(timelines['time'], timelines['time'][-1] + timelines['window'])
+        utilization = np.append(timelines['utilization'], timelines['utilization'][-1]) * 100
+        ready_queue = np.append(timelines['ready_queue'], timelines['ready_queue'][-1])
+        
+        utilization_ax.fill_between(time, utilization, step='post', alpha=0.4)
+        utilization_ax.step(time, utilization, where='post', label='Meşgul')
+        if timelines['overhead'].any():
+            # Ek yük, meşgul sürenin altında ayrı bir bant olarak gösterilir
+            overhead = np.append(timelines['overhead'], timelines['overhead'][-1]) * 100
+            utilization_ax.fill_between(time, overhead, step='post', color='gray', alpha=0.6,
+                                        label='Ek yük (bağlam değiştirme + ısınma)')
+            utilization_ax.legend(loc='lower right')
+        utilization_ax.set_ylim(0, 105)
+        utilization_ax.set_ylabel('CPU Kullanımı (%)')
+        utilization_ax.set_title('Pencere Başına CPU Kullanımı ve Hazır Kuyruk Uzunluğu '
+                                 '(pencere: {})'.format(timelines['window']))
+        utilization_ax.grid(linestyle='--', alpha=0.7)
+        
+        queue_ax.fill_between(time, ready_queue, step='post', alpha=0.4, color='tab:orange')
+        queue_ax.step(time, ready_queue, where='post', color='tab:orange')
+        queue_ax.set_ylabel('Ort. Kuyruk Uzunluğu')
+        queue_ax.set_xlabel('Zaman')
+        queue_ax.grid(linestyle='--', alpha=0.7)
+        
+        fig.tight_layout()
+        return fig
@@ -0,0 +1,146 @@
+"""
+Sütunlu Proses Tablosu
+Bu modül, büyük iş yükleri için prosesleri NumPy sütunlarında (struct-of-arrays) saklar.
+"""
+
+import numpy as np
+
+
+def _column(name):
+    """Tablonun dolu kısmını gösteren salt okunur sütun özelliği oluşturur"""
+    def getter(self):
+        return self._columns[name][:self._size]
+    getter.__doc__ = f"{name} sütunu (int64, görünüm)"
+    return property(getter)
+
+
+class ProcessTable:
+    """
+    Proses bilgilerini int64 NumPy sütunlarında tutan sınıf
+
+    Her proses için yalnızca yedi sütun saklanır (proses başına 56 bayt);
+    bekleme ve toplam işlem süreleri gerektiğinde vektörel olarak türetilir.
+    """
+
+    COLUMNS = ('pid', 'arrival', 'burst', 'priority', 'remaining', 'completion', 'response')
+
+    # add_processes() için kabul edilen girdi anahtarları
+    INPUT_KEYS = ('pid', 'arrival_time', 'burst_time', 'priority')
+
+    pid = _column('pid')
+    arrival = _column('arrival')
+    burst = _column('burst')
+    priority = _column('priority')
+    remaining = _column('remaining')
+    completion = _column('completion')
+    response = _column('response')
+
+    def __init__(self, capacity=1024):
+        """
+        Parametreler:
+        capacity (int): Başlangıç kapasitesi (satır sayısı)
+        """
+        self._size = 0
+        self._columns = {name: np.zeros(capacity, dtype=np.int64) for name in self.COLUMNS}
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def nbytes(self):
+        """Dolu satırların kapladığı bellek (bayt)"""
+        return self._size * len(self.COLUMNS) * np.dtype(np.int64).itemsize
+
+    def _reserve(self, size):
+        """Kapasiteyi en az size satıra çıkarır (iki katına büyüterek)"""
+        capacity = len(self._columns['pid'])
+        if size <= capacity:
+            return
+        new_capacity = max(size, capacity * 2)
+        for name, column in self._columns.items():
+            grown = np.zeros(new_capacity, dtype=np.int64)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+
+    def append(self, pid, arrival_time, burst_time, priority=0):
+        """Tabloya tek bir proses ekler"""
+        self._reserve(self._size + 1)
+        row = self._size
+        self._columns['pid'][row] = pid
+        self._columns['arrival'][row] = arrival_time
+        self._columns['burst'][row] = burst_time
+        self._columns['priority'][row] = priority
+        self._columns['remaining'][row] = burst_time
+        self._columns['completion'][row] = 0
+        self._columns['response'][row] = -1
+        self._size += 1
+
+    def extend(self, arrays):
+        """
+        Tabloya toplu olarak proses ekler
+
+        Parametreler:
+        arrays (dict veya yapılandırılmış ndarray): 'arrival_time' ve 'burst_time'
+            dizileri zorunludur; 'pid' verilmezse sıradaki numaralar, 'priority'
+            verilmezse 0 kullanılır
+
+        Dönüş:
+        int: Eklenen proses sayısı
+        """
+        names = arrays.dtype.names if hasattr(arrays, 'dtype') else tuple(arrays.keys())
+        missing = [key for key in ('arrival_time', 'burst_time') if key not in names]
+        if missing:
+            raise ValueError("Eksik sütun(lar): {}".format(", ".join(missing)))
+        unknown = [key for key in names if key not in self.INPUT_KEYS]
+        if unknown:
+            raise ValueError("Bilinmeyen sütun(lar): {}".format(", ".join(unknown)))
+
+        arrival = np.asarray(arrays['arrival_time'], dtype=np.int64).ravel()
+        burst = np.asarray(arrays['burst_time'], dtype=np.int64).ravel()
+        count = len(arrival)
+        if len(burst) != count:
+            raise ValueError("Sütun uzunlukları eşleşmiyor")
+
+        start, end = self._size, self._size + count
+        self._reserve(end)
+        columns = self._columns
+
+        if 'pid' in names:
+            pid = np.asarray(arrays['pid'], dtype=np.int64).ravel()
+            if len(pid) != count:
+                raise ValueError("Sütun uzunlukları eşleşmiyor")
+            columns['pid'][start:end] = pid
+        else:
+            # Proses ID'leri verilmemişse mevcut en büyük ID'den devam et
+            first_pid = int(columns['pid'][:start].max()) + 1 if start else 1
+            columns['pid'][start:end] = np.arange(first_pid, first_pid + count, dtype=np.int64)
+
+        if 'priority' in names:
+            priority = np.asarray(arrays['priority'], dtype=np.int64).ravel()
+            if len(priority) != count:
+                raise ValueError("Sütun uzunlukları eşleşmiyor")
+            columns['priority'][start:end] = priority
+        else:
+            columns['priority'][start:end] = 0
+
+        columns['arrival'][start:end] = arrival
+        columns['burst'][start:end] = burst
+        columns['remaining'][start:end] = burst
+        columns['completion'][start:end] = 0
+        columns['response'][start:end] = -1
+        self._size = end
+        return count
+
+    def reset(self):
+        """Zamanlama sonuçlarını sıfırlar"""
+        self.remaining[:] = self.burst
+        self.completion[:] = 0
+        self.response[:] = -1
+
+    def turnaround_time(self):
+        """Proses başına toplam işlem süresi dizisi"""
+        return self.completion - self.arrival
+
+    def waiting_time(self):
+        """Proses başına bekleme süresi dizisi"""
+        return self.completion - self.arrival - self.burst
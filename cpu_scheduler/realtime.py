@@ -0,0 +1,323 @@
+"""
+Gerçek Zamanlı Zamanlama
+Bu modül, periyodik ve sporadik görev kümelerini EDF ve Rate-Monotonic (RMS)
+algoritmalarıyla zamanlar ve zamanlanabilirlik testlerini içerir.
+"""
+
+import heapq
+import math
+from array import array
+
+import numpy as np
+
+from cpu_scheduler.gantt import GanttChart
+
+# RealTimeScheduler.schedule() ile çalıştırılabilen algoritmalar
+REALTIME_ALGORITHMS = ('edf', 'rms')
+
+# Hiperperiyot bu değeri aşarsa zamanlama ufku bununla sınırlanır
+MAX_HORIZON = 1_000_000
+
+
+class PeriodicTask:
+    """Periyodik veya sporadik gerçek zamanlı görevi temsil eden sınıf"""
+    def __init__(self, task_id, period, wcet, deadline=None, offset=0, sporadic=False, max_delay=0):
+        """
+        Parametreler:
+        task_id (int): Görev ID'si (Gantt şemasında pid olarak görünür)
+        period (int): Periyot (sporadik görevlerde en kısa varışlar arası süre)
+        wcet (int): En kötü durum çalışma süresi
+        deadline (int): Göreli son tarih (None: periyot)
+        offset (int): İlk işin serbest bırakılma zamanı
+        sporadic (bool): Varışlar arası süreye [0, max_delay] aralığında rastgele gecikme eklenir
+        max_delay (int): Sporadik görevlerde en büyük ek gecikme
+        """
+        if period <= 0 or wcet <= 0:
+            raise ValueError("Görev {}: periyot ve çalışma süresi pozitif olmalı".format(task_id))
+        self.task_id = task_id
+        self.period = period
+        self.wcet = wcet
+        self.deadline = period if deadline is None else deadline
+        self.offset = offset
+        self.sporadic = sporadic
+        self.max_delay = max_delay
+
+    @property
+    def utilization(self):
+        """İşlemci kullanım payı (wcet / periyot)"""
+        return self.wcet / self.period
+
+    def __str__(self):
+        return (f"Task {self.task_id}: period={self.period}, wcet={self.wcet}, "
+                f"deadline={self.deadline}, offset={self.offset}")
+
+
+def total_utilization(tasks):
+    """Görev kümesinin toplam kullanımı Σ C_i / T_i"""
+    return sum(task.utilization for task in tasks)
+
+
+def hyperperiod(tasks):
+    """Periyotların en küçük ortak katı"""
+    return math.lcm(*(task.period for task in tasks)) if tasks else 0
+
+
+def liu_layland_bound(n):
+    """n görev için Rate-Monotonic kullanım sınırı n(2^(1/n) - 1)"""
+    return n * (2 ** (1 / n) - 1) if n else 1.0
+
+
+def rms_priority_order(tasks):
+    """Rate-Monotonic öncelik sırası: kısa periyot önce (eşitlikte kısa son tarih, sonra sıra)"""
+    return sorted(range(len(tasks)), key=lambda i: (tasks[i].period, tasks[i].deadline, i))
+
+
+def response_time_analysis(tasks):
+    """
+    Rate-Monotonic öncelikleri için en kötü durum cevap sürelerini hesaplar
+
+    R_i = C_i + Σ_(j daha öncelikli) ⌈R_i / T_j⌉ C_j denklemi sabit noktaya
+    ulaşana veya R_i son tarihi aşana kadar yinelenir. Eşzamanlı başlangıçlı
+    ve son tarihi periyottan büyük olmayan görevler için kesin sonuç verir.
+
+    Parametreler:
+    tasks (list): PeriodicTask listesi
+
+    Dönüş:
+    list: Görev sırasıyla en kötü cevap süresi (son tarihi aşıyorsa None)
+    """
+    response = [None] * len(tasks)
+    higher = []
+    for i in rms_priority_order(tasks):
+        task = tasks[i]
+        current = task.wcet + sum(other.wcet for other in higher)
+        while current <= task.deadline:
+            following = task.wcet + sum(-(-current // other.period) * other.wcet for other in higher)
+            if following == current:
+                response[i] = current
+                break
+            current = following
+        higher.append(task)
+    return response
+
+
+def schedulability_test(tasks, algorithm):
+    """
+    Görev kümesinin seçilen algoritmayla zamanlanabilirliğini sınar
+
+    EDF: son tarihler periyoda eşitse U <= 1 kesin koşuldur; daha kısa son
+    tarihlerde yoğunluk Σ C_i / min(D_i, T_i) <= 1 yeterli koşul olarak
+    kullanılır. RMS: U, Liu-Layland sınırının altındaysa yeterlidir; değilse
+    cevap süresi analizi (RTA) sonucu belirler.
+
+    Parametreler:
+    tasks (list): PeriodicTask listesi
+    algorithm (str): 'edf' veya 'rms'
+
+    Dönüş:
+    dict: 'schedulable', 'utilization', 'test' ve algoritmaya özgü ayrıntılar
+    """
+    utilization = total_utilization(tasks)
+    if algorithm == 'edf':
+        implicit = all(task.deadline >= task.period for task in tasks)
+        density = sum(task.wcet / min(task.deadline, task.period) for task in tasks)
+        return {'schedulable': (utilization if implicit else density) <= 1,
+                'utilization': utilization, 'density': density,
+                'test': 'utilization' if implicit else 'density'}
+    if algorithm == 'rms':
+        bound = liu_layland_bound(len(tasks))
+        response = response_time_analysis(tasks)
+        return {'schedulable': all(r is not None for r in response),
+                'utilization': utilization, 'liu_layland_bound': bound,
+                'within_bound': utilization <= bound, 'response_times': response,
+                'test': 'liu_layland' if utilization <= bound else 'response_time_analysis'}
+    raise ValueError("Bilinmeyen algoritma: {}".format(algorithm))
+
+
+class RealTimeScheduler:
+    """
+    Periyodik/sporadik görev kümesini kesintili EDF veya RMS ile zamanlayan sınıf
+
+    İşler önceden üretilmez: her görevin bir sonraki serbest bırakılma zamanı
+    bir min-heap'te tutulur ve iş, zamanı geldiğinde oluşturulur. Böylece
+    bellek kullanımı görev ve bekleyen iş sayısıyla sınırlı kalır; ufuk
+    hiperperiyottan bağımsız olarak uzun tutulabilir. Hazır işler EDF'de
+    mutlak son tarihe, RMS'de görev önceliğine göre bir min-heap'te sıralanır.
+    """
+
+    def __init__(self, tasks=()):
+        """
+        Parametreler:
+        tasks (iterable): PeriodicTask nesneleri
+        """
+        self.tasks = list(tasks)
+        self.gantt_chart = GanttChart()
+        self.horizon = 0
+        self.current_time = 0
+        self._reset_results()
+
+    def _reset_results(self):
+        """Zamanlama sonuçlarını sıfırlar"""
+        self.algorithm = None
+        self.jobs_released = 0
+        self.lateness = array('q')
+        self.task_jobs = [0] * len(self.tasks)
+        self.task_misses = [0] * len(self.tasks)
+        self.task_max_response = [0] * len(self.tasks)
+
+    def add_task(self, task_id, period, wcet, deadline=None, offset=0, sporadic=False, max_delay=0):
+        """Yeni bir görev ekler"""
+        self.tasks.append(PeriodicTask(task_id, period, wcet, deadline, offset, sporadic, max_delay))
+
+    def default_horizon(self, max_horizon=MAX_HORIZON):
+        """Ufuk: en büyük başlangıç kayması + hiperperiyot (max_horizon ile sınırlı)"""
+        if not self.tasks:
+            return 0
+        offset = max(task.offset for task in self.tasks)
+        return min(offset + hyperperiod(self.tasks), offset + max_horizon)
+
+    def schedule(self, algorithm, horizon=None, seed=None):
+        """
+        Görev kümesini zamanlar ve Gantt şemasını doldurur
+
+        Parametreler:
+        algorithm (str): REALTIME_ALGORITHMS içindeki algoritma adı
+        horizon (int): Bu zamandan önce serbest bırakılan işler zamanlanır
+            (None: default_horizon())
+        seed (int): Sporadik gecikmeler için rastgele tohum
+
+        Dönüş:
+        GanttChart: Gantt şeması (pid = görev ID'si)
+        """
+        self.gantt_chart = GanttChart()
+        append = self.gantt_chart.append
+        for item in self.iter_schedule(algorithm, horizon, seed):
+            append(item)
+        return self.gantt_chart
+
+    def iter_schedule(self, algorithm, horizon=None, seed=None):
+        """
+        Görev kümesini akış modunda zamanlar
+
+        Dilimler üretildikçe döndürülür; self.gantt_chart doldurulmaz. İş
+        başına sonuçlar (gecikme, kaçırılan son tarihler) zamanlama sırasında
+        biriktirilir.
+
+        Dönüş:
+        generator: (görev ID'si, başlangıç, bitiş) dilimleri
+        """
+        if algorithm not in REALTIME_ALGORITHMS:
+            raise ValueError("Bilinmeyen algoritma: {}".format(algorithm))
+        self._reset_results()
+        self.algorithm = algorithm
+        self.horizon = self.default_horizon() if horizon is None else horizon
+        self.current_time = 0
+        return self._iter_jobs(algorithm == 'edf', seed)
+
+    def _iter_jobs(self, edf, seed):
+        """Serbest bırakmaları tembelce açarak kesintili zamanlama dilimlerini üretir"""
+        tasks = self.tasks
+        horizon = self.horizon
+        rng = np.random.default_rng(seed)
+        rank = [0] * len(tasks)
+        for position, i in enumerate(rms_priority_order(tasks)):
+            rank[i] = position
+
+        releases = [(task.offset, i) for i, task in enumerate(tasks)]
+        heapq.heapify(releases)
+        # Hazır iş: [anahtar, sıra, görev, kalan süre, mutlak son tarih, serbest bırakılma]
+        ready = []
+        sequence = 0
+        current_time = 0
+        lateness = self.lateness
+        task_jobs, task_misses = self.task_jobs, self.task_misses
+        task_max_response = self.task_max_response
+
+        while True:
+            # Zamanı gelen işleri serbest bırak ve görevin sonraki varışını planla
+            while releases and releases[0][0] <= current_time and releases[0][0] < horizon:
+                release, i = heapq.heappop(releases)
+                task = tasks[i]
+                deadline = release + task.deadline
+                heapq.heappush(ready, [deadline if edf else rank[i], sequence, i,
+                                       task.wcet, deadline, release])
+                sequence += 1
+                task_jobs[i] += 1
+                following = release + task.period
+                if task.sporadic and task.max_delay:
+                    following += int(rng.integers(0, task.max_delay + 1))
+                heapq.heappush(releases, (following, i))
+
+            next_release = releases[0][0] if releases and releases[0][0] < horizon else None
+            if not ready:
+                if next_release is None:
+                    break
+                current_time = next_release
+                continue
+
+            # En öncelikli iş bir sonraki serbest bırakmaya kadar (kesinti noktası) çalışır
+            job = ready[0]
+            end = current_time + job[3]
+            if next_release is not None and next_release < end:
+                end = next_release
+            yield tasks[job[2]].task_id, current_time, end
+            job[3] -= end - current_time
+            current_time = end
+
+            if job[3] == 0:
+                heapq.heappop(ready)
+                i = job[2]
+                late = current_time - job[4]
+                lateness.append(late)
+                if late > 0:
+                    task_misses[i] += 1
+                task_max_response[i] = max(task_max_response[i], current_time - job[5])
+
+        self.jobs_released = sequence
+        self.current_time = current_time
+
+    def calculate_metrics(self):
+        """
+        Son tarih ve gecikme metriklerini hesaplar
+
+        Gecikme (lateness) = tamamlanma - mutlak son tarih; negatif değer işin
+        erken bittiğini gösterir.
+
+        Dönüş:
+        dict: jobs, deadline_misses, miss_ratio, lateness avg/p50/p90/p99/max,
+            cpu_utilization, horizon, hyperperiod, görev başına 'tasks'
+            (jobs, misses, max_response) ve 'schedulability' test sonucu
+        """
+        lateness = np.frombuffer(self.lateness, dtype=np.int64)
+        jobs = len(lateness)
+        misses = int(np.count_nonzero(lateness > 0))
+        metrics = {'jobs': jobs, 'deadline_misses': misses,
+                   'miss_ratio': misses / jobs if jobs else 0,
+                   'horizon': self.horizon, 'hyperperiod': hyperperiod(self.tasks)}
+        if jobs:
+            p50, p90, p99 = np.percentile(lateness, (50, 90, 99))
+            metrics.update(avg_lateness=float(lateness.mean()), p50_lateness=float(p50),
+                           p90_lateness=float(p90), p99_lateness=float(p99),
+                           max_lateness=float(lateness.max()))
+        else:
+            metrics.update(avg_lateness=0, p50_lateness=0, p90_lateness=0, p99_lateness=0,
+                           max_lateness=0)
+        metrics['cpu_utilization'] = (self.gantt_chart.busy_time() / self.current_time
+                                      if self.current_time and len(self.gantt_chart) else 0)
+        metrics['tasks'] = [{'task_id': task.task_id, 'jobs': jobs_count, 'misses': task_misses,
+                             'max_response': max_response}
+                            for task, jobs_count, task_misses, max_response
+                            in zip(self.tasks, self.task_jobs, self.task_misses,
+                                   self.task_max_response)]
+        if self.algorithm is not None:
+            metrics['schedulability'] = schedulability_test(self.tasks, self.algorithm)
+        return metrics
+
+    def lateness_histogram(self, bins=20):
+        """
+        Gecikme dağılımının histogramı
+
+        Dönüş:
+        tuple: (sayılar, kenarlar) np.histogram çıktısı
+        """
+        return np.histogram(np.frombuffer(self.lateness, dtype=np.int64), bins=bins)
@@ -3,13 +3,171 @@ CPU Zamanlama Algoritmaları
 Bu modül, çeşitli CPU zamanlama algoritmalarını içerir.
 """
 
+import heapq
+from collections import deque
+
+import numpy as np
+
+from cpu_scheduler.gantt import CACHE_WARMUP_PID, CONTEXT_SWITCH_PID, GanttChart
+from cpu_scheduler.process_table import ProcessTable
+from cpu_scheduler.workloads import Workload, stable_argsort
+
+
+# schedule() ve iter_schedule() ile çalıştırılabilen algoritmalar
+ALGORITHMS = ('fcfs', 'sjf', 'round_robin', 'priority', 'mlfq', 'cfs', 'lottery', 'stride')
+
+# CFS: nice -20..19 için Linux sched_prio_to_weight tablosu (nice 0 -> 1024)
+NICE_TO_WEIGHT = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+NICE_0_WEIGHT = 1024
+
+# Stride zamanlamasında adım = STRIDE1 // bilet sayısı
+STRIDE1 = 1 << 20
+
+
+def _merge_slices(slices):
+    """Akan dilimlerde aynı prosesin bitişik dilimlerini birleştirir"""
+    pending = None
+    for pid, start, end in slices:
+        if pending is not None and pending[0] == pid and pending[2] == start:
+            pending = (pid, pending[1], end)
+            continue
+        if pending is not None:
+            yield pending
+        pending = (pid, start, end)
+    if pending is not None:
+        yield pending
+
+
+def fcfs_closed_form(arrival, burst, order=None):
+    """
+    FCFS zamanlamasını kapalı formda hesaplar
+    
+    Varış sırasına dizilmiş prosesler için b_i işlem süreleri ve S_i = b_0 + ... + b_(i-1)
+    önek toplamı olmak üzere başlangıç zamanı
+    start_i = max(0, max_(j<=i)(a_j - S_j)) + S_i
+    olur; bu da np.maximum.accumulate ile tek geçişte bulunur.
+    
+    Parametreler:
+    arrival (ndarray): Varış zamanları
+    burst (ndarray): İşlem süreleri
+    order (ndarray): Önceden hesaplanmış kararlı varış sırası (isteğe bağlı;
+        slice(None) girdinin zaten varış sırasında olduğunu belirtir)
+    
+    Dönüş:
+    tuple: (order, start, completion) - varış sırası ve bu sıradaki başlangıç/bitiş zamanları
+    """
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+    
+    if order is None:
+        order = stable_argsort(arrival)
+    sorted_arrival, sorted_burst = arrival[order], burst[order]
+    
+    # Ara diziler yerinde güncellenir; büyük izlerde bellek ayırma maliyeti baskındır
+    completion = np.cumsum(sorted_burst)
+    preceding = completion - sorted_burst
+    start = np.subtract(sorted_arrival, preceding)
+    np.maximum.accumulate(start, out=start)
+    np.maximum(start, 0, out=start)
+    start += preceding
+    np.add(start, sorted_burst, out=completion)
+    return order, start, completion
+
+
+def switch_overhead(time, context_switch=0, cache_warmup=0, resumed=False):
+    """
+    Bir proses CPU'ya atanırken ödenen ek yük dilimlerini hesaplar
+    
+    Motorlar, CPU son çalışan prosesten farklı bir prosese geçtiğinde önce
+    context_switch süresince bağlam değiştirir; daha önce çalışmış ve
+    kesilmiş bir proses devam ediyorsa ardından cache_warmup süresince
+    önbelleğini ısıtır. Proses ancak bu dilimlerden sonra çalışmaya başlar.
+    
+    Parametreler:
+    time (int): Atama zamanı
+    context_switch (int): Bağlam değiştirme süresi
+    cache_warmup (int): Önbellek ısınma süresi
+    resumed (bool): Proses daha önce çalışmış mı (değilse ısınma ödenmez)
+    
+    Dönüş:
+    tuple: (ek yük dilimleri listesi, prosesin çalışmaya başladığı zaman)
+    """
+    if context_switch < 0 or cache_warmup < 0:
+        raise ValueError("Ek yük süreleri negatif olamaz")
+    slices = []
+    if context_switch:
+        slices.append((CONTEXT_SWITCH_PID, time, time + context_switch))
+        time += context_switch
+    if cache_warmup and resumed:
+        slices.append((CACHE_WARMUP_PID, time, time + cache_warmup))
+        time += cache_warmup
+    return slices, time
+
+
+def priority_tickets(priority):
+    """
+    Öncelikten orantılı paylaşım bilet sayısını türetir
+    
+    Öncelik, CFS'deki gibi nice değeri olarak yorumlanır; bilet sayısı
+    nice -> ağırlık tablosundaki ağırlıktır (öncelik 0 -> 1024 bilet, her
+    seviye yaklaşık 1.25 kat fark).
+    """
+    return NICE_TO_WEIGHT[min(max(priority, -20), 19) + 20]
+
+
+class TicketTree:
+    """
+    Bilet sayıları üzerinde Fenwick (ikili indeksli) ağaç
+    
+    Bir prosesin bilet sayısını değiştirmek ve r. bileti tutan prosesi
+    bulmak O(log n) sürer; piyango çekilişi doğrusal tarama gerektirmez.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.total = 0
+        self.top = 1 << size.bit_length() if size else 0
+    
+    def add(self, index, tickets):
+        """index konumundaki bilet sayısına tickets ekler (negatif: çıkarır)"""
+        self.total += tickets
+        index += 1
+        tree = self.tree
+        while index <= self.size:
+            tree[index] += tickets
+            index += index & -index
+    
+    def find(self, ticket):
+        """0 <= ticket < total için, önek toplamı ticket'ı aşan ilk konumu döndürür"""
+        position = 0
+        step = self.top
+        tree = self.tree
+        while step:
+            following = position + step
+            if following <= self.size and tree[following] <= ticket:
+                position = following
+                ticket -= tree[following]
+            step >>= 1
+        return position
+
+
 class Process:
     """Proses bilgilerini temsil eden sınıf"""
-    def __init__(self, pid, arrival_time, burst_time, priority=0):
+    def __init__(self, pid, arrival_time, burst_time, priority=0, affinity=None):
         self.pid = pid  # Proses ID
         self.arrival_time = arrival_time  # Varış zamanı
         self.burst_time = burst_time  # İşlem süresi
         self.priority = priority  # Öncelik (düşük değer, yüksek öncelik)
+        self.affinity = affinity  # İzin verilen çekirdeklerin bit maskesi (None: tümü)
         self.remaining_time = burst_time  # Kalan işlem süresi
         self.completion_time = 0  # Tamamlanma zamanı
         self.waiting_time = 0  # Bekleme süresi
@@ -22,17 +180,139 @@ class Process:
 
 class CPUScheduler:
     """Ana zamanlayıcı sınıf"""
-    def __init__(self):
+    def __init__(self, columnar=False):
+        """
+        Parametreler:
+        columnar (bool): True ise prosesler Process nesneleri yerine
+            sütunlu bir ProcessTable içinde saklanır (büyük iş yükleri için)
+        """
         self.processes = []
-        self.gantt_chart = []
+        self.table = ProcessTable() if columnar else None
+        self.gantt_chart = GanttChart()
         self.current_time = 0
+        # Proses kümesinin önbelleğe alınmış sıralamaları (bkz. workload)
+        self._workload = None
+        # Sütunlu modda çekirdek yakınlığı maskeleri (pid -> bit maskesi; yalnızca kısıtlı prosesler)
+        self._affinity = {}
     
-    def add_process(self, pid, arrival_time, burst_time, priority=0):
-        """Yeni bir proses ekler"""
-        self.processes.append(Process(pid, arrival_time, burst_time, priority))
+    @classmethod
+    def from_workload(cls, workload):
+        """
+        Paylaşılan bir iş yükünden sütunlu zamanlayıcı oluşturur
+        
+        İş yükünün önbelleğe alınmış sıralamaları yeniden hesaplanmaz; aynı
+        Workload ile oluşturulan zamanlayıcılar hazırlık maliyetini paylaşır.
+        
+        Parametreler:
+        workload (Workload): İş yükü
+        
+        Dönüş:
+        CPUScheduler: Yeni zamanlayıcı
+        """
+        scheduler = cls(columnar=True)
+        scheduler.table.extend(workload.as_arrays())
+        scheduler._workload = workload
+        return scheduler
+    
+    @property
+    def workload(self):
+        """
+        Mevcut proseslerin Workload görünümü
+        
+        İlk erişimde oluşturulur ve proses eklenene kadar önbellekte kalır;
+        tüm algoritmalar girdilerini ve varış/işlem süresi/öncelik
+        sıralamalarını buradan alır.
+        """
+        if self._workload is None:
+            if self.table is not None:
+                table = self.table
+                self._workload = Workload(table.pid, table.arrival, table.burst, table.priority)
+            else:
+                processes = self.processes
+                self._workload = Workload([p.pid for p in processes],
+                                          [p.arrival_time for p in processes],
+                                          [p.burst_time for p in processes],
+                                          [p.priority for p in processes])
+        return self._workload
+    
+    def add_process(self, pid, arrival_time, burst_time, priority=0, affinity=None):
+        """Yeni bir proses ekler (affinity: SMP'de izin verilen çekirdeklerin bit maskesi)"""
+        self._workload = None
+        if self.table is not None:
+            self.table.append(pid, arrival_time, burst_time, priority)
+            if affinity is not None:
+                self._affinity[pid] = affinity
+        else:
+            self.processes.append(Process(pid, arrival_time, burst_time, priority, affinity))
+    
+    def set_affinity(self, pid, affinity):
+        """
+        Prosesin çekirdek yakınlığı maskesini ayarlar
+        
+        Parametreler:
+        pid (int): Proses ID'si
+        affinity (int): Bit c'si 1 olan çekirdeklerde çalışabilir (None: tümü)
+        """
+        if self.table is not None:
+            if not np.any(self.table.pid == pid):
+                raise ValueError("Proses bulunamadı: {}".format(pid))
+            if affinity is None:
+                self._affinity.pop(pid, None)
+            else:
+                self._affinity[pid] = affinity
+            return
+        for process in self.processes:
+            if process.pid == pid:
+                process.affinity = affinity
+                return
+        raise ValueError("Proses bulunamadı: {}".format(pid))
+    
+    def affinity_masks(self):
+        """
+        Proses başına çekirdek yakınlığı maskeleri
+        
+        Dönüş:
+        list: Proses sırasıyla bit maskeleri (None: tüm çekirdekler)
+        """
+        if self.table is not None:
+            if not self._affinity:
+                return [None] * len(self.table)
+            return [self._affinity.get(pid) for pid in self.table.pid.tolist()]
+        return [process.affinity for process in self.processes]
+    
+    def add_processes(self, arrays):
+        """
+        Prosesleri sütun dizilerinden toplu olarak ekler
+        
+        Zamanlayıcı henüz sütunlu değilse mevcut prosesler tabloya taşınır.
+        
+        Parametreler:
+        arrays (dict veya yapılandırılmış ndarray): 'pid', 'arrival_time',
+            'burst_time' ve 'priority' dizileri (pid ve priority isteğe bağlı)
+        
+        Dönüş:
+        int: Eklenen proses sayısı
+        """
+        self._workload = None
+        if self.table is None:
+            self.table = ProcessTable(capacity=max(len(self.processes), 1))
+            for process in self.processes:
+                self.table.append(process.pid, process.arrival_time,
+                                  process.burst_time, process.priority)
+                if process.affinity is not None:
+                    self._affinity[process.pid] = process.affinity
+            self.processes = []
+        return self.table.extend(arrays)
+    
+    def process_count(self):
+        """Zamanlayıcıdaki proses sayısını döndürür"""
+        return len(self.table) if self.table is not None else len(self.processes)
     
     def reset(self):
         """Zamanlayıcıyı sıfırlar"""
+        if self.table is not None:
+            self.table.reset()
+        
         for process in self.processes:
             process.remaining_time = process.burst_time
             process.completion_time = 0
@@ -40,266 +320,870 @@ class CPUScheduler:
             process.turnaround_time = 0
             process.response_time = -1
         
-        self.gantt_chart = []
+        self.gantt_chart = GanttChart()
         self.current_time = 0
     
     def calculate_metrics(self):
         """Performans metriklerini hesaplar"""
+        # Sütunlu tabloda bekleme ve toplam işlem süreleri gerektiğinde türetilir
         for process in self.processes:
             process.turnaround_time = process.completion_time - process.arrival_time
             process.waiting_time = process.turnaround_time - process.burst_time
     
     def get_average_waiting_time(self):
         """Ortalama bekleme süresini hesaplar"""
+        if self.table is not None:
+            return float(self.table.waiting_time().mean()) if len(self.table) else 0
         total_waiting_time = sum(process.waiting_time for process in self.processes)
         return total_waiting_time / len(self.processes) if self.processes else 0
     
     def get_average_turnaround_time(self):
         """Ortalama toplam işlem süresini hesaplar"""
+        if self.table is not None:
+            return float(self.table.turnaround_time().mean()) if len(self.table) else 0
         total_turnaround_time = sum(process.turnaround_time for process in self.processes)
         return total_turnaround_time / len(self.processes) if self.processes else 0
     
     def get_average_response_time(self):
         """Ortalama cevap süresini hesaplar"""
+        if self.table is not None:
+            if not len(self.table):
+                return 0
+            responded = self.table.response != -1
+            delays = self.table.response[responded] - self.table.arrival[responded]
+            return float(delays.sum()) / len(self.table)
         total_response_time = sum(process.response_time - process.arrival_time 
                                   for process in self.processes if process.response_time != -1)
         return total_response_time / len(self.processes) if self.processes else 0
     
-    def schedule_fcfs(self):
-        """First-Come-First-Serve zamanlama algoritması"""
-        # Prosesleri varış zamanına göre sırala
-        sorted_processes = sorted(self.processes, key=lambda p: p.arrival_time)
+    def _input_columns(self):
+        """
+        Zamanlama girdilerini Python listeleri olarak döndürür
         
-        self.reset()
-        self.current_time = 0
+        Motorlar her iki depolama biçiminde de aynı listeler üzerinde çalışır;
+        Python döngülerinde liste erişimi NumPy skaler erişiminden hızlıdır.
+        Listeler iş yüküyle paylaşılır, değiştirilecekse kopyalanmalıdır.
         
-        for process in sorted_processes:
-            # Eğer proses henüz varmadıysa, zamanı prosesin varış zamanına ayarla
-            if self.current_time < process.arrival_time:
-                self.current_time = process.arrival_time
-            
-            # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
-            if process.response_time == -1:
-                process.response_time = self.current_time
-            
-            # Gantt şemasına ekle
-            self.gantt_chart.append((process.pid, self.current_time, self.current_time + process.burst_time))
-            
-            # Proses tamamlanma zamanını güncelle
-            self.current_time += process.burst_time
-            process.completion_time = self.current_time
-            process.remaining_time = 0
+        Dönüş:
+        tuple: (pid, arrival, burst, priority) listeleri
+        """
+        return self.workload.columns_list
+    
+    def _input_arrays(self):
+        """
+        Zamanlama girdilerini int64 NumPy dizileri olarak döndürür
+        
+        Dönüş:
+        tuple: (pid, arrival, burst, priority) dizileri
+        """
+        workload = self.workload
+        return workload.pid, workload.arrival, workload.burst, workload.priority
+    
+    def _store_results(self, completion, response):
+        """
+        Motorun ürettiği tamamlanma ve ilk atama zamanlarını kaydeder
+        
+        Parametreler:
+        completion (list): Proses başına tamamlanma zamanı
+        response (list): Proses başına ilk CPU ataması zamanı
+        """
+        if self.table is not None:
+            self.table.completion[:] = completion
+            self.table.response[:] = response
+            self.table.remaining[:] = 0
+        else:
+            for process, completion_time, response_time in zip(self.processes, completion, response):
+                process.completion_time = completion_time
+                process.response_time = response_time
+                process.remaining_time = 0
         
         # Metrikleri hesapla
         self.calculate_metrics()
-        return self.gantt_chart
     
-    def schedule_sjf(self, preemptive=False):
+    def snapshot(self):
         """
-        Shortest Job First zamanlama algoritması
-        preemptive=False: Non-preemptive SJF (SRTF)
-        preemptive=True: Preemptive SJF (SRTF)
+        Son zamanlamanın sonuçlarını dizi olarak döndürür
+        
+        Dönüş:
+        dict: Gantt dizileri, proses başına tamamlanma/ilk atama zamanları ve current_time
+        """
+        gantt_pid, gantt_start, gantt_end = self.gantt_chart.as_arrays()
+        if self.table is not None:
+            completion = self.table.completion.copy()
+            response = self.table.response.copy()
+        else:
+            completion = np.array([p.completion_time for p in self.processes], dtype=np.int64)
+            response = np.array([p.response_time for p in self.processes], dtype=np.int64)
+        return {'gantt_pid': gantt_pid, 'gantt_start': gantt_start, 'gantt_end': gantt_end,
+                'completion': completion, 'response': response,
+                'current_time': self.current_time}
+    
+    def restore(self, snapshot):
         """
-        # Orijinal proses listesini klonla ve tüm prosesleri sıfırla
+        snapshot() ile alınmış sonuçları aynı proses kümesine geri yükler
+        
+        Parametreler:
+        snapshot (dict): snapshot() çıktısı
+        """
+        if len(snapshot['completion']) != self.process_count():
+            raise ValueError("Anlık görüntü proses sayısı eşleşmiyor")
         self.reset()
+        self._store_results(np.asarray(snapshot['completion']).tolist(),
+                            np.asarray(snapshot['response']).tolist())
+        self.gantt_chart = GanttChart.from_arrays(snapshot['gantt_pid'], snapshot['gantt_start'],
+                                                  snapshot['gantt_end'])
+        self.current_time = int(snapshot['current_time'])
+    
+    def schedule(self, algorithm, **params):
+        """
+        Adı verilen algoritmayı çalıştırır
         
-        remaining_processes = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) 
-                              for p in self.processes]
+        Parametreler:
+        algorithm (str): ALGORITHMS içindeki algoritma adı
+        **params: Algoritmaya özgü parametreler (preemptive, time_quantum ...);
+            tüm algoritmalar context_switch ve cache_warmup ek yük sürelerini
+            de kabul eder (bkz. switch_overhead)
         
-        self.current_time = 0
+        Dönüş:
+        GanttChart: Gantt şeması
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError("Bilinmeyen algoritma: {}".format(algorithm))
+        return getattr(self, 'schedule_' + algorithm)(**params)
+    
+    def iter_schedule(self, algorithm, **params):
+        """
+        Algoritmayı akış modunda çalıştırır
         
-        # Tüm prosesler tamamlanana kadar
-        while remaining_processes:
-            # Varış zamanı şu anki zamandan küçük veya eşit olan prosesleri al
-            available_processes = [p for p in remaining_processes if p.arrival_time <= self.current_time]
-            
-            if not available_processes:
-                # Eğer şu anda işlenebilecek proses yoksa, zamanı bir sonraki prosesin varış zamanına ayarla
-                next_arrival = min(p.arrival_time for p in remaining_processes)
-                self.current_time = next_arrival
-                continue
-            
-            # Kalan işlem süresine göre sırala (en kısa işlem önce)
-            available_processes.sort(key=lambda p: p.remaining_time)
-            
-            # En kısa işlemi seç
-            shortest_process = available_processes[0]
-            
-            # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
-            original_process = next(p for p in self.processes if p.pid == shortest_process.pid)
-            if original_process.response_time == -1:
-                original_process.response_time = self.current_time
-            
-            if preemptive:
-                # Preemptive SJF (SRTF) - Kesinti olabilir
-                next_arrival = float('inf')
-                for p in remaining_processes:
-                    if p.arrival_time > self.current_time and p.arrival_time < next_arrival:
-                        next_arrival = p.arrival_time
-                
-                # Ya proses tamamlanana kadar ya da bir sonraki proses varışına kadar çalıştır
-                run_time = min(shortest_process.remaining_time, 
-                              next_arrival - self.current_time if next_arrival != float('inf') else shortest_process.remaining_time)
-                
-                # Gantt şemasına ekle
-                self.gantt_chart.append((shortest_process.pid, self.current_time, self.current_time + run_time))
-                
-                # Zamanı ve kalan işlem süresini güncelle
-                self.current_time += run_time
-                shortest_process.remaining_time -= run_time
-                
-                # Proses tamamlandıysa
-                if shortest_process.remaining_time == 0:
-                    original_process.completion_time = self.current_time
-                    remaining_processes.remove(shortest_process)
-            else:
-                # Non-preemptive SJF - Kesinti olmaz
-                # Gantt şemasına ekle
-                self.gantt_chart.append((shortest_process.pid, self.current_time, 
-                                       self.current_time + shortest_process.remaining_time))
-                
-                # Zamanı güncelle ve prosesi tamamlandı olarak işaretle
-                self.current_time += shortest_process.remaining_time
-                original_process.completion_time = self.current_time
-                remaining_processes.remove(shortest_process)
+        Dilimler üretildikçe (birleştirilmiş olarak) döndürülür ve
+        self.gantt_chart doldurulmaz; böylece çok uzun zaman çizelgeleri
+        bellekte tutulmadan diske veya grafiğe aktarılabilir. Proses başına
+        sonuçlar ve current_time, üreteç tükendiğinde kaydedilir.
         
-        # Metrikleri hesapla
-        self.calculate_metrics()
+        Parametreler:
+        algorithm (str): ALGORITHMS içindeki algoritma adı
+        **params: Algoritmaya özgü parametreler
+        
+        Dönüş:
+        generator: (pid, başlangıç, bitiş) dilimleri
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError("Bilinmeyen algoritma: {}".format(algorithm))
+        self.reset()
+        return _merge_slices(getattr(self, '_iter_' + algorithm)(**params))
+    
+    def _collect(self, slices):
+        """Dilim üretecini tüketerek Gantt şemasını doldurur"""
+        append = self.gantt_chart.append
+        for item in slices:
+            append(item)
         return self.gantt_chart
     
-    def schedule_round_robin(self, time_quantum):
-        """Round Robin zamanlama algoritması"""
-        # Prosesleri sıfırla
+    def schedule_fcfs(self, context_switch=0, cache_warmup=0):
+        """
+        First-Come-First-Serve zamanlama algoritması
+        
+        Kapalı form ile vektörel olarak hesaplanır (bkz. fcfs_closed_form).
+        Her proses bir kez atanıp kesintisiz çalıştığından her atamada
+        yalnızca bağlam değiştirme ödenir; cache_warmup hiç uygulanmaz.
+        """
         self.reset()
+        self.gantt_chart = GanttChart.from_arrays(*self._fcfs_arrays(context_switch, cache_warmup))
+        return self.gantt_chart
+    
+    def _fcfs_arrays(self, context_switch=0, cache_warmup=0):
+        """
+        FCFS sonucunu hesaplayıp kaydeder
         
-        # Varış zamanlarına göre sıralanmış kuyruk
-        queue = []
-        remaining_processes = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) 
-                              for p in self.processes]
+        Bağlam değiştirme süresi, işlem süresine eklenmiş gibi kapalı forma
+        katılır; her prosesin bloğunun başındaki bu kısım ek yük dilimidir.
         
-        self.current_time = 0
+        Dönüş:
+        tuple: Çalışma sırasındaki (pid, başlangıç, bitiş) dizileri
+        """
+        if context_switch < 0 or cache_warmup < 0:
+            raise ValueError("Ek yük süreleri negatif olamaz")
+        pids, arrival, burst, _ = self._input_arrays()
+        # Varışa göre sıralı izlerde indeksleme yerine görünümler kullanılır
+        workload = self.workload
+        order = slice(None) if workload.arrival_sorted else workload.arrival_order
+        if context_switch:
+            burst = burst + context_switch
+        order, start, completion = fcfs_closed_form(arrival, burst, order)
+        switch_start = start
+        if context_switch:
+            start = start + context_switch
+        
+        if self.table is not None:
+            self.table.completion[order] = completion
+            self.table.response[order] = start
+            self.table.remaining[:] = 0
+        else:
+            response_times = np.empty_like(start)
+            completion_times = np.empty_like(completion)
+            response_times[order] = start
+            completion_times[order] = completion
+            self._store_results(completion_times.tolist(), response_times.tolist())
+        
+        self.current_time = int(completion[-1]) if len(completion) else 0
+        if not context_switch:
+            return pids[order], start, completion
+        # Her prosesten önce bir bağlam değiştirme dilimi
+        switch_pids = np.full(len(start), CONTEXT_SWITCH_PID, dtype=np.int64)
+        return (np.column_stack((switch_pids, pids[order])).ravel(),
+                np.column_stack((switch_start, start)).ravel(),
+                np.column_stack((start, completion)).ravel())
+    
+    def _iter_fcfs(self, context_switch=0, cache_warmup=0, chunk_size=65536):
+        """FCFS dilimlerini parça parça üretir"""
+        pids, start, completion = self._fcfs_arrays(context_switch, cache_warmup)
+        for offset in range(0, len(pids), chunk_size):
+            end = offset + chunk_size
+            yield from zip(pids[offset:end].tolist(), start[offset:end].tolist(),
+                           completion[offset:end].tolist())
+    
+    def schedule_sjf(self, preemptive=False, context_switch=0, cache_warmup=0):
+        """
+        Shortest Job First zamanlama algoritması
+        preemptive=False: Non-preemptive SJF
+        preemptive=True: Preemptive SJF (SRTF)
+        context_switch, cache_warmup: Ek yük süreleri (bkz. switch_overhead)
+        """
+        self.reset()
+        return self._collect(self._iter_sjf(preemptive, context_switch, cache_warmup))
+    
+    def _iter_sjf(self, preemptive=False, context_switch=0, cache_warmup=0):
+        """SJF/SRTF dilimlerini üretir"""
+        return self._iter_heap('remaining_time', preemptive, context_switch, cache_warmup)
+    
+    def schedule_round_robin(self, time_quantum, context_switch=0, cache_warmup=0):
+        """
+        Round Robin zamanlama algoritması
+        
+        Hazır kuyruk bir deque'dur; yeni varışlar varış zamanına göre bir kez
+        sıralanmış listedeki bir imleçle alınır. Böylece toplam maliyet bir
+        sıralama artı dilim sayısıyla orantılıdır. context_switch ve
+        cache_warmup ek yük süreleridir (bkz. switch_overhead); küçük zaman
+        dilimlerinin gerçek maliyeti ancak bunlarla görünür.
+        """
+        self.reset()
+        return self._collect(self._iter_round_robin(time_quantum, context_switch, cache_warmup))
+    
+    def _iter_round_robin(self, time_quantum, context_switch=0, cache_warmup=0):
+        """Round Robin dilimlerini üretir"""
+        if time_quantum < 1:
+            raise ValueError("Zaman dilimi en az 1 olmalıdır")
+        pids, arrival, burst, _ = self._input_columns()
+        n = len(pids)
+        remaining = list(burst)
+        completion = [0] * n
+        response = [-1] * n
+        order = self.workload.arrival_order_list
+        
+        queue = deque()
+        cursor = 0
+        current_time = 0
+        last = -1
+        
+        def admit_arrivals(cursor):
+            """Varış zamanı gelmiş prosesleri ekleme sırasıyla kuyruğa ekler"""
+            first = cursor
+            while cursor < n and arrival[order[cursor]] <= current_time:
+                cursor += 1
+            if cursor - first == 1:
+                queue.append(order[first])
+            elif cursor > first:
+                queue.extend(sorted(order[first:cursor]))
+            return cursor
         
         # Tüm prosesler tamamlanana kadar
-        while remaining_processes or queue:
-            # Varış zamanı şu anki zamandan küçük veya eşit olan yeni prosesleri kuyruğa ekle
-            new_arrivals = [p for p in remaining_processes if p.arrival_time <= self.current_time]
-            for process in new_arrivals:
-                queue.append(process)
-                remaining_processes.remove(process)
+        while cursor < n or queue:
+            cursor = admit_arrivals(cursor)
             
             if not queue:
-                # Eğer kuyruk boşsa, zamanı bir sonraki prosesin varış zamanına ayarla
-                if remaining_processes:
-                    next_arrival = min(p.arrival_time for p in remaining_processes)
-                    self.current_time = next_arrival
+                # Kuyruk boşsa zamanı bir sonraki prosesin varış zamanına ayarla
+                current_time = arrival[order[cursor]]
                 continue
             
             # Kuyruktan bir proses al
-            current_process = queue.pop(0)
+            index = queue.popleft()
+            
+            # Başka bir prosese geçişte bağlam değiştirme ve önbellek ısınma maliyeti
+            if index != last and (context_switch or cache_warmup):
+                overhead, current_time = switch_overhead(current_time, context_switch, cache_warmup,
+                                                         response[index] != -1)
+                yield from overhead
+            last = index
             
             # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
-            original_process = next(p for p in self.processes if p.pid == current_process.pid)
-            if original_process.response_time == -1:
-                original_process.response_time = self.current_time
+            if response[index] == -1:
+                response[index] = current_time
             
             # Prosesin kalan işlem süresine göre çalışma süresini belirle
-            run_time = min(time_quantum, current_process.remaining_time)
+            run_time = min(time_quantum, remaining[index])
             
-            # Gantt şemasına ekle
-            self.gantt_chart.append((current_process.pid, self.current_time, self.current_time + run_time))
+            yield pids[index], current_time, current_time + run_time
             
             # Zamanı ve kalan işlem süresini güncelle
-            self.current_time += run_time
-            current_process.remaining_time -= run_time
+            current_time += run_time
+            remaining[index] -= run_time
             
-            # Varış zamanı şu anki zamandan küçük veya eşit olan yeni prosesleri kuyruğa ekle
-            new_arrivals = [p for p in remaining_processes if p.arrival_time <= self.current_time]
-            for process in new_arrivals:
-                queue.append(process)
-                remaining_processes.remove(process)
+            # Dilim sırasında gelen prosesler, kesilen prosesten önce kuyruğa girer
+            cursor = admit_arrivals(cursor)
             
             # Proses tamamlanmadıysa, tekrar kuyruğa ekle
-            if current_process.remaining_time > 0:
-                queue.append(current_process)
+            if remaining[index] > 0:
+                queue.append(index)
             else:
                 # Proses tamamlandı
-                original_process.completion_time = self.current_time
+                completion[index] = current_time
         
-        # Metrikleri hesapla
-        self.calculate_metrics()
-        return self.gantt_chart
+        self.current_time = current_time
+        self._store_results(completion, response)
     
-    def schedule_priority(self, preemptive=False):
+    def schedule_priority(self, preemptive=False, context_switch=0, cache_warmup=0):
         """
         Priority zamanlama algoritması
         preemptive=False: Non-preemptive Priority
         preemptive=True: Preemptive Priority
+        context_switch, cache_warmup: Ek yük süreleri (bkz. switch_overhead)
         """
-        # Prosesleri sıfırla
         self.reset()
+        return self._collect(self._iter_priority(preemptive, context_switch, cache_warmup))
+    
+    def _iter_priority(self, preemptive=False, context_switch=0, cache_warmup=0):
+        """Priority dilimlerini üretir"""
+        return self._iter_heap('priority', preemptive, context_switch, cache_warmup)
+    
+    def _iter_heap(self, key, preemptive, context_switch=0, cache_warmup=0):
+        """
+        SJF, SRTF ve Priority için ortak olay güdümlü motor
         
-        remaining_processes = [Process(p.pid, p.arrival_time, p.burst_time, p.priority) 
-                              for p in self.processes]
+        Prosesler iş yükünün önbelleğe alınmış varış sırasıyla bir imleç
+        üzerinden hazır kuyruğa alınır. Hazır kuyruk bir min-heap'tir. Anahtar
+        değişmiyorsa (Priority ve kesintisiz SJF) heap'te iş yükünün
+        (anahtar, indeks) sırası tutulur ve sıradan indekse doğrudan dönülür;
+        SRTF'de kalan süre değiştiği için (kalan süre, indeks) çiftleri
+        kullanılır. İndeks proses deposundaki konumdur, bu sayede sonuçlar
+        aramadan yazılır ve eşit anahtarlarda ekleme sırası korunur. Toplam
+        maliyet O(n log n) olur.
         
-        self.current_time = 0
+        Parametreler:
+        key (str): Seçim anahtarı ('remaining_time' veya 'priority')
+        preemptive (bool): Yeni varışlarda kesinti yapılıp yapılmayacağı
+        context_switch (int): Bağlam değiştirme süresi
+        cache_warmup (int): Kesilmiş proses devam ederken önbellek ısınma süresi
+        
+        Dönüş:
+        generator: (pid, başlangıç, bitiş) dilimleri
+        """
+        workload = self.workload
+        pids, arrival, burst, _ = self._input_columns()
+        n = len(pids)
+        remaining = list(burst)
+        completion = [0] * n
+        response = [-1] * n
+        
+        # Değişmeyen anahtarlar için önceden hesaplanmış sıralar
+        if key == 'priority':
+            rank, by_rank = workload.priority_rank_list, workload.priority_order_list
+        elif not preemptive:
+            rank, by_rank = workload.burst_rank_list, workload.burst_order_list
+        else:
+            rank = by_rank = None
+        
+        # Varış sırası (kararlı sıralama: eşit varışlarda ekleme sırası)
+        order = workload.arrival_order_list
+        cursor = 0
+        ready = []
+        current_time = 0
+        last = -1
         
         # Tüm prosesler tamamlanana kadar
-        while remaining_processes:
-            # Varış zamanı şu anki zamandan küçük veya eşit olan prosesleri al
-            available_processes = [p for p in remaining_processes if p.arrival_time <= self.current_time]
-            
-            if not available_processes:
-                # Eğer şu anda işlenebilecek proses yoksa, zamanı bir sonraki prosesin varış zamanına ayarla
-                next_arrival = min(p.arrival_time for p in remaining_processes)
-                self.current_time = next_arrival
+        while cursor < n or ready:
+            # Varış zamanı gelmiş prosesleri hazır kuyruğa ekle
+            while cursor < n and arrival[order[cursor]] <= current_time:
+                index = order[cursor]
+                cursor += 1
+                heapq.heappush(ready, rank[index] if rank is not None else (remaining[index], index))
+            
+            if not ready:
+                # İşlenebilecek proses yoksa zamanı bir sonraki varışa ilerlet
+                current_time = arrival[order[cursor]]
                 continue
             
-            # Önceliğe göre sırala (düşük değer, yüksek öncelik)
-            available_processes.sort(key=lambda p: p.priority)
+            entry = heapq.heappop(ready)
+            index = by_rank[entry] if rank is not None else entry[1]
             
-            # En yüksek öncelikli prosesi seç
-            highest_priority_process = available_processes[0]
+            # Başka bir prosese geçişte bağlam değiştirme ve önbellek ısınma maliyeti
+            if index != last and (context_switch or cache_warmup):
+                overhead, current_time = switch_overhead(current_time, context_switch, cache_warmup,
+                                                         response[index] != -1)
+                yield from overhead
+            last = index
             
             # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
-            original_process = next(p for p in self.processes if p.pid == highest_priority_process.pid)
-            if original_process.response_time == -1:
-                original_process.response_time = self.current_time
-            
-            if preemptive:
-                # Preemptive Priority - Kesinti olabilir
-                next_event_time = float('inf')
-                
-                # Bir sonraki proses varış zamanını bul
-                for p in remaining_processes:
-                    if p.arrival_time > self.current_time and p.arrival_time < next_event_time:
-                        next_event_time = p.arrival_time
-                
-                # Ya proses tamamlanana kadar ya da bir sonraki proses varışına kadar çalıştır
-                run_time = min(highest_priority_process.remaining_time, 
-                              next_event_time - self.current_time if next_event_time != float('inf') else highest_priority_process.remaining_time)
-                
-                # Gantt şemasına ekle
-                self.gantt_chart.append((highest_priority_process.pid, self.current_time, self.current_time + run_time))
-                
-                # Zamanı ve kalan işlem süresini güncelle
-                self.current_time += run_time
-                highest_priority_process.remaining_time -= run_time
-                
-                # Proses tamamlandıysa
-                if highest_priority_process.remaining_time == 0:
-                    original_process.completion_time = self.current_time
-                    remaining_processes.remove(highest_priority_process)
+            if response[index] == -1:
+                response[index] = current_time
+            
+            # Kesintili modda bir sonraki varışa kadar, aksi halde sonuna kadar çalıştır;
+            # geçiş ek yükü sırasında gelenler bir sonraki seçimde değerlendirilir
+            run_time = remaining[index]
+            if preemptive and cursor < n:
+                upcoming = cursor
+                while upcoming < n and arrival[order[upcoming]] <= current_time:
+                    upcoming += 1
+                if upcoming < n:
+                    run_time = min(run_time, arrival[order[upcoming]] - current_time)
+            
+            yield pids[index], current_time, current_time + run_time
+            current_time += run_time
+            remaining[index] -= run_time
+            
+            if remaining[index] == 0:
+                completion[index] = current_time
             else:
-                # Non-preemptive Priority - Kesinti olmaz
-                # Gantt şemasına ekle
-                self.gantt_chart.append((highest_priority_process.pid, self.current_time, 
-                                      self.current_time + highest_priority_process.remaining_time))
-                
-                # Zamanı güncelle ve prosesi tamamlandı olarak işaretle
-                self.current_time += highest_priority_process.remaining_time
-                original_process.completion_time = self.current_time
-                remaining_processes.remove(highest_priority_process)
+                heapq.heappush(ready, rank[index] if rank is not None else (remaining[index], index))
         
-        # Metrikleri hesapla
-        self.calculate_metrics()
-        return self.gantt_chart
\ No newline at end of file
+        self.current_time = current_time
+        self._store_results(completion, response)
+    
+    def schedule_mlfq(self, levels=3, time_quantum=4, quanta=None, boost_interval=None,
+                      aging_threshold=None, context_switch=0, cache_warmup=0):
+        """
+        Multi-Level Feedback Queue zamanlama algoritması
+        
+        Yeni prosesler en üst seviyeye (0) girer. Bir proses seviyesinin zaman
+        hakkını (quantum) bitirdiğinde bir alt seviyeye iner; hak, kesintiler
+        arasında korunur. Üst seviyeye bir varış olduğunda alt seviyede çalışan
+        proses kesilir. Her boost_interval zaman biriminde tüm prosesler en üst
+        seviyeye taşınır; aging_threshold'dan uzun bekleyen prosesler bir
+        seviye yükseltilir. En alt seviye Round Robin'dir.
+        
+        Parametreler:
+        levels (int): Seviye sayısı
+        time_quantum (int): quanta verilmezse seviye l'nin hakkı time_quantum * 2**l
+        quanta (list): Seviye başına zaman hakları
+        boost_interval (int): Öncelik yükseltme aralığı (None: yükseltme yok)
+        aging_threshold (int): Yaşlandırma için bekleme eşiği (None: yaşlandırma yok)
+        context_switch, cache_warmup (int): Ek yük süreleri (bkz. switch_overhead)
+        """
+        self.reset()
+        return self._collect(self._iter_mlfq(levels, time_quantum, quanta, boost_interval,
+                                             aging_threshold, context_switch, cache_warmup))
+    
+    def _iter_mlfq(self, levels=3, time_quantum=4, quanta=None, boost_interval=None,
+                   aging_threshold=None, context_switch=0, cache_warmup=0):
+        """
+        MLFQ dilimlerini üretir
+        
+        Her seviyenin hazır kuyruğu bir deque'dur; bitmap'in l. biti l.
+        kuyruğun dolu olduğunu gösterir ve en yüksek öncelikli dolu seviye
+        en düşük 1 biti olarak O(1)'de bulunur. Kuyruklar ekleme zamanına göre
+        sıralı kaldığından yaşlandırma yalnızca kuyruk başlarına bakar.
+        Yükseltmede alt kuyruklar üst kuyruğa eklenir; proseslerin seviyeleri
+        tek tek güncellenmez, yükseltme dönemi (epoch) eskimiş olanlar
+        seviye 0'da sayılır.
+        """
+        if quanta is None:
+            quanta = [time_quantum * 2 ** level for level in range(levels)]
+        quanta = list(quanta)
+        if len(quanta) != levels or levels < 1 or min(quanta) <= 0:
+            raise ValueError("Seviye başına pozitif birer zaman hakkı gerekli")
+        
+        pids, arrival, burst, _ = self._input_columns()
+        n = len(pids)
+        remaining = list(burst)
+        completion = [0] * n
+        response = [-1] * n
+        order = self.workload.arrival_order_list
+        
+        # Proses başına seviye, seviyede kullanılan hak, kuyruğa giriş zamanı ve dönem
+        level_of = [0] * n
+        used = [0] * n
+        enqueued_at = [0] * n
+        epoch_of = [0] * n
+        epoch = 0
+        
+        queues = [deque() for _ in range(levels)]
+        top_queue = queues[0]
+        bitmap = 0
+        bottom = levels - 1
+        next_boost = boost_interval if boost_interval else None
+        cursor = 0
+        current_time = 0
+        last = -1
+        
+        def admit_arrivals(cursor):
+            """Varış zamanı gelmiş prosesleri en üst seviyeye ekler"""
+            nonlocal bitmap
+            first = cursor
+            while cursor < n and arrival[order[cursor]] <= current_time:
+                cursor += 1
+            if cursor > first:
+                for index in sorted(order[first:cursor]):
+                    level_of[index] = used[index] = 0
+                    epoch_of[index] = epoch
+                    enqueued_at[index] = arrival[index]
+                    top_queue.append(index)
+                bitmap |= 1
+            return cursor
+        
+        # Tüm prosesler tamamlanana kadar
+        while cursor < n or bitmap:
+            cursor = admit_arrivals(cursor)
+            
+            # Öncelik yükseltme: alt kuyruklar sırayla en üst kuyruğa eklenir
+            if next_boost is not None and current_time >= next_boost:
+                epoch += 1
+                for queue in queues[1:]:
+                    top_queue.extend(queue)
+                    queue.clear()
+                if top_queue:
+                    bitmap = 1
+                next_boost = (current_time // boost_interval + 1) * boost_interval
+            
+            # Yaşlandırma: eşikten uzun bekleyenler bir üst seviyeye çıkar
+            if aging_threshold is not None and bitmap > 1:
+                for level in range(1, levels):
+                    queue = queues[level]
+                    while queue and current_time - enqueued_at[queue[0]] >= aging_threshold:
+                        index = queue.popleft()
+                        level_of[index] = level - 1
+                        used[index] = 0
+                        enqueued_at[index] = current_time
+                        queues[level - 1].append(index)
+                        bitmap |= 1 << (level - 1)
+                    if not queue:
+                        bitmap &= ~(1 << level)
+            
+            if not bitmap:
+                # Kuyruklar boşsa zamanı bir sonraki prosesin varış zamanına ayarla
+                current_time = arrival[order[cursor]]
+                continue
+            
+            # En yüksek öncelikli dolu seviye: bitmap'in en düşük 1 biti
+            level = (bitmap & -bitmap).bit_length() - 1
+            queue = queues[level]
+            index = queue.popleft()
+            if not queue:
+                bitmap &= ~(1 << level)
+            if epoch_of[index] != epoch:
+                # Son yükseltmeden önce kuyruğa girmiş: seviye 0'dan devam eder
+                epoch_of[index] = epoch
+                level_of[index] = used[index] = 0
+            level = level_of[index]
+            
+            # Başka bir prosese geçişte bağlam değiştirme ve önbellek ısınma maliyeti
+            if index != last and (context_switch or cache_warmup):
+                overhead, current_time = switch_overhead(current_time, context_switch, cache_warmup,
+                                                         response[index] != -1)
+                yield from overhead
+            last = index
+            
+            # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
+            if response[index] == -1:
+                response[index] = current_time
+            
+            # Kalan hak kadar çalışır; alt seviyedeyken yeni varış kesinti yaratır
+            # (geçiş ek yükü sırasında gelenler bir sonraki seçimde değerlendirilir)
+            run_time = min(quanta[level] - used[index], remaining[index])
+            if level > 0 and cursor < n:
+                upcoming = cursor
+                while upcoming < n and arrival[order[upcoming]] <= current_time:
+                    upcoming += 1
+                if upcoming < n:
+                    run_time = min(run_time, arrival[order[upcoming]] - current_time)
+            
+            yield pids[index], current_time, current_time + run_time
+            current_time += run_time
+            remaining[index] -= run_time
+            used[index] += run_time
+            
+            # Dilim sırasında gelen prosesler, kesilen prosesten önce kuyruğa girer
+            cursor = admit_arrivals(cursor)
+            
+            if remaining[index] == 0:
+                completion[index] = current_time
+                continue
+            if used[index] >= quanta[level]:
+                # Hakkını bitiren proses bir alt seviyeye iner
+                level = level_of[index] = min(level + 1, bottom)
+                used[index] = 0
+            enqueued_at[index] = current_time
+            queues[level].append(index)
+            bitmap |= 1 << level
+        
+        self.current_time = current_time
+        self._store_results(completion, response)
+    
+    def schedule_cfs(self, target_latency=20, min_granularity=4, context_switch=0, cache_warmup=0):
+        """
+        Completely Fair Scheduler (CFS) benzeri zamanlama algoritması
+        
+        Öncelik alanı nice değeri olarak yorumlanır (-20..19'a kırpılır) ve
+        Linux'un nice -> ağırlık tablosuyla ağırlığa çevrilir. Her adımda
+        sanal çalışma süresi (vruntime) en küçük proses seçilir ve
+        max(min_granularity, dönem * ağırlık / toplam ağırlık) kadar çalışır;
+        dönem max(target_latency, hazır proses sayısı * min_granularity)
+        olur. vruntime, çalışılan süre * NICE_0_WEIGHT / ağırlık kadar artar.
+        Yeni gelen prosesler min_vruntime'dan başlar ve dilim sonunda kuyruğa
+        girer (uyanma kesintisi modellenmez).
+        
+        Parametreler:
+        target_latency (int): Her hazır prosesin bir kez çalıştığı hedef dönem
+        min_granularity (int): En kısa zaman dilimi
+        context_switch, cache_warmup (int): Ek yük süreleri (bkz. switch_overhead)
+        """
+        self.reset()
+        return self._collect(self._iter_cfs(target_latency, min_granularity, context_switch,
+                                            cache_warmup))
+    
+    def _iter_cfs(self, target_latency=20, min_granularity=4, context_switch=0, cache_warmup=0):
+        """
+        CFS dilimlerini üretir
+        
+        Hazır kuyruk (vruntime, sıra, indeks) üçlülerinden oluşan bir
+        min-heap'tir; çalışan proses kuyrukta tutulmadığından silme gerekmez
+        ve her seçim O(log n) olur. Eşit vruntime'da kuyruğa giriş sırası
+        korunur.
+        """
+        if target_latency <= 0 or min_granularity <= 0:
+            raise ValueError("target_latency ve min_granularity pozitif olmalı")
+        
+        pids, arrival, burst, priority = self._input_columns()
+        n = len(pids)
+        remaining = list(burst)
+        completion = [0] * n
+        response = [-1] * n
+        order = self.workload.arrival_order_list
+        weight = [priority_tickets(nice) for nice in priority]
+        
+        vruntime = [0.0] * n
+        ready = []
+        sequence = 0
+        total_weight = 0
+        min_vruntime = 0.0
+        cursor = 0
+        current_time = 0
+        last = -1
+        
+        # Tüm prosesler tamamlanana kadar
+        while cursor < n or ready:
+            # Varış zamanı gelmiş prosesler min_vruntime'dan başlar
+            while cursor < n and arrival[order[cursor]] <= current_time:
+                index = order[cursor]
+                cursor += 1
+                vruntime[index] = min_vruntime
+                total_weight += weight[index]
+                heapq.heappush(ready, (min_vruntime, sequence, index))
+                sequence += 1
+            
+            if not ready:
+                # İşlenebilecek proses yoksa zamanı bir sonraki varışa ilerlet
+                current_time = arrival[order[cursor]]
+                continue
+            
+            _, _, index = heapq.heappop(ready)
+            
+            # Başka bir prosese geçişte bağlam değiştirme ve önbellek ısınma maliyeti
+            if index != last and (context_switch or cache_warmup):
+                overhead, current_time = switch_overhead(current_time, context_switch, cache_warmup,
+                                                         response[index] != -1)
+                yield from overhead
+            last = index
+            
+            # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
+            if response[index] == -1:
+                response[index] = current_time
+            
+            # Zaman dilimi, prosesin ağırlığının dönemdeki payıdır
+            period = max(target_latency, (len(ready) + 1) * min_granularity)
+            run_time = min(max(min_granularity, period * weight[index] // total_weight),
+                           remaining[index])
+            
+            yield pids[index], current_time, current_time + run_time
+            current_time += run_time
+            remaining[index] -= run_time
+            vruntime[index] += run_time * NICE_0_WEIGHT / weight[index]
+            
+            # min_vruntime yalnızca ileri gider
+            leftmost = min(vruntime[index], ready[0][0]) if ready else vruntime[index]
+            min_vruntime = max(min_vruntime, leftmost)
+            
+            if remaining[index] == 0:
+                completion[index] = current_time
+                total_weight -= weight[index]
+            else:
+                heapq.heappush(ready, (vruntime[index], sequence, index))
+                sequence += 1
+        
+        self.current_time = current_time
+        self._store_results(completion, response)
+    
+    def schedule_lottery(self, time_quantum=4, seed=None, context_switch=0, cache_warmup=0):
+        """
+        Piyango (lottery) zamanlama algoritması
+        
+        Her zaman diliminde hazır proseslerin biletleri arasından rastgele bir
+        bilet çekilir ve sahibi time_quantum kadar çalışır; beklenen CPU payı
+        bilet payına eşittir. Biletler öncelikten türetilir (bkz.
+        priority_tickets).
+        
+        Parametreler:
+        time_quantum (int): Zaman dilimi
+        seed (int): Rastgele tohum (aynı tohum aynı zamanlamayı verir)
+        context_switch, cache_warmup (int): Ek yük süreleri (bkz. switch_overhead)
+        """
+        self.reset()
+        return self._collect(self._iter_lottery(time_quantum, seed, context_switch, cache_warmup))
+    
+    def _iter_lottery(self, time_quantum=4, seed=None, context_switch=0, cache_warmup=0,
+                      draw_batch=65536):
+        """
+        Piyango dilimlerini üretir
+        
+        Hazır proseslerin biletleri proses indeksi üzerinde bir TicketTree'de
+        tutulur; her çekiliş O(log n) sürer. Rastgele sayılar toplu üretilir.
+        """
+        if time_quantum < 1:
+            raise ValueError("Zaman dilimi en az 1 olmalıdır")
+        pids, arrival, burst, priority = self._input_columns()
+        n = len(pids)
+        remaining = list(burst)
+        completion = [0] * n
+        response = [-1] * n
+        order = self.workload.arrival_order_list
+        tickets = [priority_tickets(value) for value in priority]
+        
+        tree = TicketTree(n)
+        rng = np.random.default_rng(seed)
+        draws = []
+        ready_count = 0
+        cursor = 0
+        current_time = 0
+        last = -1
+        
+        # Tüm prosesler tamamlanana kadar
+        while cursor < n or ready_count:
+            # Varış zamanı gelmiş proseslerin biletlerini ağaca ekle
+            while cursor < n and arrival[order[cursor]] <= current_time:
+                tree.add(order[cursor], tickets[order[cursor]])
+                ready_count += 1
+                cursor += 1
+            
+            if not ready_count:
+                # İşlenebilecek proses yoksa zamanı bir sonraki varışa ilerlet
+                current_time = arrival[order[cursor]]
+                continue
+            
+            if not draws:
+                draws = rng.random(draw_batch).tolist()
+            index = tree.find(int(draws.pop() * tree.total))
+            
+            # Başka bir prosese geçişte bağlam değiştirme ve önbellek ısınma maliyeti
+            if index != last and (context_switch or cache_warmup):
+                overhead, current_time = switch_overhead(current_time, context_switch, cache_warmup,
+                                                         response[index] != -1)
+                yield from overhead
+            last = index
+            
+            # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
+            if response[index] == -1:
+                response[index] = current_time
+            
+            run_time = min(time_quantum, remaining[index])
+            yield pids[index], current_time, current_time + run_time
+            current_time += run_time
+            remaining[index] -= run_time
+            
+            if remaining[index] == 0:
+                completion[index] = current_time
+                tree.add(index, -tickets[index])
+                ready_count -= 1
+        
+        self.current_time = current_time
+        self._store_results(completion, response)
+    
+    def schedule_stride(self, time_quantum=4, context_switch=0, cache_warmup=0):
+        """
+        Adım (stride) zamanlama algoritması
+        
+        Piyangonun belirlenimci karşılığıdır: her prosesin adımı
+        STRIDE1 // bilet sayısıdır ve geçiş (pass) değeri en küçük proses
+        time_quantum kadar çalışır; ardından geçiş değeri çalıştığı süreyle
+        orantılı olarak adım kadar artar. Yeni gelen prosesler en son seçilen
+        geçiş değerinden başlar, böylece geçmişteki boşluklar için CPU
+        biriktiremezler.
+        
+        Parametreler:
+        time_quantum (int): Zaman dilimi
+        context_switch, cache_warmup (int): Ek yük süreleri (bkz. switch_overhead)
+        """
+        self.reset()
+        return self._collect(self._iter_stride(time_quantum, context_switch, cache_warmup))
+    
+    def _iter_stride(self, time_quantum=4, context_switch=0, cache_warmup=0):
+        """
+        Stride dilimlerini üretir
+        
+        Hazır kuyruk (geçiş değeri, sıra, indeks) üçlülerinden oluşan bir
+        min-heap'tir; her seçim O(log n) sürer.
+        """
+        if time_quantum < 1:
+            raise ValueError("Zaman dilimi en az 1 olmalıdır")
+        pids, arrival, burst, priority = self._input_columns()
+        n = len(pids)
+        remaining = list(burst)
+        completion = [0] * n
+        response = [-1] * n
+        order = self.workload.arrival_order_list
+        stride = [STRIDE1 // priority_tickets(value) for value in priority]
+        
+        ready = []
+        sequence = 0
+        global_pass = 0
+        cursor = 0
+        current_time = 0
+        last = -1
+        
+        # Tüm prosesler tamamlanana kadar
+        while cursor < n or ready:
+            # Yeni varışlar en son seçilen geçiş değerinden başlar
+            while cursor < n and arrival[order[cursor]] <= current_time:
+                heapq.heappush(ready, (global_pass, sequence, order[cursor]))
+                sequence += 1
+                cursor += 1
+            
+            if not ready:
+                # İşlenebilecek proses yoksa zamanı bir sonraki varışa ilerlet
+                current_time = arrival[order[cursor]]
+                continue
+            
+            pass_value, _, index = heapq.heappop(ready)
+            global_pass = pass_value
+            
+            # Başka bir prosese geçişte bağlam değiştirme ve önbellek ısınma maliyeti
+            if index != last and (context_switch or cache_warmup):
+                overhead, current_time = switch_overhead(current_time, context_switch, cache_warmup,
+                                                         response[index] != -1)
+                yield from overhead
+            last = index
+            
+            # İlk kez CPU'ya atanıyorsa cevap zamanını kaydet
+            if response[index] == -1:
+                response[index] = current_time
+            
+            run_time = min(time_quantum, remaining[index])
+            yield pids[index], current_time, current_time + run_time
+            current_time += run_time
+            remaining[index] -= run_time
+            
+            if remaining[index] == 0:
+                completion[index] = current_time
+            else:
+                heapq.heappush(ready, (pass_value + stride[index] * run_time, sequence, index))
+                sequence += 1
+        
+        self.current_time = current_time
+        self._store_results(completion, response)
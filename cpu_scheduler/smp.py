@@ -0,0 +1,275 @@
+"""
+Çok Çekirdekli (SMP) Zamanlama
+Bu modül, N çekirdekli bir sistemi hazır kuyruklar, yük dengeleme politikaları
+ve çekirdek yakınlığı maskeleriyle olay güdümlü olarak simüle eder.
+"""
+
+import heapq
+from collections import deque
+
+import numpy as np
+
+from cpu_scheduler.gantt import GanttChart
+from cpu_scheduler.metrics import SchedulingMetrics
+from cpu_scheduler.scheduler import switch_overhead
+
+# Yük dengeleme politikaları:
+# 'global'        - tüm çekirdeklerin paylaştığı tek bir FIFO hazır kuyruk
+# 'per_core'      - varışta en az yüklü izinli çekirdeğe atanır, göç yoktur
+# 'work_stealing' - per_core gibi; boşta kalan çekirdek en uzun kuyruktan iş çalar
+SMP_POLICIES = ('global', 'per_core', 'work_stealing')
+
+
+class SMPScheduler:
+    """
+    Bir CPUScheduler'ın proseslerini N çekirdek üzerinde zamanlayan sınıf
+
+    Her çekirdek, kuyruğunun başındaki prosesi time_quantum kadar (None ise
+    tamamlanana kadar) çalıştırır; böylece çekirdek başına disiplin Round
+    Robin veya FCFS olur. Olaylar (varışlar ve dilim bitişleri) zamana göre
+    işlenir: önce biten dilimler, ardından varışlar, sonra kesilen prosesler
+    kuyruğa girer ve boştaki çekirdekler numara sırasıyla iş alır. Tek
+    çekirdekte sonuç schedule_fcfs ile aynıdır; schedule_round_robin ile
+    yalnızca prosesler varış zamanı sırasıyla eklendiyse aynıdır, çünkü
+    Round Robin bir dilim sırasında gelenleri ekleme sırasıyla kuyruğa alır.
+
+    Proses başına sonuçlar zamanlayıcıya yazılır (ortalama süreler ve
+    SchedulingMetrics gecikme metrikleri doğrudan kullanılabilir); Gantt
+    şeması çekirdek başına core_charts içinde tutulur.
+    """
+
+    def __init__(self, scheduler, cores=4, policy='global'):
+        """
+        Parametreler:
+        scheduler (CPUScheduler): Prosesleri ve sonuçları tutan zamanlayıcı
+        cores (int): Çekirdek sayısı
+        policy (str): SMP_POLICIES içindeki yük dengeleme politikası
+        """
+        if cores < 1:
+            raise ValueError("Çekirdek sayısı en az 1 olmalı")
+        if policy not in SMP_POLICIES:
+            raise ValueError("Bilinmeyen SMP politikası: {}".format(policy))
+        self.scheduler = scheduler
+        self.cores = cores
+        self.policy = policy
+        self.core_charts = [GanttChart() for _ in range(cores)]
+        self.migrations = 0
+        self.steals = 0
+
+    def _masks(self, pids):
+        """Proses başına, çekirdek sayısına kırpılmış yakınlık maskeleri"""
+        full = (1 << self.cores) - 1
+        masks = []
+        for pid, mask in zip(pids, self.scheduler.affinity_masks()):
+            if mask is None:
+                masks.append(full)
+                continue
+            mask &= full
+            if not mask:
+                raise ValueError("Proses {} için izin verilen çekirdek yok".format(pid))
+            masks.append(mask)
+        return masks
+
+    def schedule(self, time_quantum=None, context_switch=0, cache_warmup=0):
+        """
+        Prosesleri çekirdeklere zamanlar
+
+        Bir çekirdek son çalıştırdığından farklı bir prosese geçtiğinde ek yük
+        dilimleri o çekirdeğin şemasına eklenir (bkz. switch_overhead).
+
+        Parametreler:
+        time_quantum (int): Zaman dilimi (None: kesintisiz, çekirdek başına FCFS)
+        context_switch (int): Bağlam değiştirme süresi
+        cache_warmup (int): Kesilmiş proses devam ederken önbellek ısınma süresi
+
+        Dönüş:
+        list: Çekirdek başına GanttChart
+        """
+        if time_quantum is not None and time_quantum < 1:
+            raise ValueError("Zaman dilimi en az 1 olmalıdır")
+        scheduler = self.scheduler
+        scheduler.reset()
+        pids, arrival, burst, _ = scheduler._input_columns()
+        n = len(pids)
+        masks = self._masks(pids)
+        cores = self.cores
+        remaining = list(burst)
+        completion = [0] * n
+        response = [-1] * n
+        last_core = [-1] * n
+        order = scheduler.workload.arrival_order_list
+
+        charts = [GanttChart() for _ in range(cores)]
+        appends = [chart.append for chart in charts]
+        running = [-1] * cores
+        last = [-1] * cores
+        idle = set(range(cores))
+        events = []  # (dilim bitişi, çekirdek)
+
+        global_queue = self.policy == 'global'
+        stealing = self.policy == 'work_stealing'
+        # Global politikada maske başına bir FIFO kuyruk ve ekleme sırası
+        # numarası tutulur; çekirdek, izinli kuyrukların başlarından en eskisini
+        # alır. Maske sayısı genellikle çok azdır.
+        mask_queues = {}
+        core_queues = [deque() for _ in range(cores)]
+        mask_cores = {}
+        sequence = 0
+        queued = 0
+        migrations = steals = 0
+
+        def cores_of(mask):
+            """Maskede izin verilen çekirdekler (önbellekli)"""
+            allowed = mask_cores.get(mask)
+            if allowed is None:
+                allowed = mask_cores[mask] = tuple(c for c in range(cores) if mask >> c & 1)
+            return allowed
+
+        def enqueue(index, core):
+            """Prosesi kuyruğa ekler (core: kesildiği çekirdek, yeni varışta -1)"""
+            nonlocal sequence, queued
+            queued += 1
+            if global_queue:
+                queue = mask_queues.get(masks[index])
+                if queue is None:
+                    queue = mask_queues[masks[index]] = deque()
+                queue.append((sequence, index))
+                sequence += 1
+                return
+            if core < 0:
+                # Yeni varış en az yüklü (kuyruk + çalışan) izinli çekirdeğe gider
+                core = min(cores_of(masks[index]),
+                           key=lambda c: len(core_queues[c]) + (running[c] >= 0))
+            core_queues[core].append(index)
+
+        def take(core):
+            """Çekirdeğin çalıştıracağı sıradaki prosesi kuyruktan alır (yoksa -1)"""
+            nonlocal queued, steals
+            if global_queue:
+                best = None
+                for mask, queue in mask_queues.items():
+                    if queue and mask >> core & 1 and (best is None or queue[0][0] < best[0][0]):
+                        best = queue
+                if best is None:
+                    return -1
+                queued -= 1
+                return best.popleft()[1]
+
+            own = core_queues[core]
+            if own:
+                queued -= 1
+                return own.popleft()
+            if not stealing:
+                return -1
+            # En uzun kuyruğun sonundan bu çekirdekte çalışabilen prosesi çal
+            bit = 1 << core
+            for victim in sorted(range(cores), key=lambda c: -len(core_queues[c])):
+                queue = core_queues[victim]
+                if not queue:
+                    break
+                for position in range(len(queue) - 1, -1, -1):
+                    if masks[queue[position]] & bit:
+                        index = queue[position]
+                        del queue[position]
+                        queued -= 1
+                        steals += 1
+                        return index
+            return -1
+
+        cursor = 0
+        current_time = 0
+        while cursor < n or queued or events:
+            # Bir sonraki olay: dilim bitişi veya varış (eşitlikte ikisi birlikte)
+            if events and (cursor == n or events[0][0] <= arrival[order[cursor]]):
+                current_time = events[0][0]
+            else:
+                current_time = arrival[order[cursor]]
+
+            preempted = []
+            while events and events[0][0] == current_time:
+                _, core = heapq.heappop(events)
+                index = running[core]
+                running[core] = -1
+                idle.add(core)
+                if remaining[index] == 0:
+                    completion[index] = current_time
+                else:
+                    preempted.append((core, index))
+
+            # Dilim sırasında gelen prosesler, kesilen proseslerden önce kuyruğa girer
+            while cursor < n and arrival[order[cursor]] <= current_time:
+                enqueue(order[cursor], -1)
+                cursor += 1
+            for core, index in preempted:
+                enqueue(index, core)
+
+            # Boştaki çekirdeklere iş ata
+            for core in sorted(idle):
+                if not queued:
+                    break
+                index = take(core)
+                if index < 0:
+                    continue
+                idle.discard(core)
+
+                start = current_time
+                if index != last[core] and (context_switch or cache_warmup):
+                    overhead, start = switch_overhead(current_time, context_switch, cache_warmup,
+                                                      response[index] != -1)
+                    for item in overhead:
+                        appends[core](item)
+                last[core] = index
+
+                if response[index] == -1:
+                    response[index] = start
+                elif last_core[index] != core:
+                    migrations += 1
+                last_core[index] = core
+
+                run_time = remaining[index]
+                if time_quantum is not None:
+                    run_time = min(time_quantum, run_time)
+                remaining[index] -= run_time
+                appends[core]((pids[index], start, start + run_time))
+                running[core] = index
+                heapq.heappush(events, (start + run_time, core))
+
+        scheduler.current_time = current_time
+        scheduler._store_results(completion, response)
+        self.core_charts = charts
+        self.migrations = migrations
+        self.steals = steals
+        return charts
+
+    def core_utilization(self):
+        """Çekirdek başına kullanım oranı (meşgul süre / toplam süre) dizisi"""
+        makespan = self.scheduler.current_time
+        if makespan == 0:
+            return np.zeros(self.cores)
+        return np.array([chart.busy_time() for chart in self.core_charts]) / makespan
+
+    def calculate_metrics(self):
+        """
+        Gecikme metriklerine ek olarak çekirdek başına kullanım ve göç sayılarını döndürür
+
+        Dönüş:
+        dict: SchedulingMetrics.calculate_latency_metrics() anahtarları ile
+            throughput, cpu_utilization (çekirdek ortalaması),
+            core_utilization (liste), overhead_ratio (ek yükün toplam çekirdek
+            süresine oranı), context_switches, migrations, steals ve cores
+        """
+        scheduler = self.scheduler
+        metrics = SchedulingMetrics(scheduler).calculate_latency_metrics()
+        utilization = self.core_utilization()
+        metrics['throughput'] = (scheduler.process_count() / scheduler.current_time
+                                 if scheduler.current_time > 0 else 0)
+        metrics['cpu_utilization'] = float(utilization.mean())
+        metrics['core_utilization'] = utilization.tolist()
+        overhead = sum(chart.overhead_time() for chart in self.core_charts)
+        metrics['overhead_ratio'] = (overhead / (scheduler.current_time * self.cores)
+                                     if scheduler.current_time > 0 else 0)
+        metrics['context_switches'] = sum(chart.context_switches() for chart in self.core_charts)
+        metrics['migrations'] = self.migrations
+        metrics['steals'] = self.steals
+        metrics['cores'] = self.cores
+        return metrics
@@ -0,0 +1,102 @@
+"""
+Zaman Dilimi Taraması
+Bu modül, Round Robin algoritmasını bir dizi zaman dilimi için paralel olarak çalıştırır.
+"""
+
+import numpy as np
+
+from cpu_scheduler.comparison import create_workload_pool, iter_pool_results, worker_workload
+from cpu_scheduler.metrics import SchedulingMetrics
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.workloads import Workload
+
+# sweep_round_robin() sonucundaki metrik sütunları
+SWEEP_METRICS = ('avg_waiting_time', 'avg_turnaround_time', 'avg_response_time', 'context_switches',
+                 'throughput', 'overhead_ratio')
+
+
+def round_robin_metrics(workload, time_quantum, context_switch=0, cache_warmup=0):
+    """
+    Round Robin'i tek bir zaman dilimiyle çalıştırıp tarama metriklerini döndürür
+
+    Zaman çizelgesi akış modunda tüketilir, bellekte tutulmaz.
+
+    Parametreler:
+    workload (Workload): İş yükü
+    time_quantum (int): Zaman dilimi
+    context_switch (int): Bağlam değiştirme süresi
+    cache_warmup (int): Önbellek ısınma süresi
+
+    Dönüş:
+    tuple: SWEEP_METRICS sırasıyla metrik değerleri
+    """
+    scheduler = CPUScheduler.from_workload(workload)
+    metrics = SchedulingMetrics(scheduler)
+    slices = scheduler.iter_schedule('round_robin', time_quantum=time_quantum,
+                                     context_switch=context_switch, cache_warmup=cache_warmup)
+    for _ in metrics.track(slices):
+        pass
+    throughput = (scheduler.process_count() / scheduler.current_time
+                  if scheduler.current_time > 0 else 0)
+    return (scheduler.get_average_waiting_time(), scheduler.get_average_turnaround_time(),
+            scheduler.get_average_response_time(), metrics.online['context_switches'],
+            throughput, metrics.calculate_overhead_ratio())
+
+
+def _sweep_in_worker(time_quantum, context_switch, cache_warmup):
+    """İşçi proseste, havuza yüklenmiş iş yüküyle tek bir zaman dilimini çalıştırır"""
+    return round_robin_metrics(worker_workload(), time_quantum, context_switch, cache_warmup)
+
+
+def sweep_round_robin(workload, quanta=range(1, 200), max_workers=None, cancel_event=None,
+                      context_switch=0, cache_warmup=0):
+    """
+    Round Robin'i verilen zaman dilimleri için çalıştırır
+
+    İş yükü bir kez sıralanıp tüm işçilerle paylaşılır. En uzun işlem
+    süresine eşit veya daha büyük zaman dilimleri aynı zamanlamayı ürettiği
+    için bunlar tek bir çalıştırmayla hesaplanır. Bağlam değiştirme ve
+    önbellek ısınma maliyetleri verilirse küçük zaman dilimlerinin ek yükü
+    bekleme sürelerine ve üretilen işe yansır.
+
+    Parametreler:
+    workload (Workload veya dict): İş yükü ya da proses dizileri
+    quanta (iterable): Denenecek zaman dilimleri
+    max_workers (int): İşçi sayısı (None: çekirdek sayısı, 1: aynı proseste)
+    cancel_event (threading.Event): İptal bayrağı (isteğe bağlı)
+    context_switch (int): Bağlam değiştirme süresi
+    cache_warmup (int): Önbellek ısınma süresi
+
+    Dönüş:
+    dict: 'quantum' ve SWEEP_METRICS anahtarlarıyla NumPy dizileri; iptal
+        edilirse hesaplanmayan değerler NaN olur
+    """
+    if not isinstance(workload, Workload):
+        workload = Workload.from_arrays(workload)
+
+    quanta = np.asarray(list(quanta), dtype=np.int64)
+    if len(quanta) and quanta.min() < 1:
+        raise ValueError("Zaman dilimi en az 1 olmalıdır")
+
+    # Aynı zamanlamayı üreten dilimleri tek bir etkin değere indir
+    max_burst = int(workload.burst.max()) if len(workload) else 1
+    effective = np.minimum(quanta, max(max_burst, 1))
+    unique_quanta, positions = np.unique(effective, return_inverse=True)
+
+    values = np.full((len(unique_quanta), len(SWEEP_METRICS)), np.nan)
+    if max_workers == 1 or len(unique_quanta) <= 1:
+        for i, time_quantum in enumerate(unique_quanta.tolist()):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            values[i] = round_robin_metrics(workload, time_quantum, context_switch, cache_warmup)
+    else:
+        executor = create_workload_pool(workload, max_workers)
+        pending = {executor.submit(_sweep_in_worker, time_quantum, context_switch, cache_warmup): i
+                   for i, time_quantum in enumerate(unique_quanta.tolist())}
+        for i, row in iter_pool_results(executor, pending, cancel_event):
+            values[i] = row
+
+    result = {'quantum': quanta}
+    for column, name in enumerate(SWEEP_METRICS):
+        result[name] = values[positions, column]
+    return result
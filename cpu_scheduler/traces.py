@@ -0,0 +1,415 @@
+"""
+İş İzleri
+Bu modül, gerçek iş izlerini (CSV veya JSON satırları) parça parça okuyup zamanlayıcılara aktarır.
+"""
+
+import csv
+import gzip
+import json
+import os
+from itertools import islice
+
+import numpy as np
+
+from cpu_scheduler.gantt import GanttChart
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.workloads import Workload
+
+# İz sütunlarının kabul edilen adları (ilk bulunan kullanılır)
+COLUMN_ALIASES = {
+    'pid': ('pid', 'id', 'job_id'),
+    'arrival_time': ('arrival_time', 'arrival', 'submit_time'),
+    'burst_time': ('burst_time', 'burst', 'run_time', 'runtime'),
+    'priority': ('priority',),
+}
+
+TRACE_FORMATS = ('csv', 'jsonl')
+
+# Pencereli zamanlamayı destekleyen algoritmalar: durumları yalnızca kalan
+# süre ve hazır kuyruk sırasından ibarettir. MLFQ gibi seviye/hak durumu
+# tutan algoritmalar pencereler arasında devredilemez.
+WINDOWED_ALGORITHMS = ('fcfs', 'sjf', 'round_robin', 'priority')
+
+
+def trace_format(path):
+    """
+    Dosya uzantısından iz biçimini belirler (.gz sıkıştırması desteklenir)
+
+    Dönüş:
+    str: 'csv' veya 'jsonl'
+    """
+    name = path[:-3] if path.endswith('.gz') else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    raise ValueError("İz biçimi belirlenemedi: {}".format(path))
+
+
+def _open_trace(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+def _resolve_columns(names):
+    """İz başlığındaki adları standart sütun adlarına eşler"""
+    columns = {}
+    for key, aliases in COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in names:
+                columns[key] = alias
+                break
+    missing = [key for key in ('arrival_time', 'burst_time') if key not in columns]
+    if missing:
+        raise ValueError("Eksik sütun(lar): {}".format(", ".join(missing)))
+    return columns
+
+
+def _iter_csv_chunks(handle, chunk_size):
+    """CSV iz satırlarını np.loadtxt ile parça parça sütunlara ayrıştırır"""
+    header = [name.strip() for name in next(csv.reader([handle.readline()]), [])]
+    columns = _resolve_columns(header)
+    keys = [key for key in ('pid', 'arrival_time', 'burst_time', 'priority') if key in columns]
+    positions = [header.index(columns[key]) for key in keys]
+    while True:
+        lines = [line for line in islice(handle, chunk_size) if line.strip()]
+        if not lines:
+            return
+        try:
+            table = np.loadtxt(lines, delimiter=',', dtype=np.int64, usecols=positions, ndmin=2)
+        except ValueError as e:
+            raise ValueError("Geçersiz iz satırı: {}".format(e)) from None
+        yield {key: table[:, i] for i, key in enumerate(keys)}
+
+
+def _iter_jsonl_chunks(handle, chunk_size):
+    """JSON satırlarını parça parça sütunlara ayrıştırır"""
+    keys = None
+    while True:
+        records = [json.loads(line) for line in islice(handle, chunk_size) if line.strip()]
+        if not records:
+            return
+        if keys is None:
+            columns = _resolve_columns(records[0])
+            keys = {key: columns[key] for key in ('pid', 'arrival_time', 'burst_time', 'priority')
+                    if key in columns}
+        try:
+            yield {key: np.array([record[name] for record in records], dtype=np.int64)
+                   for key, name in keys.items()}
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError("Geçersiz iz satırı: {}".format(e)) from None
+
+
+def _complete_chunk(chunk, first_pid):
+    """Eksik pid/öncelik sütunlarını tamamlar ve değerleri doğrular"""
+    count = len(chunk['arrival_time'])
+    if 'pid' not in chunk:
+        chunk['pid'] = np.arange(first_pid, first_pid + count, dtype=np.int64)
+    if 'priority' not in chunk:
+        chunk['priority'] = np.zeros(count, dtype=np.int64)
+    if (chunk['arrival_time'] < 0).any() or (chunk['burst_time'] <= 0).any():
+        raise ValueError("Varış zamanları negatif olamaz, işlem süreleri pozitif olmalı")
+    return chunk
+
+
+def iter_trace(path, chunk_size=65536, format=None):
+    """
+    İz dosyasını en fazla chunk_size satırlık parçalar halinde okur
+
+    Bellekte aynı anda yalnızca bir parça tutulur. İzde 'pid' sütunu yoksa
+    prosesler 1'den başlayarak numaralanır, 'priority' yoksa 0 kabul edilir.
+
+    Parametreler:
+    path (str): .csv, .jsonl veya .ndjson dosyası (.gz sıkıştırılmış olabilir)
+    chunk_size (int): Parça başına satır sayısı
+    format (str): 'csv' veya 'jsonl' (None: uzantıdan belirlenir)
+
+    Dönüş:
+    generator: add_processes() ile yüklenebilecek dizi sözlükleri
+    """
+    if chunk_size < 1:
+        raise ValueError("Parça boyutu pozitif olmalı")
+    format = format or trace_format(path)
+    if format not in TRACE_FORMATS:
+        raise ValueError("Bilinmeyen iz biçimi: {}".format(format))
+
+    with _open_trace(path) as handle:
+        chunks = (_iter_csv_chunks if format == 'csv' else _iter_jsonl_chunks)(handle, chunk_size)
+        next_pid = 1
+        for chunk in chunks:
+            yield _complete_chunk(chunk, next_pid)
+            next_pid += len(chunk['arrival_time'])
+
+
+def _iter_source(source, chunk_size):
+    """Dosya yolunu parça üretecine çevirir; diğer kaynakları olduğu gibi döndürür"""
+    if isinstance(source, (str, os.PathLike)):
+        return iter_trace(os.fspath(source), chunk_size)
+    return iter(source)
+
+
+def load_trace(scheduler, source, chunk_size=65536):
+    """
+    İzi parça parça zamanlayıcının sütunlu deposuna yükler
+
+    Parametreler:
+    scheduler (CPUScheduler): Hedef zamanlayıcı
+    source (str veya iterable): İz dosyası ya da dizi sözlükleri üreteci
+    chunk_size (int): Parça başına satır sayısı
+
+    Dönüş:
+    int: Yüklenen proses sayısı
+    """
+    count = 0
+    for chunk in _iter_source(source, chunk_size):
+        count += scheduler.add_processes(chunk)
+    return count
+
+
+def _normalized_chunks(chunks):
+    """Dizi sözlüklerini veya yapılandırılmış dizileri tam sütunlu sözlüklere çevirir"""
+    next_pid = 1
+    for chunk in chunks:
+        names = chunk.dtype.names if hasattr(chunk, 'dtype') else tuple(chunk.keys())
+        chunk = _complete_chunk({key: np.asarray(chunk[key], dtype=np.int64).ravel()
+                                 for key in _ArrivalBuffer.KEYS if key in names}, next_pid)
+        next_pid += len(chunk['arrival_time'])
+        yield chunk
+
+
+class _ArrivalBuffer:
+    """Varış sırasına göre sıralı parçalardan zaman aralığına göre proses alır"""
+
+    KEYS = ('pid', 'arrival_time', 'burst_time', 'priority')
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.current = None
+        self.offset = 0
+        self.last_arrival = None
+
+    def _fill(self):
+        """Geçerli parça tükendiyse bir sonrakini okur; iz bittiyse False döndürür"""
+        while self.current is None or self.offset == len(self.current['arrival_time']):
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.current = None
+                return False
+            arrival = chunk['arrival_time']
+            if len(arrival) and ((arrival[1:] < arrival[:-1]).any() or
+                                 (self.last_arrival is not None and arrival[0] < self.last_arrival)):
+                raise ValueError("Pencere kipi varış zamanına göre sıralı iz gerektirir")
+            if len(arrival):
+                self.last_arrival = int(arrival[-1])
+            self.current = chunk
+            self.offset = 0
+        return True
+
+    def next_arrival(self):
+        """Sıradaki prosesin varış zamanı (iz bittiyse None)"""
+        return int(self.current['arrival_time'][self.offset]) if self._fill() else None
+
+    def take_before(self, time):
+        """Varış zamanı time'dan küçük prosesleri alır"""
+        pieces = []
+        while self._fill():
+            arrival = self.current['arrival_time']
+            end = self.offset + int(np.searchsorted(arrival[self.offset:], time))
+            if end == self.offset:
+                break
+            pieces.append({key: self.current[key][self.offset:end] for key in self.KEYS})
+            self.offset = end
+        if not pieces:
+            return {key: np.empty(0, dtype=np.int64) for key in self.KEYS}
+        return {key: np.concatenate([piece[key] for piece in pieces]) for key in self.KEYS}
+
+
+def _cut_time(gantt_start, gantt_end, window_end, algorithm, params):
+    """
+    Pencere sonucunun kesileceği anı bulur
+
+    Kesintili algoritmalar pencere sonunda kesilir. Kesintisiz algoritmalarda
+    pencere sonunda çalışan proses bitene, Round Robin'de ise zaman dilimi
+    dolana kadar beklenir; böylece kesme anı her zaman bir karar anıdır.
+    """
+    if params.get('preemptive', False):
+        return window_end
+    running = np.flatnonzero((gantt_start < window_end) & (gantt_end > window_end))
+    if not len(running):
+        return window_end
+    start, end = int(gantt_start[running[0]]), int(gantt_end[running[0]])
+    if algorithm == 'round_robin':
+        quantum = params['time_quantum']
+        return min(end, start + -(-(window_end - start) // quantum) * quantum)
+    return end
+
+
+def iter_trace_windows(source, algorithm, window, chunk_size=65536, **params):
+    """
+    İzi zaman pencereleri halinde zamanlar
+
+    Her adımda bir pencere süresince gelen prosesler, önceki pencereden
+    devreden yarım kalmış proseslerle birlikte zamanlanır; sonuç bir karar
+    anında kesilir ve bitmeyen prosesler kalan süreleriyle bir sonraki
+    pencereye devredilir. Devredilenler, kesme anındaki hazır kuyruk
+    sırasını koruyacak şekilde yerleştirildiğinden pencereli sonuç tüm izin
+    tek seferde zamanlanmasıyla aynıdır. Bellek kullanımı pencere başına
+    proses sayısıyla sınırlıdır. İz varış zamanına göre sıralı olmalıdır.
+
+    Parametreler:
+    source (str veya iterable): İz dosyası ya da dizi sözlükleri üreteci
+    algorithm (str): WINDOWED_ALGORITHMS içindeki algoritma adı
+    window (int): Pencere süresi (birim zaman)
+    chunk_size (int): Parça başına satır sayısı
+    **params: Algoritma parametreleri
+
+    Dönüş:
+    generator: Pencere başına sözlük; 'start', 'end', 'gantt' (GanttChart),
+        pencerede tamamlanan proseslerin 'pid', 'arrival_time', 'burst_time',
+        'priority', 'completion' ve 'response' (ilk CPU ataması) dizileri ve
+        devreden proses sayısı 'carried'
+    """
+    if algorithm not in WINDOWED_ALGORITHMS:
+        raise ValueError("Pencereli zamanlamada desteklenmeyen algoritma: {}".format(algorithm))
+    if window <= 0:
+        raise ValueError("Pencere süresi pozitif olmalı")
+    if params.get('context_switch') or params.get('cache_warmup'):
+        # Pencere sınırında son çalışan proses bilgisi devredilmediğinden
+        # ek yük dilimleri tek seferlik zamanlamayla aynı olmaz
+        raise ValueError("Pencereli zamanlama bağlam değiştirme ve önbellek ısınma "
+                         "maliyetlerini desteklemez")
+
+    buffer = _ArrivalBuffer(_normalized_chunks(_iter_source(source, chunk_size)))
+    round_robin = algorithm == 'round_robin'
+    # Devreden prosesler: özgün sütunlar, kalan süre, ilk atama ve son çalışma sonu
+    carried = None
+    running = None
+    start = None
+
+    while True:
+        if carried is None:
+            next_arrival = buffer.next_arrival()
+            if next_arrival is None:
+                return
+            start = next_arrival if start is None else max(start, next_arrival)
+        window_end = start + window
+        new = buffer.take_before(window_end)
+        final = buffer.next_arrival() is None
+
+        # Yeni proseslerin devredenlerle aynı biçimdeki durumları
+        count = len(new['pid'])
+        new = {'pid': new['pid'], 'arrival': new['arrival_time'], 'burst': new['burst_time'],
+               'priority': new['priority'], 'remaining': new['burst_time'],
+               'first_start': np.full(count, -1, dtype=np.int64),
+               'last_end': np.full(count, -1, dtype=np.int64)}
+
+        # Kesme anında hazır kuyrukta olan yeni varışlar, kesilen prosesten önce gelir
+        if round_robin and running is not None:
+            admitted = int(np.searchsorted(new['arrival'], start, side='right'))
+            parts = (carried, {key: value[:admitted] for key, value in new.items()},
+                     running, {key: value[admitted:] for key, value in new.items()})
+        else:
+            parts = tuple(part for part in (carried, new) if part is not None)
+        state = {key: np.concatenate([part[key] for part in parts]) for key in new}
+        size = len(state['pid'])
+
+        # Pencere zamanlayıcısı yerel indeksleri PID olarak kullanır
+        local = np.arange(size, dtype=np.int64)
+        scheduler = CPUScheduler.from_workload(Workload(
+            local, np.maximum(state['arrival'], start), state['remaining'], state['priority']))
+        scheduler.schedule(algorithm, **params)
+        gantt_pid, gantt_start, gantt_end = scheduler.gantt_chart.as_arrays()
+
+        cut = (int(gantt_end[-1]) if len(gantt_end) else start) if final else \
+            _cut_time(gantt_start, gantt_end, window_end, algorithm, params)
+        keep = gantt_start < cut
+        gantt_pid, gantt_start = gantt_pid[keep], gantt_start[keep]
+        gantt_end = np.minimum(gantt_end[keep], cut)
+
+        executed = np.bincount(gantt_pid, weights=gantt_end - gantt_start,
+                               minlength=size).astype(np.int64)
+        remaining = state['remaining'] - executed
+        ran, first_index = np.unique(gantt_pid, return_index=True)
+        first_start = state['first_start'].copy()
+        first_start[ran] = np.where(first_start[ran] == -1, gantt_start[first_index], first_start[ran])
+        last_end = state['last_end'].copy()
+        ran_last, last_index = np.unique(gantt_pid[::-1], return_index=True)
+        last_end[ran_last] = gantt_end[::-1][last_index]
+
+        done = remaining == 0
+        yield {
+            'start': start,
+            'end': cut,
+            'gantt': GanttChart.from_arrays(state['pid'][gantt_pid], gantt_start, gantt_end),
+            'pid': state['pid'][done],
+            'arrival_time': state['arrival'][done],
+            'burst_time': state['burst'][done],
+            'priority': state['priority'][done],
+            'completion': last_end[done],
+            'response': first_start[done],
+            'carried': int(size - done.sum()),
+        }
+
+        state.update(remaining=remaining, first_start=first_start, last_end=last_end)
+        unfinished = np.flatnonzero(~done)
+        running = None
+        if round_robin and len(unfinished):
+            # Hazır kuyruk sırası: kuyruğa giriş anı (varış veya son dilim sonu),
+            # aynı anda giren yeni varışlar kesilen prosesten önce
+            preempted = last_end[unfinished] != -1
+            enqueue = np.where(preempted, last_end[unfinished], state['arrival'][unfinished])
+            unfinished = unfinished[np.lexsort((unfinished, preempted, enqueue))]
+            if last_end[unfinished[-1]] == cut:
+                running = {key: value[unfinished[-1:]] for key, value in state.items()}
+                unfinished = unfinished[:-1]
+        carried = {key: value[unfinished] for key, value in state.items()}
+        if not len(unfinished) and running is None:
+            carried = None
+        elif running is not None and not len(unfinished):
+            carried = {key: value[:0] for key, value in state.items()}
+        start = cut
+
+
+def replay_trace(source, algorithm, window, chunk_size=65536, **params):
+    """
+    İzi pencereli kipte zamanlar ve toplam metrikleri döndürür
+
+    Zaman çizelgesi saklanmaz; metrikler pencere sonuçlarından toplamlar
+    olarak biriktirilir. Yüzdelikler gibi tüm değerleri gerektiren metrikler
+    hesaplanmaz; pencereli kip ek yük desteklemediğinden ek yük oranları da
+    yoktur.
+
+    Parametreler:
+    source (str veya iterable): İz dosyası ya da dizi sözlükleri üreteci
+    algorithm (str): WINDOWED_ALGORITHMS içindeki algoritma adı
+    window (int): Pencere süresi (birim zaman)
+    chunk_size (int): Parça başına satır sayısı
+    **params: Algoritma parametreleri
+
+    Dönüş:
+    dict: 'avg_waiting_time', 'avg_turnaround_time', 'avg_response_time',
+        'throughput' ve 'cpu_utilization' (calculate_all_metrics() ile aynı
+        tanımlar), 'process_count' ve 'windows'
+    """
+    count = windows = waiting = turnaround = response = busy_time = current_time = 0
+    for result in iter_trace_windows(source, algorithm, window, chunk_size, **params):
+        windows += 1
+        count += len(result['pid'])
+        turnaround += int((result['completion'] - result['arrival_time']).sum())
+        waiting += int((result['completion'] - result['arrival_time'] - result['burst_time']).sum())
+        response += int((result['response'] - result['arrival_time']).sum())
+        busy_time += result['gantt'].busy_time()
+        if len(result['gantt']):
+            current_time = result['gantt'].ends[-1]
+
+    return {
+        'avg_waiting_time': waiting / count if count else 0,
+        'avg_turnaround_time': turnaround / count if count else 0,
+        'avg_response_time': response / count if count else 0,
+        'throughput': count / current_time if current_time > 0 else 0,
+        'cpu_utilization': busy_time / current_time if current_time > 0 else 0,
+        'process_count': count,
+        'windows': windows,
+    }
@@ -0,0 +1,404 @@
+"""
+İş Yükleri
+Bu modül, zamanlama algoritmalarına verilen proses kümesini (iş yükünü) temsil eder.
+"""
+
+import hashlib
+from functools import cached_property
+
+import numpy as np
+
+
+def stable_argsort(values):
+    """
+    Tamsayı dizisi için kararlı argsort
+
+    Değer aralığı izin verdiğinde (değer * n + indeks) bileşik anahtarı
+    kararsız ama çok daha hızlı sıralamayla sıralanır; eşit değerlerde
+    indeks sırası yine korunur. Aksi halde NumPy'nin kararlı sıralaması
+    kullanılır.
+
+    Parametreler:
+    values (ndarray): int64 değerler
+
+    Dönüş:
+    ndarray: Sıralama indeksleri
+    """
+    values = np.asarray(values, dtype=np.int64)
+    n = len(values)
+    if n < 2 or not (values[1:] < values[:-1]).any():
+        # Zaten sıralı (gerçek izlerin çoğu)
+        return np.arange(n)
+    low = int(values.min())
+    span = int(values.max()) - low + 1
+    if span * n >= 2 ** 62:
+        return np.argsort(values, kind='stable')
+    keys = (values - low) * n + np.arange(n, dtype=np.int64)
+    keys.sort()
+    return keys % n
+
+
+def _inverse_permutation(order):
+    """Sıralama indekslerinden her elemanın sırasını (rank) hesaplar"""
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order), dtype=order.dtype)
+    return rank
+
+
+class Workload:
+    """
+    Birden çok algoritma tarafından paylaşılan, değişmez iş yükü
+
+    Varış, işlem süresi ve öncelik sıralamaları ilk kullanımda bir kez
+    hesaplanıp önbelleğe alınır; aynı Workload ile çalışan tüm algoritmalar
+    O(n log n) hazırlık maliyetini yalnızca bir kez öder. Eşit değerlerde
+    sıralar ekleme sırasını korur.
+    """
+
+    def __init__(self, pid, arrival_time, burst_time, priority=None):
+        """
+        Parametreler:
+        pid (array-like): Proses ID'leri
+        arrival_time (array-like): Varış zamanları
+        burst_time (array-like): İşlem süreleri
+        priority (array-like): Öncelikler (None: hepsi 0)
+        """
+        self.pid = np.array(pid, dtype=np.int64).ravel()
+        self.arrival = np.array(arrival_time, dtype=np.int64).ravel()
+        self.burst = np.array(burst_time, dtype=np.int64).ravel()
+        if priority is None:
+            self.priority = np.zeros(len(self.pid), dtype=np.int64)
+        else:
+            self.priority = np.array(priority, dtype=np.int64).ravel()
+
+        if not (len(self.pid) == len(self.arrival) == len(self.burst) == len(self.priority)):
+            raise ValueError("Sütun uzunlukları eşleşmiyor")
+
+        for column in (self.pid, self.arrival, self.burst, self.priority):
+            column.setflags(write=False)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        CPUScheduler.add_processes() biçimindeki dizilerden iş yükü oluşturur
+
+        Parametreler:
+        arrays (dict veya yapılandırılmış ndarray): 'arrival_time' ve
+            'burst_time' zorunlu, 'pid' ve 'priority' isteğe bağlı
+
+        Dönüş:
+        Workload: Yeni iş yükü
+        """
+        names = arrays.dtype.names if hasattr(arrays, 'dtype') else tuple(arrays.keys())
+        arrival = np.asarray(arrays['arrival_time'])
+        pid = arrays['pid'] if 'pid' in names else np.arange(1, len(arrival) + 1)
+        priority = arrays['priority'] if 'priority' in names else None
+        return cls(pid, arrival, arrays['burst_time'], priority)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getstate__(self):
+        # Python liste önbellekleri büyüktür ve dizilerden hızla yeniden üretilir;
+        # proses havuzlarına yalnızca diziler ve sıralamalar gönderilir
+        return {key: value for key, value in self.__dict__.items() if not key.endswith('_list')}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def as_arrays(self):
+        """
+        Dönüş:
+        dict: CPUScheduler.add_processes() ile yüklenebilecek diziler
+        """
+        return {'pid': self.pid, 'arrival_time': self.arrival,
+                'burst_time': self.burst, 'priority': self.priority}
+
+    def prepare(self):
+        """Tüm sıralamaları şimdi hesaplar (örneğin işçi proseslere göndermeden önce)"""
+        for name in ('arrival_order', 'burst_rank', 'priority_rank'):
+            getattr(self, name)
+        return self
+
+    @cached_property
+    def fingerprint(self):
+        """İş yükü içeriğinin SHA-256 özeti (önbellek anahtarları için)"""
+        digest = hashlib.sha256(str(len(self)).encode())
+        for column in (self.pid, self.arrival, self.burst, self.priority):
+            digest.update(np.ascontiguousarray(column).view(np.uint8))
+        return digest.hexdigest()
+
+    @cached_property
+    def arrival_sorted(self):
+        """Prosesler zaten varış zamanı sırasında mı (gerçek izlerin çoğu)"""
+        return not (self.arrival[1:] < self.arrival[:-1]).any()
+
+    @cached_property
+    def arrival_order(self):
+        """Varış zamanına göre kararlı sıralama indeksleri"""
+        return stable_argsort(self.arrival)
+
+    @cached_property
+    def burst_order(self):
+        """İşlem süresine göre kararlı sıralama indeksleri"""
+        return stable_argsort(self.burst)
+
+    @cached_property
+    def priority_order(self):
+        """Önceliğe göre kararlı sıralama indeksleri"""
+        return stable_argsort(self.priority)
+
+    @cached_property
+    def burst_rank(self):
+        """Her prosesin (işlem süresi, indeks) sırasındaki yeri"""
+        return _inverse_permutation(self.burst_order)
+
+    @cached_property
+    def priority_rank(self):
+        """Her prosesin (öncelik, indeks) sırasındaki yeri"""
+        return _inverse_permutation(self.priority_order)
+
+    @cached_property
+    def columns_list(self):
+        """Python döngüleri için (pid, arrival, burst, priority) listeleri"""
+        return (self.pid.tolist(), self.arrival.tolist(),
+                self.burst.tolist(), self.priority.tolist())
+
+    @cached_property
+    def arrival_order_list(self):
+        """arrival_order'ın Python listesi"""
+        return self.arrival_order.tolist()
+
+    @cached_property
+    def burst_order_list(self):
+        """burst_order'ın Python listesi"""
+        return self.burst_order.tolist()
+
+    @cached_property
+    def priority_order_list(self):
+        """priority_order'ın Python listesi"""
+        return self.priority_order.tolist()
+
+    @cached_property
+    def burst_rank_list(self):
+        """burst_rank'in Python listesi"""
+        return self.burst_rank.tolist()
+
+    @cached_property
+    def priority_rank_list(self):
+        """priority_rank'in Python listesi"""
+        return self.priority_rank.tolist()
+
+
+# --- Sentetik iş yükü üreteçleri ---
+#
+# Her dağılım (rng, n, **parametreler) alıp n uzunluğunda int64 dizi döndüren
+# vektörel bir fonksiyondur; satır başına Python nesnesi oluşturulmaz.
+
+
+def poisson_arrivals(rng, n, mean_interarrival=4.0):
+    """
+    Poisson süreci: varışlar arası süreler üsteldir
+
+    Parametreler:
+    rng (numpy.random.Generator): Rastgele sayı üreteci
+    n (int): Proses sayısı
+    mean_interarrival (float): Ortalama varışlar arası süre
+
+    Dönüş:
+    ndarray: Artan sıradaki varış zamanları (ilk varış 0)
+    """
+    gaps = rng.exponential(mean_interarrival, n)
+    gaps[:1] = 0
+    return np.floor(np.cumsum(gaps)).astype(np.int64)
+
+
+def bursty_arrivals(rng, n, mean_interarrival=4.0, burst_size=20, burst_ratio=0.1):
+    """
+    Patlamalı varışlar: kısa aralıklı varış grupları ve aralarında uzun boşluklar
+
+    Grup boyutları ortalaması burst_size olan geometrik dağılıma uyar; grup
+    içindeki aralıklar mean_interarrival * burst_ratio ortalamalı üsteldir.
+    Gruplar arası boşluk, uzun dönem ortalama aralık mean_interarrival
+    olacak şekilde seçilir.
+
+    Parametreler:
+    rng (numpy.random.Generator): Rastgele sayı üreteci
+    n (int): Proses sayısı
+    mean_interarrival (float): Uzun dönem ortalama varışlar arası süre
+    burst_size (float): Ortalama grup boyutu (>= 1)
+    burst_ratio (float): Grup içi aralığın ortalama aralığa oranı (0-1)
+
+    Dönüş:
+    ndarray: Artan sıradaki varış zamanları (ilk varış 0)
+    """
+    if burst_size < 1 or not 0 <= burst_ratio <= 1:
+        raise ValueError("burst_size >= 1 ve 0 <= burst_ratio <= 1 olmalı")
+    intra = mean_interarrival * burst_ratio
+    # Ortalama aralık = (1 - 1/b) * intra + (1/b) * idle = mean_interarrival
+    idle = burst_size * mean_interarrival - (burst_size - 1) * intra
+    starts_burst = rng.random(n) < 1.0 / burst_size
+    gaps = rng.exponential(1.0, n) * np.where(starts_burst, idle, intra)
+    gaps[:1] = 0
+    return np.floor(np.cumsum(gaps)).astype(np.int64)
+
+
+def _to_burst_times(values):
+    """Gerçel süreleri en az 1 olan tamsayı işlem sürelerine yuvarlar"""
+    return np.maximum(np.ceil(values), 1).astype(np.int64)
+
+
+def exponential_bursts(rng, n, mean_burst=8.0):
+    """
+    Üstel işlem süreleri
+
+    Parametreler:
+    rng (numpy.random.Generator): Rastgele sayı üreteci
+    n (int): Proses sayısı
+    mean_burst (float): Ortalama işlem süresi
+
+    Dönüş:
+    ndarray: İşlem süreleri (>= 1)
+    """
+    return _to_burst_times(rng.exponential(mean_burst, n))
+
+
+def pareto_bursts(rng, n, mean_burst=8.0, alpha=1.5, max_burst=None):
+    """
+    Pareto (ağır kuyruklu) işlem süreleri
+
+    Ölçek, dağılımın ortalaması mean_burst olacak şekilde seçilir; bu yüzden
+    alpha > 1 olmalıdır.
+
+    Parametreler:
+    rng (numpy.random.Generator): Rastgele sayı üreteci
+    n (int): Proses sayısı
+    mean_burst (float): Ortalama işlem süresi
+    alpha (float): Kuyruk indeksi (küçüldükçe kuyruk ağırlaşır)
+    max_burst (int): İşlem süresi üst sınırı (None: sınırsız)
+
+    Dönüş:
+    ndarray: İşlem süreleri (>= 1)
+    """
+    if alpha <= 1:
+        raise ValueError("Pareto alpha 1'den büyük olmalı")
+    scale = mean_burst * (alpha - 1) / alpha
+    bursts = _to_burst_times((rng.pareto(alpha, n) + 1) * scale)
+    if max_burst is not None:
+        np.minimum(bursts, max_burst, out=bursts)
+    return bursts
+
+
+def bimodal_bursts(rng, n, short_burst=3.0, long_burst=40.0, long_fraction=0.2):
+    """
+    İki tepeli işlem süreleri: etkileşimli kısa işler ve uzun toplu işler
+
+    Parametreler:
+    rng (numpy.random.Generator): Rastgele sayı üreteci
+    n (int): Proses sayısı
+    short_burst (float): Kısa işlerin ortalama süresi
+    long_burst (float): Uzun işlerin ortalama süresi
+    long_fraction (float): Uzun işlerin oranı (0-1)
+
+    Dönüş:
+    ndarray: İşlem süreleri (>= 1)
+    """
+    means = np.where(rng.random(n) < long_fraction, long_burst, short_burst)
+    return _to_burst_times(rng.exponential(1.0, n) * means)
+
+
+def uniform_priorities(rng, n, levels=10):
+    """
+    0 ile levels - 1 arasında düzgün dağılmış öncelikler
+
+    Parametreler:
+    rng (numpy.random.Generator): Rastgele sayı üreteci
+    n (int): Proses sayısı
+    levels (int): Öncelik düzeyi sayısı
+
+    Dönüş:
+    ndarray: Öncelikler (küçük değer yüksek öncelik)
+    """
+    return rng.integers(0, levels, n, dtype=np.int64)
+
+
+def skewed_priorities(rng, n, levels=10, p=0.5):
+    """
+    Geometrik dağılımlı öncelikler: proseslerin çoğu yüksek öncelikte
+
+    Parametreler:
+    rng (numpy.random.Generator): Rastgele sayı üreteci
+    n (int): Proses sayısı
+    levels (int): Öncelik düzeyi sayısı (üst düzeyler kırpılır)
+    p (float): Geometrik dağılım parametresi
+
+    Dönüş:
+    ndarray: Öncelikler (küçük değer yüksek öncelik)
+    """
+    return np.minimum(rng.geometric(p, n) - 1, levels - 1).astype(np.int64)
+
+
+def constant_priorities(rng, n, value=0):
+    """Tüm proseslere aynı önceliği verir"""
+    return np.full(n, value, dtype=np.int64)
+
+
+ARRIVAL_DISTRIBUTIONS = {
+    'poisson': poisson_arrivals,
+    'bursty': bursty_arrivals,
+}
+
+BURST_DISTRIBUTIONS = {
+    'exponential': exponential_bursts,
+    'pareto': pareto_bursts,
+    'bimodal': bimodal_bursts,
+}
+
+PRIORITY_DISTRIBUTIONS = {
+    'uniform': uniform_priorities,
+    'skewed': skewed_priorities,
+    'constant': constant_priorities,
+}
+
+
+def _distribution(table, name, kind):
+    try:
+        return table[name]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen {kind} dağılımı: {name} "
+                         f"(seçenekler: {', '.join(table)})") from None
+
+
+def generate_workload(n, arrival='poisson', burst='exponential', priority='uniform',
+                      seed=None, arrival_params=None, burst_params=None, priority_params=None):
+    """
+    Seçilen dağılımlardan vektörel olarak sentetik iş yükü üretir
+
+    Aynı tohum ve parametreler her zaman aynı iş yükünü verir. Sonuç
+    doğrudan CPUScheduler.from_workload() ile sütunlu zamanlayıcıya
+    yüklenebilir.
+
+    Parametreler:
+    n (int): Proses sayısı
+    arrival (str): Varış dağılımı (ARRIVAL_DISTRIBUTIONS anahtarı)
+    burst (str): İşlem süresi dağılımı (BURST_DISTRIBUTIONS anahtarı)
+    priority (str): Öncelik dağılımı (PRIORITY_DISTRIBUTIONS anahtarı)
+    seed (int): Rastgele tohum (None: her çağrıda farklı)
+    arrival_params (dict): Varış dağılımının parametreleri
+    burst_params (dict): İşlem süresi dağılımının parametreleri
+    priority_params (dict): Öncelik dağılımının parametreleri
+
+    Dönüş:
+    Workload: PID'leri 1..n olan iş yükü
+    """
+    if n < 0:
+        raise ValueError("Proses sayısı negatif olamaz")
+    arrival_fn = _distribution(ARRIVAL_DISTRIBUTIONS, arrival, "varış")
+    burst_fn = _distribution(BURST_DISTRIBUTIONS, burst, "işlem süresi")
+    priority_fn = _distribution(PRIORITY_DISTRIBUTIONS, priority, "öncelik")
+
+    rng = np.random.default_rng(seed)
+    return Workload(np.arange(1, n + 1, dtype=np.int64),
+                    arrival_fn(rng, n, **(arrival_params or {})),
+                    burst_fn(rng, n, **(burst_params or {})),
+                    priority_fn(rng, n, **(priority_params or {})))
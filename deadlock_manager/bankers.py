@@ -4,8 +4,8 @@ Bu modül, deadlock önleme için Banker's algoritmasını uygular.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+
+# matplotlib yalnızca çizim metodunda içe aktarılır; algoritma GUI olmadan da çalışır
 
 class BankersAlgorithm:
     """Banker's algoritmasını uygulayan sınıf"""
@@ -214,6 +214,8 @@ class BankersAlgorithm:
         Dönüş:
         Figure: matplotlib Figure nesnesi
         """
+        from matplotlib.figure import Figure
+
         # Proses ve kaynak sayıları
         n_processes = len(self.processes)
         n_resources = len(self.resources)
@@ -5,8 +5,8 @@ Bu modul, kaynak tahsis grafi kullanarak deadlock durumlarini algilar.
 """
 
 import networkx as nx
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
+
+# matplotlib yalnizca cizim metodunda ice aktarilir; algilama GUI olmadan da calisir
 
 class DeadlockDetector:
     """Kaynak tahsis grafi ile deadlock algilayan sinif"""
@@ -178,7 +178,8 @@ class DeadlockDetector:
         # Dongu bul
         try:
             cycle = nx.find_cycle(wait_for_graph, orientation='original')
-            return [node for node, _ in cycle]
+            # orientation verildiginde kenarlar (u, v, yon) uclusudur
+            return [edge[0] for edge in cycle]
         except nx.NetworkXNoCycle:
             return []
     
@@ -193,6 +194,9 @@ class DeadlockDetector:
         Donus:
         Figure: matplotlib Figure nesnesi
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.figure import Figure
+
         if not self.resource_allocation_graph:
             fig = Figure(figsize=(10, 1))
             ax = fig.add_subplot(111)
@@ -3,16 +3,127 @@ CPU Zamanlayici Sekmesi
 CPU zamanlama algoritmalarini gorselleştiren ve karsilastiran sekme.
 """
 
+import threading
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
                            QGroupBox, QSpinBox, QFormLayout, QTabWidget,
-                           QMessageBox, QHeaderView)
-from PyQt5.QtCore import Qt
+                           QMessageBox, QHeaderView, QCheckBox)
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QColor, QFont, QIcon
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 
 from cpu_scheduler.scheduler import CPUScheduler
 from cpu_scheduler.metrics import SchedulingMetrics
+from cpu_scheduler.comparison import comparison_suite, iter_comparison
+from cpu_scheduler.cache import ScheduleCache
+from cpu_scheduler.sweep import sweep_round_robin
+
+class ComparisonWorker(QThread):
+    """Algoritma karsilastirmasini arayuz is parcaciginin disinda calistiran is parcacigi"""
+    
+    result_ready = pyqtSignal(str, dict)
+    progress = pyqtSignal(int, int)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, arrays, suite, cache=None, parent=None):
+        """
+        Parametreler:
+        arrays (dict): Proses dizileri
+        suite (list): comparison_suite() biciminde algoritma listesi
+        cache (ScheduleCache): Sonuc onbellegi (istege bagli)
+        parent (QObject): Ust nesne
+        """
+        super().__init__(parent)
+        self.arrays = arrays
+        self.suite = suite
+        self.cache = cache
+        self.cancel_event = threading.Event()
+    
+    @property
+    def cancelled(self):
+        """Karsilastirma iptal edildi mi"""
+        return self.cancel_event.is_set()
+    
+    def cancel(self):
+        """Karsilastirmayi iptal eder; bekleyen algoritmalar calistirilmaz"""
+        self.cancel_event.set()
+    
+    def run(self):
+        """Algoritmalari proses havuzunda calistirir ve sonuclari sinyallerle iletir"""
+        total = len(self.suite)
+        try:
+            results = iter_comparison(self.arrays, self.suite, cancel_event=self.cancel_event,
+                                      cache=self.cache)
+            for done, (label, metrics) in enumerate(results, 1):
+                self.result_ready.emit(label, metrics)
+                self.progress.emit(done, total)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+# Metrikler sekmesinde gosterilen (anahtar, etiket) satirlari
+METRIC_ROWS = [
+    ('avg_waiting_time', "Ortalama Bekleme Suresi"),
+    ('avg_turnaround_time', "Ortalama Toplam Islem Suresi"),
+    ('avg_response_time', "Ortalama Cevap Suresi"),
+    ('p50_waiting_time', "Bekleme Suresi p50"),
+    ('p90_waiting_time', "Bekleme Suresi p90"),
+    ('p99_waiting_time', "Bekleme Suresi p99"),
+    ('max_waiting_time', "En Uzun Bekleme Suresi"),
+    ('p50_response_time', "Cevap Suresi p50"),
+    ('p90_response_time', "Cevap Suresi p90"),
+    ('p99_response_time', "Cevap Suresi p99"),
+    ('max_response_time', "En Uzun Cevap Suresi"),
+    ('avg_slowdown', "Ortalama Yavaslama"),
+    ('p99_slowdown', "Yavaslama p99"),
+    ('fairness_index', "Jain Adalet Indeksi"),
+    ('starved_count', "Ac Kalan Proses Sayisi"),
+    ('context_switches', "Baglam Degisimi Sayisi"),
+    ('throughput', "Uretilen Is (proses / birim zaman)"),
+    ('cpu_utilization', "CPU Kullanimi (ek yuk dahil)"),
+    ('effective_utilization', "Etkin CPU Kullanimi"),
+    ('overhead_ratio', "Ek Yuk Orani"),
+]
+
+class SweepWorker(QThread):
+    """Round Robin zaman dilimi taramasini arka planda calistiran is parcacigi"""
+    
+    result_ready = pyqtSignal(dict)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, arrays, quanta, overhead=None, parent=None):
+        """
+        Parametreler:
+        arrays (dict): Proses dizileri
+        quanta (iterable): Denenecek zaman dilimleri
+        overhead (dict): context_switch ve cache_warmup ek yuk sureleri
+        parent (QObject): Ust nesne
+        """
+        super().__init__(parent)
+        self.arrays = arrays
+        self.quanta = quanta
+        self.overhead = overhead or {}
+        self.cancel_event = threading.Event()
+    
+    @property
+    def cancelled(self):
+        """Tarama iptal edildi mi"""
+        return self.cancel_event.is_set()
+    
+    def cancel(self):
+        """Taramayi iptal eder"""
+        self.cancel_event.set()
+    
+    def run(self):
+        """Taramayi proses havuzunda calistirir ve sonucu sinyalle iletir"""
+        try:
+            result = sweep_round_robin(self.arrays, self.quanta, cancel_event=self.cancel_event,
+                                       **self.overhead)
+            if not self.cancelled:
+                self.result_ready.emit(result)
+        except Exception as e:
+            self.failed.emit(str(e))
 
 class CPUSchedulerTab(QWidget):
     """CPU zamanlayici sekmesi"""
@@ -28,6 +139,15 @@ class CPUSchedulerTab(QWidget):
         # Algoritma performans metrikleri
         self.algorithm_metrics = {}
         
+        # Zamanlama sonuc onbellegi (tablo icerigine gore anahtarlanir)
+        self.schedule_cache = ScheduleCache()
+        
+        # Arka plan karsilastirmasi ve zaman dilimi taramasi
+        self.sweep_worker = None
+        self.comparison_worker = None
+        self.comparison_labels = []
+        self.comparison_results = {}
+        
         # Renk paleti
         self.colors = {
             "primary": "#3498db",
@@ -169,7 +289,11 @@ class CPUSchedulerTab(QWidget):
             "Shortest Remaining Time First (SRTF)",
             "Round Robin (RR)", 
             "Priority (Non-preemptive)", 
-            "Priority (Preemptive)"
+            "Priority (Preemptive)",
+            "Multi-Level Feedback Queue (MLFQ)",
+            "Completely Fair Scheduler (CFS)",
+            "Lottery",
+            "Stride"
         ])
         self.algorithm_combo.setStyleSheet(
             "QComboBox {{ border: 1px solid #bdc3c7; padding: 5px; border-radius: 3px; background-color: white; }} QComboBox:focus {{ border: 1px solid {}; }} QComboBox::drop-down {{ subcontrol-origin: padding; subcontrol-position: top right; width: 20px; border-left: 1px solid #bdc3c7; }} QComboBox QAbstractItemView {{ border: 1px solid #bdc3c7; selection-background-color: {}; selection-color: white; }}".format(self.colors['primary'], self.colors['primary'])
@@ -191,6 +315,22 @@ class CPUSchedulerTab(QWidget):
         time_quantum_label.setStyleSheet("font-weight: bold; color: {};".format(self.colors['dark']))
         algorithm_layout.addRow(time_quantum_label, self.time_quantum_spin)
         
+        # Baglam degistirme ve onbellek isinma maliyetleri (tum algoritmalar)
+        self.context_switch_spin = QSpinBox()
+        self.context_switch_spin.setRange(0, 20)
+        self.context_switch_spin.setValue(0)
+        self.cache_warmup_spin = QSpinBox()
+        self.cache_warmup_spin.setRange(0, 20)
+        self.cache_warmup_spin.setValue(0)
+        for spin, text in ((self.context_switch_spin, "Baglam Degistirme Suresi:"),
+                           (self.cache_warmup_spin, "Onbellek Isinma Suresi:")):
+            spin.setStyleSheet(
+                "QSpinBox {{ border: 1px solid #bdc3c7; padding: 5px; border-radius: 3px; background-color: white; }} QSpinBox:focus {{ border: 1px solid {}; }}".format(self.colors['primary'])
+            )
+            label = QLabel(text)
+            label.setStyleSheet("font-weight: bold; color: {};".format(self.colors['dark']))
+            algorithm_layout.addRow(label, spin)
+        
         # Calistir butonu
         self.run_button = QPushButton("Algoritmayi Calistir")
         self.run_button.setStyleSheet(
@@ -215,6 +355,14 @@ class CPUSchedulerTab(QWidget):
         self.compare_button.clicked.connect(self.compare_algorithms)
         comparison_layout.addWidget(self.compare_button)
         
+        # Round Robin zaman dilimi taramasi butonu
+        self.sweep_button = QPushButton("Zaman Dilimi Taramasi (RR)")
+        self.sweep_button.setStyleSheet(
+            "QPushButton {{ background-color: {}; color: white; padding: 10px 20px; border-radius: 4px; font-weight: bold; border: none; font-size: 14px; }} QPushButton:hover {{ background-color: #2c3e50; }} QPushButton:pressed {{ background-color: #1a252f; }}".format(self.colors['dark'])
+        )
+        self.sweep_button.clicked.connect(self.sweep_time_quantum)
+        comparison_layout.addWidget(self.sweep_button)
+        
         comparison_group.setLayout(comparison_layout)
         
         # Orta panele algoritma ve karsilastirma gruplarini ekle
@@ -236,10 +384,20 @@ class CPUSchedulerTab(QWidget):
         gantt_title.setStyleSheet("color: {}; font-size: 16px; font-weight: bold; margin-bottom: 10px;".format(self.colors['dark']))
         gantt_layout.addWidget(gantt_title)
         
+        # Serit gorunumunde her proses ayri bir satirda cizilir
+        self.swimlane_check = QCheckBox("Serit gorunumu (proses basina bir satir)")
+        self.swimlane_check.toggled.connect(self.update_gantt_chart)
+        gantt_layout.addWidget(self.swimlane_check)
+        
         self.gantt_canvas = FigureCanvas(self.metrics.create_gantt_chart())
+        self.gantt_toolbar = NavigationToolbar(self.gantt_canvas, self)
+        gantt_layout.addWidget(self.gantt_toolbar)
         gantt_layout.addWidget(self.gantt_canvas)
+        self.gantt_layout = gantt_layout
         
-        gantt_info = QLabel("Gantt semasi, proseslerin CPU'da calisma zamanlarini gosterir. Her renk farkli bir prosesi temsil eder.")
+        gantt_info = QLabel("Gantt semasi, proseslerin CPU'da calisma zamanlarini gosterir. Her renk farkli bir prosesi temsil eder; "
+                            "gri CS ve W dilimleri baglam degistirme ve onbellek isinma ek yukudur. "
+                            "Yakinlastirip kaydirdiginizda yalnizca gorunen zaman araligi ve seritler yeniden cizilir.")
         gantt_info.setStyleSheet(
             "color: {}; font-style: italic; padding: 5px; background-color: #f8f9fa; border-radius: 3px; border-left: 3px solid {};".format(self.colors['dark'], self.colors['primary'])
         )
@@ -258,7 +416,7 @@ class CPUSchedulerTab(QWidget):
         metrics_layout.addWidget(metrics_title)
         
         # Metrik tablosu
-        self.metrics_table = QTableWidget(3, 2)
+        self.metrics_table = QTableWidget(len(METRIC_ROWS), 2)
         self.metrics_table.setHorizontalHeaderLabels(["Metrik", "Deger"])
         self.metrics_table.verticalHeader().setVisible(False)
         self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
@@ -268,8 +426,7 @@ class CPUSchedulerTab(QWidget):
         self.metrics_table.setAlternatingRowColors(True)
         
         # Metrik satirlarini ayarla
-        metrics = ["Ortalama Bekleme Suresi", "Ortalama Toplam Islem Suresi", "Ortalama Cevap Suresi"]
-        for i, metric in enumerate(metrics):
+        for i, (_, metric) in enumerate(METRIC_ROWS):
             self.metrics_table.setItem(i, 0, QTableWidgetItem(metric))
             self.metrics_table.setItem(i, 1, QTableWidgetItem("0.00"))
         
@@ -279,7 +436,11 @@ class CPUSchedulerTab(QWidget):
         <b>Metrik Aciklamalari:</b><br>
         <b>Ortalama Bekleme Suresi:</b> Proseslerin CPU'yu beklemek icin gecirdikleri ortalama sure.<br>
         <b>Ortalama Toplam Islem Suresi:</b> Proseslerin sistemde gecirdikleri toplam ortalama sure (bekleme + calisma).<br>
-        <b>Ortalama Cevap Suresi:</b> Proseslerin ilk kez CPU'ya atanana kadar gecen ortalama sure.
+        <b>Ortalama Cevap Suresi:</b> Proseslerin ilk kez CPU'ya atanana kadar gecen ortalama sure.<br>
+        <b>p50/p90/p99:</b> Proseslerin %50/%90/%99'unun asmadigi sure (kuyruk gecikmesi).<br>
+        <b>Yavaslama:</b> Toplam islem suresinin islem suresine orani.<br>
+        <b>Jain Adalet Indeksi:</b> 1'e yaklastikca prosesler CPU'dan daha esit pay alir.<br>
+        <b>Ac Kalan Proses:</b> Bekleme suresi ortalama islem suresinin 10 katini asan prosesler.
         """)
         metrics_info.setStyleSheet(
             "color: {}; padding: 5px; background-color: #f8f9fa; border-radius: 3px; border-left: 3px solid {};".format(self.colors['dark'], self.colors['secondary'])
@@ -314,10 +475,32 @@ class CPUSchedulerTab(QWidget):
         
         self.comparison_tab.setLayout(comparison_tab_layout)
         
+        # Zaman grafigi sekmesi
+        self.timeline_tab = QWidget()
+        timeline_layout = QVBoxLayout()
+        
+        timeline_title = QLabel("Kullanim ve Kuyruk Uzunlugu")
+        timeline_title.setAlignment(Qt.AlignCenter)
+        timeline_title.setStyleSheet("color: {}; font-size: 16px; font-weight: bold; margin-bottom: 10px;".format(self.colors['dark']))
+        timeline_layout.addWidget(timeline_title)
+        
+        self.timeline_canvas = FigureCanvas(self.metrics.create_timeline_chart())
+        timeline_layout.addWidget(self.timeline_canvas)
+        
+        timeline_info = QLabel("Zaman cizelgesi pencerelere bolunur; her pencere icin CPU kullanim orani ve ortalama hazir kuyruk uzunlugu gosterilir.")
+        timeline_info.setStyleSheet(
+            "color: {}; font-style: italic; padding: 5px; background-color: #f8f9fa; border-radius: 3px; border-left: 3px solid {};".format(self.colors['dark'], self.colors['primary'])
+        )
+        timeline_info.setWordWrap(True)
+        timeline_layout.addWidget(timeline_info)
+        
+        self.timeline_tab.setLayout(timeline_layout)
+        
         # Sekmeleri alt panele ekle
         bottom_panel.addTab(self.gantt_tab, "Gantt Semasi")
         bottom_panel.addTab(self.metrics_tab, "Metrikler")
         bottom_panel.addTab(self.comparison_tab, "Karsilastirma")
+        bottom_panel.addTab(self.timeline_tab, "Zaman Grafigi")
         
         # Ana duzene panelleri ekle
         main_layout.addLayout(top_panel)
@@ -334,8 +517,8 @@ class CPUSchedulerTab(QWidget):
         Parametreler:
         index (int): Combobox'taki secilen indeks
         """
-        # Round Robin (3. indeks) secildiyse etkinlestir
-        self.time_quantum_spin.setEnabled(index == 3)
+        # Round Robin, MLFQ, Lottery ve Stride zaman dilimi kullanir
+        self.time_quantum_spin.setEnabled(index in (3, 6, 8, 9))
     
     def add_process(self):
         """Yeni bir proses ekler"""
@@ -388,9 +571,34 @@ class CPUSchedulerTab(QWidget):
         
         # Basarili mesaji goster
         self.status_message("Proses {} eklendi".format(pid), "success")
-    
+
+    def update_gantt_chart(self):
+        """
+        Gantt semasini secili gorunumle yeniden olusturur
+
+        Yakinlastirma/kaydirma araclarinin yeni figure baglanmasi icin tuval
+        ve arac cubugu birlikte yenilenir.
+        """
+        figure = self.metrics.create_gantt_chart(swimlanes=self.swimlane_check.isChecked())
+        canvas = FigureCanvas(figure)
+        toolbar = NavigationToolbar(canvas, self)
+
+        self.gantt_layout.replaceWidget(self.gantt_toolbar, toolbar)
+        self.gantt_layout.replaceWidget(self.gantt_canvas, canvas)
+        self.gantt_toolbar.deleteLater()
+        self.gantt_canvas.deleteLater()
+        self.gantt_toolbar = toolbar
+        self.gantt_canvas = canvas
+        self.gantt_canvas.draw_idle()
+
     def clear_processes(self):
         """Tum prosesleri temizler"""
+        # Suren karsilastirmayi ve taramayi iptal et
+        if self.comparison_worker is not None and self.comparison_worker.isRunning():
+            self.comparison_worker.cancel()
+        if self.sweep_worker is not None and self.sweep_worker.isRunning():
+            self.sweep_worker.cancel()
+        
         # Tabloyu temizle
         self.processes_table.setRowCount(0)
         
@@ -399,12 +607,15 @@ class CPUSchedulerTab(QWidget):
         self.metrics = SchedulingMetrics(self.scheduler)
         
         # Metrik tablosunu sifirla
-        for i in range(3):
+        for i in range(len(METRIC_ROWS)):
             self.metrics_table.setItem(i, 1, QTableWidgetItem("0.00"))
         
         # Gantt semasini sifirla
-        self.gantt_canvas.figure = self.metrics.create_gantt_chart()
-        self.gantt_canvas.draw()
+        self.update_gantt_chart()
+        
+        # Zaman grafigini sifirla
+        self.timeline_canvas.figure = self.metrics.create_timeline_chart()
+        self.timeline_canvas.draw()
         
         # PID'yi sifirla
         self.pid_spin.setValue(1)
@@ -436,32 +647,46 @@ class CPUSchedulerTab(QWidget):
         algorithm_index = self.algorithm_combo.currentIndex()
         algorithm_name = self.algorithm_combo.currentText()
         
-        # Algoritma secimine gore zamanlayiciyi calistir
+        # Algoritma secimine gore zamanlayici parametrelerini belirle
         if algorithm_index == 0:  # FCFS
-            self.scheduler.schedule_fcfs()
+            algorithm, params = 'fcfs', {}
         elif algorithm_index == 1:  # SJF (Non-preemptive)
-            self.scheduler.schedule_sjf(preemptive=False)
+            algorithm, params = 'sjf', {'preemptive': False}
         elif algorithm_index == 2:  # SRTF (Preemptive SJF)
-            self.scheduler.schedule_sjf(preemptive=True)
+            algorithm, params = 'sjf', {'preemptive': True}
         elif algorithm_index == 3:  # Round Robin
-            time_quantum = self.time_quantum_spin.value()
-            self.scheduler.schedule_round_robin(time_quantum)
+            algorithm, params = 'round_robin', {'time_quantum': self.time_quantum_spin.value()}
         elif algorithm_index == 4:  # Priority (Non-preemptive)
-            self.scheduler.schedule_priority(preemptive=False)
+            algorithm, params = 'priority', {'preemptive': False}
         elif algorithm_index == 5:  # Priority (Preemptive)
-            self.scheduler.schedule_priority(preemptive=True)
+            algorithm, params = 'priority', {'preemptive': True}
+        elif algorithm_index == 6:  # MLFQ (zaman dilimi en ust seviyenin hakki)
+            algorithm, params = 'mlfq', {'time_quantum': self.time_quantum_spin.value()}
+        elif algorithm_index == 7:  # CFS (oncelik nice degeri olarak kullanilir)
+            algorithm, params = 'cfs', {}
+        elif algorithm_index == 8:  # Lottery (sabit tohum: tekrar calistirmada ayni sonuc)
+            algorithm, params = 'lottery', {'time_quantum': self.time_quantum_spin.value(), 'seed': 0}
+        else:  # Stride
+            algorithm, params = 'stride', {'time_quantum': self.time_quantum_spin.value()}
+        
+        params.update(self.overhead_params())
+        
+        # Ayni tablo ve parametrelerle tekrar calistirmada sonuc onbellekten gelir
+        self.schedule_cache.schedule(self.scheduler, algorithm, **params)
         
         # Metrikleri hesapla
         metrics_dict = self.metrics.calculate_all_metrics()
         
         # Metrik tablosunu guncelle
-        self.metrics_table.setItem(0, 1, QTableWidgetItem("{:.2f}".format(metrics_dict['avg_waiting_time'])))
-        self.metrics_table.setItem(1, 1, QTableWidgetItem("{:.2f}".format(metrics_dict['avg_turnaround_time'])))
-        self.metrics_table.setItem(2, 1, QTableWidgetItem("{:.2f}".format(metrics_dict['avg_response_time'])))
+        for i, (key, _) in enumerate(METRIC_ROWS):
+            self.metrics_table.setItem(i, 1, QTableWidgetItem("{:.2f}".format(metrics_dict[key])))
         
         # Gantt semasini guncelle
-        self.gantt_canvas.figure = self.metrics.create_gantt_chart()
-        self.gantt_canvas.draw()
+        self.update_gantt_chart()
+        
+        # Zaman grafigini guncelle
+        self.timeline_canvas.figure = self.metrics.create_timeline_chart()
+        self.timeline_canvas.draw()
         
         # Algoritma metriklerini kaydet (karsilastirma icin)
         self.algorithm_metrics[algorithm_name] = metrics_dict
@@ -470,8 +695,44 @@ class CPUSchedulerTab(QWidget):
 
 
     
+    def overhead_params(self):
+        """
+        Secili baglam degistirme ve onbellek isinma surelerini dondurur
+        
+        Sifir olan sureler eklenmez; boylece ek yuksuz sonuclarin onbellek
+        anahtarlari degismez.
+        
+        Donus:
+        dict: context_switch ve cache_warmup parametreleri
+        """
+        overhead = {'context_switch': self.context_switch_spin.value(),
+                    'cache_warmup': self.cache_warmup_spin.value()}
+        return {name: value for name, value in overhead.items() if value}
+    
+    def table_arrays(self):
+        """
+        Proses tablosunu tek seferde sutun listelerine donusturur
+        
+        Donus:
+        dict: CPUScheduler.add_processes() biciminde proses dizileri
+        """
+        arrays = {'pid': [], 'arrival_time': [], 'burst_time': [], 'priority': []}
+        for i in range(self.processes_table.rowCount()):
+            arrays['pid'].append(int(self.processes_table.item(i, 0).text()))
+            arrays['arrival_time'].append(int(self.processes_table.item(i, 1).text()))
+            arrays['burst_time'].append(int(self.processes_table.item(i, 2).text()))
+            arrays['priority'].append(int(self.processes_table.item(i, 3).text()))
+        return arrays
+    
     def compare_algorithms(self):
-        """Tum algoritmalari karsilastirir"""
+        """Tum algoritmalari arka planda, paralel olarak karsilastirir"""
+        # Karsilastirma suruyorsa buton iptal islevi gorur
+        if self.comparison_worker is not None and self.comparison_worker.isRunning():
+            self.comparison_worker.cancel()
+            self.compare_button.setEnabled(False)
+            self.status_message("Karsilastirma iptal ediliyor...", "warning")
+            return
+        
         # Prosesler var mi kontrol et
         if self.processes_table.rowCount() == 0:
             error_box = QMessageBox()
@@ -485,79 +746,56 @@ class CPUSchedulerTab(QWidget):
             error_box.exec_()
             return
         
-        # Mevcut prosesleri yedekle
-        original_processes = []
-        for i in range(self.processes_table.rowCount()):
-            pid = int(self.processes_table.item(i, 0).text())
-            arrival_time = int(self.processes_table.item(i, 1).text())
-            burst_time = int(self.processes_table.item(i, 2).text())
-            priority = int(self.processes_table.item(i, 3).text())
-            original_processes.append((pid, arrival_time, burst_time, priority))
+        # Tabloyu bir kez oku; is yuku iscilere tek seferde serilestirilir
+        suite = comparison_suite(self.time_quantum_spin.value(), **self.overhead_params())
+        self.comparison_labels = [label for label, _, _ in suite]
+        self.comparison_results = {}
         
-        # Tum algoritmalari calistir ve sonuclari topla
-        algorithm_metrics = {}
+        self.comparison_worker = ComparisonWorker(self.table_arrays(), suite, self.schedule_cache, self)
+        self.comparison_worker.result_ready.connect(self.on_comparison_result)
+        self.comparison_worker.progress.connect(self.on_comparison_progress)
+        self.comparison_worker.failed.connect(self.on_comparison_failed)
+        self.comparison_worker.finished.connect(self.on_comparison_finished)
         
-        # Kullaniciya islemi bildiren mesaj
+        self.compare_button.setText("Karsilastirmayi Iptal Et")
         self.status_message("Tum algoritma karsilastirmasi yapiliyor...", "info")
+        self.comparison_worker.start()
+    
+    def on_comparison_result(self, label, metrics):
+        """
+        Tamamlanan bir algoritmanin sonucunu karsilastirma grafigine ekler
         
-        # Algoritmalari calistir
-        # 1. FCFS
-        self.scheduler = CPUScheduler()
-        for pid, arrival_time, burst_time, priority in original_processes:
-            self.scheduler.add_process(pid, arrival_time, burst_time, priority)
-        self.scheduler.schedule_fcfs()
-        self.metrics = SchedulingMetrics(self.scheduler)
-        algorithm_metrics["FCFS"] = self.metrics.calculate_all_metrics()
-        
-        # 2. SJF (Non-preemptive)
-        self.scheduler = CPUScheduler()
-        for pid, arrival_time, burst_time, priority in original_processes:
-            self.scheduler.add_process(pid, arrival_time, burst_time, priority)
-        self.scheduler.schedule_sjf(preemptive=False)
-        self.metrics = SchedulingMetrics(self.scheduler)
-        algorithm_metrics["SJF"] = self.metrics.calculate_all_metrics()
-        
-        # 3. SRTF (Preemptive SJF)
-        self.scheduler = CPUScheduler()
-        for pid, arrival_time, burst_time, priority in original_processes:
-            self.scheduler.add_process(pid, arrival_time, burst_time, priority)
-        self.scheduler.schedule_sjf(preemptive=True)
-        self.metrics = SchedulingMetrics(self.scheduler)
-        algorithm_metrics["SRTF"] = self.metrics.calculate_all_metrics()
-        
-        # 4. Round Robin
-        self.scheduler = CPUScheduler()
-        for pid, arrival_time, burst_time, priority in original_processes:
-            self.scheduler.add_process(pid, arrival_time, burst_time, priority)
-        self.scheduler.schedule_round_robin(self.time_quantum_spin.value())
-        self.metrics = SchedulingMetrics(self.scheduler)
-        algorithm_metrics["RR"] = self.metrics.calculate_all_metrics()
-        
-        # 5. Priority (Non-preemptive)
-        self.scheduler = CPUScheduler()
-        for pid, arrival_time, burst_time, priority in original_processes:
-            self.scheduler.add_process(pid, arrival_time, burst_time, priority)
-        self.scheduler.schedule_priority(preemptive=False)
-        self.metrics = SchedulingMetrics(self.scheduler)
-        algorithm_metrics["Priority"] = self.metrics.calculate_all_metrics()
-        
-        # 6. Priority (Preemptive)
-        self.scheduler = CPUScheduler()
-        for pid, arrival_time, burst_time, priority in original_processes:
-            self.scheduler.add_process(pid, arrival_time, burst_time, priority)
-        self.scheduler.schedule_priority(preemptive=True)
-        self.metrics = SchedulingMetrics(self.scheduler)
-        algorithm_metrics["Priority-P"] = self.metrics.calculate_all_metrics()
+        Parametreler:
+        label (str): Algoritma etiketi
+        metrics (dict): Algoritmanin metrikleri
+        """
+        self.comparison_results[label] = metrics
         
-        # Karsilastirma grafigini guncelle
-        self.comparison_canvas.figure = self.metrics.create_metrics_comparison(algorithm_metrics)
+        # Grafikte algoritmalari her zaman ayni sirada goster
+        ordered = {name: self.comparison_results[name] for name in self.comparison_labels
+                   if name in self.comparison_results}
+        self.comparison_canvas.figure = self.metrics.create_metrics_comparison(ordered)
         self.comparison_canvas.draw()
-        
-        # Son zamanlayici durumunu koru
-        self.scheduler = CPUScheduler()
-        for pid, arrival_time, burst_time, priority in original_processes:
-            self.scheduler.add_process(pid, arrival_time, burst_time, priority)
-        self.metrics = SchedulingMetrics(self.scheduler)
+    
+    def on_comparison_progress(self, done, total):
+        """Karsilastirma ilerlemesini durum cubugunda gosterir"""
+        self.status_message("Karsilastirma: {}/{} algoritma tamamlandi".format(done, total), "info")
+    
+    def on_comparison_failed(self, message):
+        """Karsilastirma hatasini gosterir"""
+        self.status_message("Karsilastirma hatasi: {}".format(message), "error")
+    
+    def on_comparison_finished(self):
+        """Karsilastirma is parcacigi bittiginde arayuzu eski haline getirir"""
+        worker = self.comparison_worker
+        self.compare_button.setText("Tum Algoritmalari Karsilastir")
+        self.compare_button.setEnabled(True)
+        
+        if worker.cancelled:
+            self.status_message("Karsilastirma iptal edildi", "warning")
+            return
+        if len(self.comparison_results) < len(self.comparison_labels):
+            return
         
         # Karsilastirma sekmesine gec
         parent = self.parent()
@@ -567,6 +805,7 @@ class CPUSchedulerTab(QWidget):
                 parent_of_parent.setCurrentIndex(2)  # Ust sekme widget'i
         
         # Basarili mesaji goster
+        self.status_message("Tum algoritmalar karsilastirildi", "success")
         success_box = QMessageBox()
         success_box.setIcon(QMessageBox.Information)
         success_box.setWindowTitle("Basarili")
@@ -578,6 +817,60 @@ class CPUSchedulerTab(QWidget):
         )
         success_box.exec_()
     
+    def sweep_time_quantum(self):
+        """Round Robin'i tum zaman dilimi degerleri icin arka planda calistirir"""
+        # Tarama suruyorsa buton iptal islevi gorur
+        if self.sweep_worker is not None and self.sweep_worker.isRunning():
+            self.sweep_worker.cancel()
+            self.sweep_button.setEnabled(False)
+            self.status_message("Tarama iptal ediliyor...", "warning")
+            return
+        
+        # Prosesler var mi kontrol et
+        if self.processes_table.rowCount() == 0:
+            error_box = QMessageBox()
+            error_box.setIcon(QMessageBox.Warning)
+            error_box.setWindowTitle("Hata")
+            error_box.setText("Taranacak proses yok.")
+            error_box.setStandardButtons(QMessageBox.Ok)
+            error_box.setStyleSheet(
+                "QMessageBox {{ background-color: {}; border: 1px solid {}; border-radius: 5px; }} QPushButton {{ background-color: {}; color: white; padding: 5px 10px; border-radius: 3px; font-weight: bold; }} QPushButton:hover {{ background-color: #2980b9; }}".format(self.colors['light'], self.colors['accent'], self.colors['primary'])
+            )
+            error_box.exec_()
+            return
+        
+        # Zaman dilimi kutusunun tum araligini tara
+        quanta = range(self.time_quantum_spin.minimum(), self.time_quantum_spin.maximum() + 1)
+        self.sweep_worker = SweepWorker(self.table_arrays(), quanta, self.overhead_params(), self)
+        self.sweep_worker.result_ready.connect(self.on_sweep_result)
+        self.sweep_worker.failed.connect(self.on_comparison_failed)
+        self.sweep_worker.finished.connect(self.on_sweep_finished)
+        
+        self.sweep_button.setText("Taramayi Iptal Et")
+        self.status_message("Zaman dilimi taramasi yapiliyor...", "info")
+        self.sweep_worker.start()
+    
+    def on_sweep_result(self, sweep):
+        """
+        Tarama egrisini karsilastirma sekmesinde gosterir
+        
+        Parametreler:
+        sweep (dict): sweep_round_robin() ciktisi
+        """
+        self.comparison_canvas.figure = self.metrics.create_quantum_sweep_chart(sweep)
+        self.comparison_canvas.draw()
+        
+        # En dusuk ortalama bekleme suresini veren zaman dilimini bildir
+        best = int(sweep['quantum'][sweep['avg_waiting_time'].argmin()])
+        self.status_message("Tarama tamamlandi. En dusuk bekleme suresi: zaman dilimi {}".format(best), "success")
+    
+    def on_sweep_finished(self):
+        """Tarama is parcacigi bittiginde butonu eski haline getirir"""
+        self.sweep_button.setText("Zaman Dilimi Taramasi (RR)")
+        self.sweep_button.setEnabled(True)
+        if self.sweep_worker.cancelled:
+            self.status_message("Tarama iptal edildi", "warning")
+    
     def status_message(self, message, type="info"):
         """
         Durumu gunceller ve gecici bir mesaj gosterir
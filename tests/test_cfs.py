@@ -0,0 +1,82 @@
+"""
+CFS benzeri vruntime zamanlayıcı testleri
+"""
+
+import pytest
+
+from cpu_scheduler.scheduler import NICE_TO_WEIGHT, CPUScheduler
+from cpu_scheduler.workloads import generate_workload
+
+
+def cpu_time_in(chart, t0, t1):
+    """[t0, t1) aralığında pid başına CPU süresi"""
+    used = {}
+    for pid, start, end in chart:
+        overlap = min(end, t1) - max(start, t0)
+        if overlap > 0:
+            used[pid] = used.get(pid, 0) + overlap
+    return used
+
+
+@pytest.mark.parametrize('nices', [(0, 5), (-5, 0, 5), (0, 0, 0, 10)])
+def test_cpu_share_tracks_weight(nices):
+    scheduler = CPUScheduler()
+    for pid, nice in enumerate(nices, start=1):
+        scheduler.add_process(pid, 0, 100000, nice)
+    chart = scheduler.schedule_cfs()
+
+    window = 4000
+    used = cpu_time_in(chart, 0, window)
+    weights = [NICE_TO_WEIGHT[nice + 20] for nice in nices]
+    for pid, weight in enumerate(weights, start=1):
+        assert used[pid] / window == pytest.approx(weight / sum(weights), rel=0.1, abs=0.01)
+
+
+def test_two_way_share_over_first_period():
+    # nice 0 : nice 5 ağırlıkları 1024 : 335
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 1000, 0)
+    scheduler.add_process(2, 0, 1000, 5)
+    used = cpu_time_in(scheduler.schedule_cfs(), 0, 200)
+    assert used[1] + used[2] == 200
+    assert used[1] / used[2] == pytest.approx(1024 / 335, rel=0.05)
+
+
+@pytest.mark.parametrize('target_latency, min_granularity', [(20, 4), (12, 5), (6, 3)])
+def test_slices_respect_min_granularity(target_latency, min_granularity):
+    workload = generate_workload(200, seed=3, arrival_params={'mean_interarrival': 2},
+                                 priority_params={'levels': 10})
+    scheduler = CPUScheduler.from_workload(workload)
+    chart = scheduler.schedule_cfs(target_latency, min_granularity)
+
+    completion = dict(zip(workload.pid.tolist(), scheduler.table.completion.tolist()))
+    for pid, start, end in chart:
+        assert end - start >= min_granularity or end == completion[pid]
+
+
+def test_equal_weights_split_target_latency():
+    # İki proses: dönem 20, dilim 10; on proses: dönem 10 * 4 = 40, dilim 4
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 30)
+    scheduler.add_process(2, 0, 30)
+    assert list(scheduler.schedule_cfs(20, 4))[:3] == [(1, 0, 10), (2, 10, 20), (1, 20, 30)]
+
+    scheduler = CPUScheduler()
+    for pid in range(1, 11):
+        scheduler.add_process(pid, 0, 8)
+    chart = list(scheduler.schedule_cfs(20, 4))
+    assert all(end - start == 4 for _, start, end in chart)
+    assert [pid for pid, _, _ in chart[:10]] == list(range(1, 11))
+
+
+def test_new_arrival_does_not_starve_running_processes():
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 5000)
+    scheduler.add_process(2, 0, 5000)
+    scheduler.add_process(3, 1000, 5000)
+    chart = scheduler.schedule_cfs(20, 4)
+
+    # Yeni gelen min_vruntime'dan başlar: birikmiş bir "borç" ile CPU'yu tekeline almaz
+    used = cpu_time_in(chart, 1000, 1600)
+    assert all(used[pid] == pytest.approx(200, abs=20) for pid in (1, 2, 3))
+    assert max(end - start for pid, start, end in chart if pid == 3 and start < 2000) <= 20
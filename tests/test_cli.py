@@ -0,0 +1,61 @@
+"""
+Komut satiri arayuzu testleri
+"""
+
+import json
+
+import pytest
+
+import cli
+
+
+def write_scenario(tmp_path, **scenario):
+    path = tmp_path / 'scenario.json'
+    path.write_text(json.dumps(scenario), encoding='utf-8')
+    return str(path)
+
+
+PROCESSES = [{'pid': 1, 'arrival_time': 0, 'burst_time': 3},
+             {'pid': 2, 'arrival_time': 1, 'burst_time': 2}]
+
+
+def test_runs_scenario(tmp_path):
+    path = write_scenario(tmp_path, processes=PROCESSES, time_quantum=2)
+    assert cli.main([path, '-o', str(tmp_path / 'out')]) == 0
+
+
+def test_scenario_quantum_zero_fails(tmp_path, capsys):
+    path = write_scenario(tmp_path, processes=PROCESSES, time_quantum=0)
+    assert cli.main([path, '-o', str(tmp_path / 'out')]) == 1
+    assert 'HATA' in capsys.readouterr().err
+
+
+def test_option_quantum_zero_rejected(tmp_path):
+    path = write_scenario(tmp_path, processes=PROCESSES)
+    with pytest.raises(SystemExit):
+        cli.main([path, '-q', '0'])
+
+
+def test_smp_scenario_quantum_zero_fails(tmp_path):
+    path = write_scenario(tmp_path, type='smp', cores=2, processes=PROCESSES, time_quantum=0)
+    assert cli.main([path, '-o', str(tmp_path / 'out')]) == 1
+
+
+def test_rejects_non_positive_burst(tmp_path):
+    processes = PROCESSES + [{'pid': 3, 'arrival_time': 0, 'burst_time': 0}]
+    path = write_scenario(tmp_path, processes=processes)
+    assert cli.main([path, '-o', str(tmp_path / 'out')]) == 1
+
+
+def test_negative_jobs_rejected(tmp_path, capsys):
+    path = write_scenario(tmp_path, processes=PROCESSES)
+    with pytest.raises(SystemExit):
+        cli.main([path, '-j', '-3'])
+    assert 'negatif olamaz' in capsys.readouterr().err
+
+
+def test_jobs_zero_uses_core_count(tmp_path):
+    first = write_scenario(tmp_path, name='a', processes=PROCESSES)
+    second = tmp_path / 'second.json'
+    second.write_text(json.dumps({'name': 'b', 'processes': PROCESSES}), encoding='utf-8')
+    assert cli.main([first, str(second), '-j', '0', '-o', str(tmp_path / 'out')]) == 0
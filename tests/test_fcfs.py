@@ -0,0 +1,60 @@
+"""
+Kapalı form FCFS testleri
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from cpu_scheduler.gantt import GanttChart
+from cpu_scheduler.scheduler import CPUScheduler, fcfs_closed_form
+
+
+def reference_fcfs(processes):
+    """
+    Eski adım adım FCFS uygulaması
+
+    Dönüş:
+    tuple: (dilimler, pid -> tamamlanma, pid -> ilk atama)
+    """
+    slices = []
+    completion = {}
+    response = {}
+    current_time = 0
+    for pid, arrival, burst, _ in sorted(processes, key=lambda p: p[1]):
+        current_time = max(current_time, arrival)
+        response[pid] = current_time
+        slices.append((pid, current_time, current_time + burst))
+        current_time += burst
+        completion[pid] = current_time
+    return slices, completion, response
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+@pytest.mark.parametrize('sorted_arrivals', [False, True])
+def test_matches_reference(columnar, sorted_arrivals):
+    rng = random.Random(11)
+    for _ in range(40):
+        processes = [(pid, rng.randint(0, 40), rng.randint(1, 9), 0)
+                     for pid in range(1, rng.randint(1, 20) + 1)]
+        if sorted_arrivals:
+            processes.sort(key=lambda p: p[1])
+        scheduler = CPUScheduler(columnar=columnar)
+        for process in processes:
+            scheduler.add_process(*process)
+        chart = scheduler.schedule_fcfs()
+
+        slices, completion, response = reference_fcfs(processes)
+        assert list(chart) == list(GanttChart(slices))
+        snapshot = scheduler.snapshot()
+        assert snapshot['completion'].tolist() == [completion[p[0]] for p in processes]
+        assert snapshot['response'].tolist() == [response[p[0]] for p in processes]
+        assert scheduler.current_time == max(completion.values())
+
+
+def test_closed_form_handles_idle_gaps():
+    order, start, completion = fcfs_closed_form(np.array([5, 0, 20]), np.array([2, 3, 1]))
+    assert order.tolist() == [1, 0, 2]
+    assert start.tolist() == [0, 5, 20]
+    assert completion.tolist() == [3, 7, 21]
@@ -0,0 +1,39 @@
+"""
+Gantt şeması çizici testleri
+"""
+
+import numpy as np
+import pytest
+
+matplotlib = pytest.importorskip('matplotlib')
+matplotlib.use('Agg')
+
+from cpu_scheduler.gantt_view import GanttRenderer  # noqa: E402
+from cpu_scheduler.scheduler import CPUScheduler  # noqa: E402
+from cpu_scheduler.workloads import generate_workload  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def renderer():
+    import matplotlib.pyplot as plt
+
+    scheduler = CPUScheduler.from_workload(generate_workload(2000, seed=5))
+    scheduler.schedule('round_robin', time_quantum=2, context_switch=1)
+    figure, ax = plt.subplots()
+    renderer = GanttRenderer(ax, scheduler.gantt_chart.index(), swimlanes=True)
+    yield renderer
+    plt.close(figure)
+
+
+@pytest.mark.parametrize('lanes', [(-0.7, 3.2), (10.4, 40.6), (-1, 1500), (1990, 2100)])
+@pytest.mark.parametrize('fraction', [(0, 1), (0.3, 0.31), (0.5, 0.9)])
+def test_visible_rows_match_window_filter(renderer, lanes, fraction):
+    starts, ends = renderer.starts, renderer.ends
+    x0, x1 = starts[0] + (ends[-1] - starts[0]) * np.array(fraction)
+    renderer.ax.set_ylim(*lanes)
+
+    y0, y1 = lanes
+    margin = renderer.height / 2
+    expected = np.flatnonzero((ends > x0) & (starts < x1) & (renderer.lanes + margin >= y0)
+                              & (renderer.lanes - margin <= y1))
+    assert np.sort(renderer.visible_rows(x0, x1)).tolist() == expected.tolist()
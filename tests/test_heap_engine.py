@@ -0,0 +1,73 @@
+"""
+Heap tabanlı SJF/SRTF ve Priority motoru testleri
+Motorun, her adımda hazır listeyi yeniden sıralayan eski uygulamayla aynı
+zamanlamayı ürettiği doğrulanır.
+"""
+
+import random
+
+import pytest
+
+from cpu_scheduler.gantt import GanttChart
+from cpu_scheduler.scheduler import CPUScheduler
+
+
+def reference_schedule(processes, by_priority, preemptive):
+    """
+    Eski liste sıralamalı SJF / Priority uygulaması
+
+    Hazır prosesler kalan süreye (veya önceliğe) göre kararlı sıralanır;
+    eşitlikte ekleme sırası korunur. Kesintili modda seçilen proses bir
+    sonraki varışa kadar çalışır.
+
+    Dönüş:
+    tuple: (dilimler, pid -> tamamlanma, pid -> ilk atama)
+    """
+    remaining = [{'pid': pid, 'arrival': arrival, 'left': burst, 'priority': priority}
+                 for pid, arrival, burst, priority in processes]
+    key = (lambda p: p['priority']) if by_priority else (lambda p: p['left'])
+    slices = []
+    completion = {}
+    response = {}
+    current_time = 0
+    while remaining:
+        available = [p for p in remaining if p['arrival'] <= current_time]
+        if not available:
+            current_time = min(p['arrival'] for p in remaining)
+            continue
+        process = sorted(available, key=key)[0]
+        response.setdefault(process['pid'], current_time)
+        run_time = process['left']
+        if preemptive:
+            later = [p['arrival'] for p in remaining if p['arrival'] > current_time]
+            if later:
+                run_time = min(run_time, min(later) - current_time)
+        slices.append((process['pid'], current_time, current_time + run_time))
+        current_time += run_time
+        process['left'] -= run_time
+        if process['left'] == 0:
+            completion[process['pid']] = current_time
+            remaining.remove(process)
+    return slices, completion, response
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+@pytest.mark.parametrize('preemptive', [False, True])
+@pytest.mark.parametrize('algorithm', ['sjf', 'priority'])
+def test_matches_reference(algorithm, preemptive, columnar):
+    rng = random.Random(7)
+    for _ in range(40):
+        # Dar aralıklar eşit varış, süre ve öncelikleri sık üretir
+        processes = [(pid, rng.randint(0, 20), rng.randint(1, 8), rng.randint(0, 3))
+                     for pid in range(1, rng.randint(1, 15) + 1)]
+        scheduler = CPUScheduler(columnar=columnar)
+        for process in processes:
+            scheduler.add_process(*process)
+        chart = scheduler.schedule(algorithm, preemptive=preemptive)
+
+        slices, completion, response = reference_schedule(processes, algorithm == 'priority',
+                                                          preemptive)
+        assert list(chart) == list(GanttChart(slices))
+        snapshot = scheduler.snapshot()
+        assert snapshot['completion'].tolist() == [completion[p[0]] for p in processes]
+        assert snapshot['response'].tolist() == [response[p[0]] for p in processes]
@@ -0,0 +1,48 @@
+"""
+Zamanlama metrikleri testleri
+"""
+
+import math
+import warnings
+
+from cpu_scheduler.metrics import SchedulingMetrics
+from cpu_scheduler.scheduler import CPUScheduler
+
+
+def test_zero_burst_process_has_finite_metrics():
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 3)
+    scheduler.add_process(2, 0, 0)
+    scheduler.schedule_round_robin(2)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        metrics = SchedulingMetrics(scheduler).calculate_all_metrics()
+    assert all(math.isfinite(value) for value in metrics.values())
+    # Yalnızca işlem süresi olan proses yavaşlamaya katılır
+    assert metrics['avg_slowdown'] == 1
+    assert metrics['fairness_index'] == 1
+
+
+def test_slowdown_and_fairness():
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 4)
+    scheduler.add_process(2, 0, 4)
+    scheduler.schedule_fcfs()
+
+    metrics = SchedulingMetrics(scheduler).calculate_latency_metrics()
+    assert metrics['avg_slowdown'] == 1.5
+    assert metrics['max_slowdown'] == 2
+    assert math.isclose(metrics['fairness_index'], 0.9)
+
+
+def test_timelines_with_negative_arrival():
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, -5, 3)
+    scheduler.add_process(2, 0, 2)
+    scheduler.schedule('fcfs')
+
+    timelines = SchedulingMetrics(scheduler).calculate_timelines(window=1)
+    assert timelines['time'].tolist() == [0, 1, 2, 3, 4]
+    assert timelines['utilization'].tolist() == [1, 1, 1, 1, 1]
+    assert timelines['ready_queue'].tolist() == [1, 1, 1, 0, 0]
@@ -0,0 +1,41 @@
+"""
+Multi-Level Feedback Queue zamanlayıcı testleri
+"""
+
+import pytest
+
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.workloads import generate_workload
+
+
+@pytest.mark.parametrize('arrival', ['poisson', 'bursty'])
+@pytest.mark.parametrize('time_quantum', [1, 3, 8])
+def test_single_level_matches_round_robin(arrival, time_quantum):
+    workload = generate_workload(400, arrival, seed=time_quantum,
+                                 arrival_params={'mean_interarrival': 4})
+    reference = CPUScheduler.from_workload(workload)
+    reference.schedule('round_robin', time_quantum=time_quantum)
+
+    scheduler = CPUScheduler.from_workload(workload)
+    scheduler.schedule('mlfq', levels=1, time_quantum=time_quantum)
+    assert list(scheduler.gantt_chart) == list(reference.gantt_chart)
+    assert scheduler.table.completion.tolist() == reference.table.completion.tolist()
+
+
+@pytest.mark.parametrize('params', [{'boost_interval': 50}, {'aging_threshold': 30}])
+def test_runs_every_burst_to_completion(params):
+    workload = generate_workload(300, seed=4, arrival_params={'mean_interarrival': 3})
+    scheduler = CPUScheduler.from_workload(workload)
+    scheduler.schedule('mlfq', levels=4, **params)
+
+    used = {}
+    for pid, start, end in scheduler.gantt_chart:
+        used[pid] = used.get(pid, 0) + end - start
+    assert used == dict(zip(workload.pid.tolist(), workload.burst.tolist()))
+
+
+def test_rejects_zero_quantum():
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 3)
+    with pytest.raises(ValueError):
+        scheduler.schedule('mlfq', quanta=[2, 0])
@@ -0,0 +1,129 @@
+"""
+Bağlam değiştirme ve önbellek ısınma ek yükü testleri
+"""
+
+import pytest
+
+from cpu_scheduler.gantt import CACHE_WARMUP_PID, CONTEXT_SWITCH_PID
+from cpu_scheduler.metrics import SchedulingMetrics
+from cpu_scheduler.scheduler import ALGORITHMS, CPUScheduler, switch_overhead
+from cpu_scheduler.smp import SMPScheduler
+from cpu_scheduler.workloads import generate_workload
+
+CS, W = CONTEXT_SWITCH_PID, CACHE_WARMUP_PID
+
+
+def make_scheduler(processes):
+    scheduler = CPUScheduler()
+    for process in processes:
+        scheduler.add_process(*process)
+    return scheduler
+
+
+def test_switch_overhead():
+    assert switch_overhead(5) == ([], 5)
+    assert switch_overhead(5, 2, 3) == ([(CS, 5, 7)], 7)
+    assert switch_overhead(5, 2, 3, resumed=True) == ([(CS, 5, 7), (W, 7, 10)], 10)
+    assert switch_overhead(5, 0, 3, resumed=True) == ([(W, 5, 8)], 8)
+    with pytest.raises(ValueError):
+        switch_overhead(0, -1)
+
+
+def test_round_robin_by_hand():
+    # q=2, CS=1, W=1: 8 atama (3 ilk + 5 devam) -> 8 + 5 = 13 birim ek yük
+    scheduler = make_scheduler([(1, 0, 6), (2, 0, 4), (3, 0, 6)])
+    chart = scheduler.schedule_round_robin(2, context_switch=1, cache_warmup=1)
+    assert list(chart) == [
+        (CS, 0, 1), (1, 1, 3), (CS, 3, 4), (2, 4, 6), (CS, 6, 7), (3, 7, 9),
+        (CS, 9, 10), (W, 10, 11), (1, 11, 13), (CS, 13, 14), (W, 14, 15), (2, 15, 17),
+        (CS, 17, 18), (W, 18, 19), (3, 19, 21), (CS, 21, 22), (W, 22, 23), (1, 23, 25),
+        (CS, 25, 26), (W, 26, 27), (3, 27, 29),
+    ]
+    snapshot = scheduler.snapshot()
+    assert snapshot['completion'].tolist() == [25, 17, 29]
+    assert snapshot['response'].tolist() == [1, 4, 7]
+
+    metrics = SchedulingMetrics(scheduler).calculate_all_metrics()
+    assert chart.overhead_time() == 13
+    assert metrics['context_switches'] == 7
+    assert metrics['cpu_utilization'] == 1
+    assert metrics['overhead_ratio'] == pytest.approx(13 / 29)
+    assert metrics['effective_utilization'] == pytest.approx(16 / 29)
+
+
+def test_fcfs_by_hand():
+    # Kesinti olmadığından ısınma hiç ödenmez; boşluktan sonra da bağlam değişir
+    scheduler = make_scheduler([(1, 0, 3), (2, 1, 2), (3, 10, 1)])
+    chart = scheduler.schedule_fcfs(context_switch=2, cache_warmup=5)
+    assert list(chart) == [(CS, 0, 2), (1, 2, 5), (CS, 5, 7), (2, 7, 9), (CS, 10, 12), (3, 12, 13)]
+    snapshot = scheduler.snapshot()
+    assert snapshot['completion'].tolist() == [5, 9, 13]
+    assert snapshot['response'].tolist() == [2, 7, 12]
+
+    metrics = SchedulingMetrics(scheduler).calculate_all_metrics()
+    assert metrics['context_switches'] == 2
+    assert metrics['cpu_utilization'] == pytest.approx(12 / 13)
+    assert metrics['overhead_ratio'] == pytest.approx(6 / 13)
+    assert metrics['effective_utilization'] == pytest.approx(6 / 13)
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+def test_fcfs_closed_form_matches_heap_engine(columnar):
+    # Eşit öncelikte ve varış sırasıyla eklenmiş proseslerde kesintisiz
+    # Priority, FCFS ile aynı sırayı izler
+    workload = generate_workload(500, seed=2, arrival_params={'mean_interarrival': 6})
+    arrays = workload.as_arrays()
+    arrays['priority'] = arrays['priority'] * 0
+    for context_switch, cache_warmup in [(1, 0), (3, 2)]:
+        closed = CPUScheduler(columnar=columnar)
+        closed.add_processes(arrays)
+        closed.schedule_fcfs(context_switch, cache_warmup)
+        heap = CPUScheduler(columnar=columnar)
+        heap.add_processes(arrays)
+        heap.schedule_priority(False, context_switch, cache_warmup)
+
+        assert list(closed.gantt_chart) == list(heap.gantt_chart)
+        assert closed.snapshot()['completion'].tolist() == heap.snapshot()['completion'].tolist()
+        assert closed.snapshot()['response'].tolist() == heap.snapshot()['response'].tolist()
+
+
+@pytest.mark.parametrize('algorithm', ALGORITHMS)
+def test_overhead_keeps_process_time(algorithm):
+    workload = generate_workload(150, seed=4, arrival_params={'mean_interarrival': 3})
+    params = {'time_quantum': 3} if algorithm == 'round_robin' else {}
+    plain = CPUScheduler.from_workload(workload)
+    plain.schedule(algorithm, **params)
+    costly = CPUScheduler.from_workload(workload)
+    costly.schedule(algorithm, context_switch=2, cache_warmup=1, **params)
+
+    chart = costly.gantt_chart
+    pids, starts, ends = chart.as_arrays()
+    real = pids >= 0
+    assert int((ends - starts)[real].sum()) == int(workload.burst.sum())
+    assert chart.busy_time() - chart.overhead_time() == plain.gantt_chart.busy_time()
+    assert set(pids[~real].tolist()) <= {CS, W}
+    # Bağlam değişimini ısınma ya da proses, ısınmayı proses izler; aralarında boşluk olmaz
+    for (pid, _, end), (following, start, _) in zip(chart, chart[1:]):
+        if pid == CS:
+            assert following != CS and start == end
+        elif pid == W:
+            assert following >= 0 and start == end
+
+
+def test_streaming_metrics_ignore_overhead_slices():
+    scheduler = make_scheduler([(1, 0, 6), (2, 0, 4), (3, 0, 6)])
+    metrics = SchedulingMetrics(scheduler)
+    slices = list(metrics.track(scheduler.iter_schedule('round_robin', time_quantum=2,
+                                                        context_switch=1, cache_warmup=1)))
+    assert len(slices) == 21
+    assert metrics.calculate_all_metrics()['context_switches'] == 7
+    assert metrics.calculate_overhead_ratio() == pytest.approx(13 / 29)
+
+
+def test_single_core_smp_matches_round_robin_with_overhead():
+    workload = generate_workload(200, seed=6, arrival_params={'mean_interarrival': 4})
+    reference = CPUScheduler.from_workload(workload)
+    reference.schedule('round_robin', time_quantum=3, context_switch=1, cache_warmup=2)
+    smp = SMPScheduler(CPUScheduler.from_workload(workload), 1)
+    charts = smp.schedule(3, context_switch=1, cache_warmup=2)
+    assert list(charts[0]) == list(reference.gantt_chart)
@@ -0,0 +1,38 @@
+"""
+Piyango ve adım (stride) zamanlayıcı testleri
+"""
+
+import random
+
+import pytest
+
+from cpu_scheduler.scheduler import CPUScheduler
+
+
+def make_scheduler(processes):
+    scheduler = CPUScheduler()
+    for process in processes:
+        scheduler.add_process(*process)
+    return scheduler
+
+
+@pytest.mark.parametrize('algorithm, params', [('lottery', {'seed': 0}), ('stride', {})])
+def test_runs_every_burst_to_completion(algorithm, params):
+    rng = random.Random(1)
+    processes = [(pid, rng.randint(0, 20), rng.randint(1, 10), rng.randint(0, 5))
+                 for pid in range(1, 21)]
+    scheduler = make_scheduler(processes)
+    scheduler.schedule(algorithm, time_quantum=3, **params)
+
+    used = {}
+    for pid, start, end in scheduler.gantt_chart:
+        used[pid] = used.get(pid, 0) + end - start
+    assert used == {pid: burst for pid, _, burst, _ in processes}
+
+
+@pytest.mark.parametrize('algorithm', ['lottery', 'stride'])
+@pytest.mark.parametrize('time_quantum', [0, -1])
+def test_rejects_quantum_below_one(algorithm, time_quantum):
+    scheduler = make_scheduler([(1, 0, 3, 1), (2, 0, 2, 2)])
+    with pytest.raises(ValueError):
+        scheduler.schedule(algorithm, time_quantum=time_quantum)
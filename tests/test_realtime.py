@@ -0,0 +1,104 @@
+"""
+Gerçek zamanlı (EDF / RMS) zamanlayıcı testleri
+"""
+
+import itertools
+import math
+
+import pytest
+
+from cpu_scheduler.realtime import (MAX_HORIZON, PeriodicTask, RealTimeScheduler, hyperperiod,
+                                    response_time_analysis, schedulability_test)
+
+
+def make_tasks(specs):
+    return [PeriodicTask(i + 1, period, wcet) for i, (period, wcet) in enumerate(specs)]
+
+
+def test_response_time_analysis_by_hand():
+    # R3: 8 -> 11 -> 14 -> 15 -> 15; U = 0.9, üç görev için sınır ≈ 0.78
+    tasks = make_tasks([(4, 1), (5, 2), (20, 5)])
+    assert response_time_analysis(tasks) == [1, 3, 15]
+
+    result = schedulability_test(tasks, 'rms')
+    assert result['schedulable']
+    assert not result['within_bound']
+    assert result['test'] == 'response_time_analysis'
+
+    # Eşzamanlı başlangıç kritik andır: simülasyondaki en kötü cevaplar RTA'ya eşittir
+    scheduler = RealTimeScheduler(tasks)
+    scheduler.schedule('rms')
+    metrics = scheduler.calculate_metrics()
+    assert [task['max_response'] for task in metrics['tasks']] == [1, 3, 15]
+    assert metrics['deadline_misses'] == 0
+
+
+def test_edf_schedule_by_hand():
+    # U = 1: t=4'te B'nin son tarihi (6) A'nınkinden (8) erkendir; t=8'deki
+    # eşitlikte önce serbest bırakılan B sürer
+    scheduler = RealTimeScheduler(make_tasks([(4, 2), (6, 3)]))
+    chart = scheduler.schedule('edf')
+    assert list(chart) == [(1, 0, 2), (2, 2, 5), (1, 5, 7), (2, 7, 10), (1, 10, 12)]
+    metrics = scheduler.calculate_metrics()
+    assert metrics['jobs'] == 5
+    assert metrics['deadline_misses'] == 0
+    assert metrics['cpu_utilization'] == 1
+
+
+@pytest.mark.parametrize('specs, algorithm, schedulable', [
+    ([(4, 2), (6, 3)], 'edf', True),
+    ([(4, 2), (6, 3)], 'rms', False),
+    ([(4, 1), (5, 2), (20, 5)], 'rms', True),
+    ([(2, 1), (3, 2)], 'edf', False),
+    ([(2, 1), (3, 2)], 'rms', False),
+])
+def test_deadline_misses_match_schedulability_test(specs, algorithm, schedulable):
+    tasks = make_tasks(specs)
+    scheduler = RealTimeScheduler(tasks)
+    scheduler.schedule(algorithm, horizon=10 * hyperperiod(tasks))
+    metrics = scheduler.calculate_metrics()
+    assert metrics['schedulability']['schedulable'] == schedulable
+    assert (metrics['deadline_misses'] == 0) == schedulable
+
+
+def test_coprime_periods_are_capped_and_expanded_lazily():
+    tasks = make_tasks([(1009, 100), (1013, 100), (1019, 100), (1021, 100)])
+    assert hyperperiod(tasks) > MAX_HORIZON
+
+    scheduler = RealTimeScheduler(tasks)
+    assert scheduler.default_horizon() == MAX_HORIZON
+    scheduler.schedule('edf')
+    assert scheduler.task_jobs == [math.ceil(MAX_HORIZON / task.period) for task in tasks]
+
+    # Ufuk çok uzak olsa da işler önceden üretilmez; ilk dilimler hemen gelir
+    slices = list(itertools.islice(scheduler.iter_schedule('edf', horizon=10 ** 15), 8))
+    assert slices[:4] == [(1, 0, 100), (2, 100, 200), (3, 200, 300), (4, 300, 400)]
+    assert sum(scheduler.task_jobs) < 20
+
+
+def test_sporadic_releases_are_seeded():
+    def run(seed):
+        scheduler = RealTimeScheduler()
+        scheduler.add_task(1, 10, 2, sporadic=True, max_delay=5)
+        scheduler.add_task(2, 15, 4, sporadic=True, max_delay=10)
+        chart = scheduler.schedule('edf', horizon=3000, seed=seed)
+        return list(chart), scheduler.task_jobs
+
+    chart, jobs = run(7)
+    assert (chart, jobs) == run(7)
+    assert chart != run(8)[0]
+    # Varışlar arası süre en az periyot, en çok periyot + max_delay
+    assert 3000 // 15 <= jobs[0] <= 3000 // 10
+    assert 3000 // 25 <= jobs[1] <= 3000 // 15
+
+
+def test_empty_task_set():
+    scheduler = RealTimeScheduler()
+    assert scheduler.default_horizon() == 0
+    assert list(scheduler.schedule('edf')) == []
+    metrics = scheduler.calculate_metrics()
+    assert metrics['jobs'] == metrics['deadline_misses'] == 0
+    assert metrics['miss_ratio'] == metrics['max_lateness'] == metrics['cpu_utilization'] == 0
+    assert metrics['hyperperiod'] == 0
+    assert metrics['tasks'] == []
+    assert metrics['schedulability']['schedulable']
@@ -0,0 +1,81 @@
+"""
+Round Robin motoru testleri
+Deque ve varış imleciyle yeniden yazılan motorun, eski liste taramalı
+uygulamayla aynı zamanlamayı ürettiği doğrulanır.
+"""
+
+import random
+
+import pytest
+
+from cpu_scheduler.gantt import GanttChart
+from cpu_scheduler.scheduler import CPUScheduler
+
+
+def reference_round_robin(processes, time_quantum):
+    """
+    Eski liste taramalı Round Robin uygulaması
+
+    Dönüş:
+    tuple: (dilimler, pid -> tamamlanma, pid -> ilk atama)
+    """
+    remaining = [list(process) for process in processes]
+    queue = []
+    slices = []
+    completion = {}
+    response = {}
+    current_time = 0
+
+    def admit():
+        for process in [p for p in remaining if p[1] <= current_time]:
+            queue.append(process)
+            remaining.remove(process)
+
+    while remaining or queue:
+        admit()
+        if not queue:
+            current_time = min(p[1] for p in remaining)
+            continue
+        process = queue.pop(0)
+        response.setdefault(process[0], current_time)
+        run_time = min(time_quantum, process[2])
+        slices.append((process[0], current_time, current_time + run_time))
+        current_time += run_time
+        process[2] -= run_time
+        admit()
+        if process[2] > 0:
+            queue.append(process)
+        else:
+            completion[process[0]] = current_time
+    return slices, completion, response
+
+
+def random_processes(rng, count):
+    return [(pid, rng.randint(0, 30), rng.randint(1, 12), rng.randint(0, 5))
+            for pid in range(1, count + 1)]
+
+
+@pytest.mark.parametrize('columnar', [False, True])
+@pytest.mark.parametrize('time_quantum', [1, 3, 7])
+def test_matches_reference(columnar, time_quantum):
+    rng = random.Random(time_quantum)
+    for _ in range(30):
+        processes = random_processes(rng, rng.randint(1, 15))
+        scheduler = CPUScheduler(columnar=columnar)
+        for process in processes:
+            scheduler.add_process(*process)
+        chart = scheduler.schedule_round_robin(time_quantum)
+
+        slices, completion, response = reference_round_robin(processes, time_quantum)
+        assert list(chart) == list(GanttChart(slices))
+        snapshot = scheduler.snapshot()
+        assert snapshot['completion'].tolist() == [completion[p[0]] for p in processes]
+        assert snapshot['response'].tolist() == [response[p[0]] for p in processes]
+
+
+@pytest.mark.parametrize('time_quantum', [0, -2])
+def test_rejects_quantum_below_one(time_quantum):
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 3)
+    with pytest.raises(ValueError):
+        scheduler.schedule_round_robin(time_quantum)
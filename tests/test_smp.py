@@ -0,0 +1,36 @@
+"""
+Çok çekirdekli (SMP) zamanlayıcı testleri
+"""
+
+import pytest
+
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.smp import SMP_POLICIES, SMPScheduler
+from cpu_scheduler.workloads import generate_workload
+
+
+@pytest.mark.parametrize('policy', SMP_POLICIES)
+@pytest.mark.parametrize('time_quantum', [None, 1, 3])
+def test_single_core_matches_uniprocessor(policy, time_quantum):
+    # generate_workload prosesleri varış sırasıyla üretir
+    workload = generate_workload(300, seed=time_quantum or 0,
+                                 arrival_params={'mean_interarrival': 5})
+    reference = CPUScheduler.from_workload(workload)
+    if time_quantum is None:
+        reference.schedule('fcfs')
+    else:
+        reference.schedule('round_robin', time_quantum=time_quantum)
+
+    scheduler = CPUScheduler.from_workload(workload)
+    smp = SMPScheduler(scheduler, 1, policy)
+    charts = smp.schedule(time_quantum)
+    assert list(charts[0]) == list(reference.gantt_chart)
+    assert scheduler.table.completion.tolist() == reference.table.completion.tolist()
+
+
+@pytest.mark.parametrize('time_quantum', [0, -3])
+def test_rejects_quantum_below_one(time_quantum):
+    scheduler = CPUScheduler()
+    scheduler.add_process(1, 0, 4)
+    with pytest.raises(ValueError):
+        SMPScheduler(scheduler, 2).schedule(time_quantum)
@@ -0,0 +1,75 @@
+"""
+İz okuma ve pencereli yeniden oynatma testleri
+"""
+
+import numpy as np
+import pytest
+
+from cpu_scheduler.gantt import GanttChart
+from cpu_scheduler.metrics import SchedulingMetrics
+from cpu_scheduler.scheduler import CPUScheduler
+from cpu_scheduler.traces import iter_trace_windows, replay_trace
+from cpu_scheduler.workloads import generate_workload
+
+VARIANTS = [
+    ('fcfs', {}),
+    ('sjf', {'preemptive': False}),
+    ('sjf', {'preemptive': True}),
+    ('round_robin', {'time_quantum': 3}),
+    ('priority', {'preemptive': False}),
+    ('priority', {'preemptive': True}),
+]
+
+
+def chunked(workload, size):
+    arrays = workload.as_arrays()
+    return [{key: values[i:i + size] for key, values in arrays.items()}
+            for i in range(0, len(workload), size)]
+
+
+@pytest.mark.parametrize('algorithm, params', VARIANTS)
+@pytest.mark.parametrize('window', [1, 13, 400])
+def test_windowed_replay_matches_whole_trace(algorithm, params, window):
+    for seed in range(6):
+        workload = generate_workload(60, ['poisson', 'bursty'][seed % 2],
+                                     ['exponential', 'pareto', 'bimodal'][seed % 3],
+                                     seed=seed, priority_params={'levels': 3})
+        scheduler = CPUScheduler.from_workload(workload)
+        scheduler.schedule(algorithm, **params)
+        expected = SchedulingMetrics(scheduler).calculate_all_metrics()
+
+        slices = []
+        for result in iter_trace_windows(iter(chunked(workload, 7)), algorithm, window, **params):
+            slices.extend(result['gantt'])
+        assert list(GanttChart(slices)) == list(scheduler.gantt_chart)
+
+        metrics = replay_trace(iter(chunked(workload, 7)), algorithm, window, **params)
+        assert set(metrics) == {'avg_waiting_time', 'avg_turnaround_time', 'avg_response_time',
+                                'throughput', 'cpu_utilization', 'process_count', 'windows'}
+        assert metrics['process_count'] == len(workload)
+        for name, value in metrics.items():
+            if name in expected:
+                assert value == pytest.approx(expected[name]), name
+
+
+def test_replays_csv_file(tmp_path):
+    workload = generate_workload(200, seed=3)
+    arrays = workload.as_arrays()
+    path = tmp_path / 'trace.csv'
+    np.savetxt(path, np.column_stack([arrays[key] for key in
+                                      ('pid', 'arrival_time', 'burst_time', 'priority')]),
+               fmt='%d', delimiter=',', header='pid,arrival_time,burst_time,priority',
+               comments='')
+
+    scheduler = CPUScheduler.from_workload(workload)
+    scheduler.schedule('round_robin', time_quantum=4)
+    expected = SchedulingMetrics(scheduler).calculate_all_metrics()
+    metrics = replay_trace(str(path), 'round_robin', 50, chunk_size=32, time_quantum=4)
+    assert metrics['avg_waiting_time'] == pytest.approx(expected['avg_waiting_time'])
+    assert metrics['avg_response_time'] == pytest.approx(expected['avg_response_time'])
+
+
+def test_rejects_non_positive_burst():
+    chunk = {'arrival_time': np.array([0, 1]), 'burst_time': np.array([3, 0])}
+    with pytest.raises(ValueError):
+        replay_trace(iter([chunk]), 'fcfs', 10)